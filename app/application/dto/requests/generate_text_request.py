@@ -11,6 +11,7 @@ class GenerateTextRequest(BaseModel):
     temperature: float = Field(default=1.0, ge=0.0, le=2.0)
     reference_data: Optional[Dict[str, str]] = None
     stop_sequences: Optional[List[str]] = None
+    seed: Optional[int] = None
 
     @validator('system_prompt', 'user_prompt')
     def validate_prompts(cls, v):
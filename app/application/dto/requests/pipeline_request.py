@@ -0,0 +1,47 @@
+# application/dto/requests/pipeline_request.py
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, validator
+from application.interfaces.pipeline_orchestrator import PipelineStageType
+from application.dto.requests.parse_request import ParseRuleRequest
+from application.dto.requests.verify_text_request import VerificationMethodRequest
+
+class PipelineStageRequest(BaseModel):
+    stage_type: PipelineStageType
+    parameters: Dict[str, Any] = Field(default_factory=dict)
+    timeout_seconds: Optional[float] = Field(default=None, gt=0)
+    retry_count: Optional[int] = Field(default=None, ge=0)
+
+    @validator('parameters')
+    def validate_parameters(cls, v, values):
+        # Parse rules and verification methods are validated like their own endpoints
+        if 'rules' in v:
+            v['rules'] = [ParseRuleRequest.parse_obj(rule) for rule in v['rules']]
+        if 'methods' in v:
+            v['methods'] = [VerificationMethodRequest.parse_obj(method) for method in v['methods']]
+        return v
+
+class PipelineConfigRequest(BaseModel):
+    stages: List[PipelineStageRequest] = Field(..., min_items=1)
+    max_total_time: Optional[float] = Field(default=None, gt=0)
+    error_handling_strategy: str = "fail_fast"
+    metadata: Optional[Dict[str, Any]] = None
+
+class PipelineRequest(BaseModel):
+    config: PipelineConfigRequest
+    initial_input: Any
+    context: Optional[Dict[str, Any]] = None
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "config": {
+                    "stages": [
+                        {
+                            "stage_type": "generate",
+                            "parameters": {"system_prompt": "You are a helpful assistant.", "max_tokens": 50}
+                        }
+                    ]
+                },
+                "initial_input": ["Sample input text"]
+            }
+        }
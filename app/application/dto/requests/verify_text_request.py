@@ -1,8 +1,10 @@
 # application/dto/requests/verify_text_request.py
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from pydantic import BaseModel, Field, validator
-from domain.model.entities.verification import VerificationMethodType, VerificationMode
+from domain.model.entities.verification import (
+    VerificationMethodType, VerificationMode, SimilarityAggregation, ConsensusMode
+)
 
 class VerificationMethodRequest(BaseModel):
     name: str = Field(..., min_length=1)
@@ -10,14 +12,28 @@ class VerificationMethodRequest(BaseModel):
     mode: VerificationMode
     thresholds: Optional[Dict[str, float]] = None
     reference_text: Optional[str] = None
+    pattern: Optional[str] = None
     required_matches: Optional[int] = None
+    reference_texts: Optional[List[str]] = None
+    aggregation: SimilarityAggregation = SimilarityAggregation.MAX
+    top_k: Optional[int] = Field(default=None, ge=1)
+    consensus_mode: ConsensusMode = ConsensusMode.SAMPLING
+    max_samples: Optional[int] = Field(default=None, ge=1)
+    samples_per_round: Optional[int] = Field(default=None, ge=1)
+    stopping_confidence: Optional[float] = Field(default=None, gt=0.5, lt=1.0)
+
+    @validator('top_k', always=True)
+    def validate_top_k(cls, v, values):
+        if values.get('aggregation') == SimilarityAggregation.TOP_K_MEAN and v is None:
+            raise ValueError("top_k is required for top_k_mean aggregation")
+        return v
 
 class VerifyTextRequest(BaseModel):
     text: str = Field(..., min_length=1)
     methods: List[VerificationMethodRequest] = Field(..., min_items=1)
     required_for_confirmed: int = Field(..., gt=0)
     required_for_review: int = Field(..., ge=0)
-    context: Optional[Dict[str, any]] = None
+    context: Optional[Dict[str, Any]] = None
 
     @validator('required_for_confirmed')
     def validate_required_counts(cls, v, values):
@@ -1,5 +1,5 @@
 # application/dto/responses/generate_text_response.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 from domain.model.entities.generation import GeneratedResult
@@ -9,6 +9,12 @@ class GenerationMetadataResponse(BaseModel):
     tokens_used: int
     generation_time: float
     timestamp: datetime
+    token_budget: Optional[int] = None
+    stop_reason: Optional[str] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    time_to_first_token: Optional[float] = None
+    inter_token_latency: Optional[float] = None
 
 class GeneratedTextResponse(BaseModel):
     content: str
@@ -39,28 +39,27 @@ class RunBenchmarkUseCase:
         start_time = datetime.now()
         execution_id = f"bench_{start_time.strftime('%Y%m%d_%H%M%S')}"
         
-        verification_results = []
         successful_entries = 0
         failed_entries = 0
 
-        for entry in request.entries:
-            try:
-                verification_summary = self.verifier_service.verify_text(
-                    text=entry.input_text,
-                    methods=request.configuration.verification_methods,
-                    required_for_confirmed=request.configuration.required_success_rate,
-                    required_for_review=request.configuration.max_verification_time
-                )
-                
-                if verification_summary.final_status == entry.expected_status:
-                    successful_entries += 1
-                else:
-                    failed_entries += 1
-                
-                verification_results.append(verification_summary)
-                
-            except Exception as e:
-                raise e
+        # Reference embeddings are computed once for the whole run
+        prepared_methods = self.verifier_service.prepare_methods(
+            request.configuration.verification_methods
+        )
+
+        # Each method runs once over every entry still in play
+        verification_results = self.verifier_service.verify_batch(
+            texts=[entry.input_text for entry in request.entries],
+            methods=prepared_methods,
+            required_for_confirmed=request.configuration.required_success_rate,
+            required_for_review=request.configuration.max_verification_time
+        )
+
+        for entry, verification_summary in zip(request.entries, verification_results):
+            if verification_summary.final_status == entry.expected_status:
+                successful_entries += 1
+            else:
+                failed_entries += 1
             
         end_time = datetime.now()
         execution_time = (end_time - start_time).total_seconds()
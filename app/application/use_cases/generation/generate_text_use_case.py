@@ -1,8 +1,8 @@
 # application/use_cases/generation/generate_text_use_case.py
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict
 from dataclasses import dataclass
 from datetime import datetime
-from domain.model.entities.generation import GeneratedResult, GenerationMetadata
+from domain.model.entities.generation import GeneratedResult, GenerationMetadata, GenerationChunk
 from domain.ports.llm_port import LLMPort
 from domain.exceptions.generation_error import InvalidPromptError, GenerationLimitExceeded
 
@@ -14,6 +14,8 @@ class GenerateTextRequest:
     max_tokens: int = 100
     temperature: float = 1.0
     reference_data: Optional[Dict[str, str]] = None
+    stop_sequences: Optional[List[str]] = None
+    seed: Optional[int] = None
 
 @dataclass
 class GenerateTextResponse:
@@ -39,7 +41,9 @@ class GenerateTextUseCase:
                 user_prompt=request.user_prompt,
                 num_sequences=request.num_sequences,
                 max_tokens=request.max_tokens,
-                temperature=request.temperature
+                temperature=request.temperature,
+                stop_sequences=request.stop_sequences,
+                seed=request.seed
             )
             
             total_tokens = sum(result.metadata.tokens_used for result in generated_results)
@@ -55,6 +59,73 @@ class GenerateTextUseCase:
         except Exception as e:
             raise e
 
+    def execute_stream(self, request: GenerateTextRequest) -> Iterator[GenerationChunk]:
+        """
+        Generate for a single request, yielding text chunks as they are decoded.
+        """
+        self._validate_request(request)
+
+        try:
+            yield from self.llm.generate_stream(
+                system_prompt=request.system_prompt,
+                user_prompt=request.user_prompt,
+                num_sequences=request.num_sequences,
+                max_tokens=request.max_tokens,
+                temperature=request.temperature,
+                stop_sequences=request.stop_sequences,
+                seed=request.seed
+            )
+        except Exception as e:
+            raise e
+
+    def execute_batch(self, requests: List[GenerateTextRequest]) -> List[GenerateTextResponse]:
+        """
+        Generate for many requests, sending those that share sampling
+        parameters to the model as one batch.
+        """
+        for request in requests:
+            self._validate_request(request)
+
+        groups: Dict[tuple, List[int]] = {}
+        for index, request in enumerate(requests):
+            key = (
+                request.num_sequences,
+                request.max_tokens,
+                request.temperature,
+                tuple(request.stop_sequences or ()),
+                request.seed
+            )
+            groups.setdefault(key, []).append(index)
+
+        responses: List[Optional[GenerateTextResponse]] = [None] * len(requests)
+        try:
+            for (num_sequences, max_tokens, temperature, stop_sequences, seed), indices in groups.items():
+                start_time = datetime.now()
+                batch_results = self.llm.generate_batch(
+                    prompts=[
+                        (requests[i].system_prompt, requests[i].user_prompt) for i in indices
+                    ],
+                    num_sequences=num_sequences,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stop_sequences=list(stop_sequences) or None,
+                    seed=seed
+                )
+                generation_time = (datetime.now() - start_time).total_seconds()
+
+                for index, generated_results in zip(indices, batch_results):
+                    responses[index] = GenerateTextResponse(
+                        generated_texts=generated_results,
+                        total_tokens=sum(r.metadata.tokens_used for r in generated_results),
+                        generation_time=generation_time,
+                        model_name=generated_results[0].metadata.model_name if generated_results else "unknown"
+                    )
+
+            return responses
+
+        except Exception as e:
+            raise e
+
     def _validate_request(self, request: GenerateTextRequest) -> None:
         if not request.system_prompt.strip():
             raise InvalidPromptError("system", "System prompt cannot be empty")
@@ -5,9 +5,13 @@ from datetime import datetime
 from application.interfaces.pipeline_orchestrator import (
     PipelineConfig, PipelineResult, PipelineStageType, StageResult
 )
-from application.use_cases.generation.generate_text_use_case import GenerateTextUseCase
-from application.use_cases.parsing.parse_generated_output_use_case import ParseGeneratedOutputUseCase
-from application.use_cases.verification.verify_text_use_case import VerifyTextUseCase
+from application.use_cases.generation.generate_text_use_case import (
+    GenerateTextUseCase, GenerateTextRequest
+)
+from application.use_cases.parsing.parse_generated_output_use_case import (
+    ParseGeneratedOutputUseCase, ParseGeneratedOutputRequest
+)
+from application.use_cases.verification.verify_text_use_case import VerifyTextUseCase, VerifyTextRequest
 from domain.exceptions.base_exception import DomainError
 
 @dataclass
@@ -100,25 +104,53 @@ class ExecutePipelineUseCase:
         output_data = None
         metadata = {}
 
-        if stage_type == PipelineStageType.GENERATE:
-                output_data = self.generate_use_case.execute(
+        if stage_type == PipelineStageType.GENERATE and isinstance(input_data, list):
+                # Fan out over every input in one batched generation
+                output_data = self.generate_use_case.execute_batch([
+                    GenerateTextRequest(
+                        system_prompt=parameters.get("system_prompt", ""),
+                        user_prompt=str(item),
+                        num_sequences=parameters.get("num_sequences", 1),
+                        max_tokens=parameters.get("max_tokens", 100),
+                        seed=parameters.get("seed")
+                    )
+                    for item in input_data
+                ])
+                metadata["batch_size"] = len(input_data)
+        elif stage_type == PipelineStageType.GENERATE:
+                output_data = self.generate_use_case.execute(GenerateTextRequest(
                     system_prompt=parameters.get("system_prompt", ""),
-                    user_prompt=parameters.get("user_prompt", ""),
+                    user_prompt=parameters.get("user_prompt", str(input_data)),
                     num_sequences=parameters.get("num_sequences", 1),
-                    max_tokens=parameters.get("max_tokens", 100)
-                )
+                    max_tokens=parameters.get("max_tokens", 100),
+                    seed=parameters.get("seed")
+                ))
         elif stage_type == PipelineStageType.PARSE:
-                output_data = self.parse_use_case.execute(
+                output_data = self.parse_use_case.execute(ParseGeneratedOutputRequest(
                     text=input_data,
-                    rules=parameters.get("rules", [])
-                )
+                    rules=parameters.get("rules", []),
+                    require_all_rules=parameters.get("require_all_rules", True)
+                ))
+        elif stage_type == PipelineStageType.VERIFY and isinstance(input_data, list):
+                # Every input goes through each method in one batched pass
+                methods = parameters.get("methods", [])
+                output_data = self.verify_use_case.execute_batch([
+                    VerifyTextRequest(
+                        text=item,
+                        methods=methods,
+                        required_for_confirmed=parameters.get("required_for_confirmed", 1),
+                        required_for_review=parameters.get("required_for_review", 0)
+                    )
+                    for item in input_data
+                ])
+                metadata["batch_size"] = len(input_data)
         elif stage_type == PipelineStageType.VERIFY:
-                output_data = self.verify_use_case.execute(
+                output_data = self.verify_use_case.execute(VerifyTextRequest(
                     text=input_data,
                     methods=parameters.get("methods", []),
                     required_for_confirmed=parameters.get("required_for_confirmed", 1),
                     required_for_review=parameters.get("required_for_review", 0)
-                )
+                ))
 
         execution_time = (datetime.now() - start_time).total_seconds()
         metadata["execution_time"] = execution_time
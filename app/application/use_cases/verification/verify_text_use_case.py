@@ -1,5 +1,5 @@
 # application/use_cases/verification/verify_text_use_case.py
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from domain.model.entities.verification import VerificationMethod, VerificationSummary
@@ -49,6 +49,43 @@ class VerifyTextUseCase:
         except Exception as e:
             raise e
 
+    def execute_batch(self, requests: List[VerifyTextRequest]) -> List[VerifyTextResponse]:
+        """
+        Verify many requests, sending those that share methods and status
+        thresholds to the verifier as one batch. execution_time is each
+        text's share of its batch.
+        """
+        for request in requests:
+            self._validate_request(request)
+
+        # Methods are compared by identity: requests built from one config share the list
+        groups: Dict[tuple, List[int]] = {}
+        for index, request in enumerate(requests):
+            key = (id(request.methods), request.required_for_confirmed, request.required_for_review)
+            groups.setdefault(key, []).append(index)
+
+        responses: List[Optional[VerifyTextResponse]] = [None] * len(requests)
+        try:
+            for indices in groups.values():
+                first = requests[indices[0]]
+                summaries = self.verifier_service.verify_batch(
+                    texts=[requests[i].text for i in indices],
+                    methods=first.methods,
+                    required_for_confirmed=first.required_for_confirmed,
+                    required_for_review=first.required_for_review
+                )
+                for index, summary in zip(indices, summaries):
+                    responses[index] = VerifyTextResponse(
+                        verification_summary=summary,
+                        execution_time=summary.verification_time,
+                        success_rate=summary.success_rate
+                    )
+
+            return responses
+
+        except Exception as e:
+            raise e
+
     def _validate_request(self, request: VerifyTextRequest) -> None:
         if not request.text.strip():
             raise InvalidVerificationMethod("any", "Input text cannot be empty")
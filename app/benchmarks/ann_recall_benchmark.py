@@ -0,0 +1,76 @@
+# benchmarks/ann_recall_benchmark.py
+"""
+Recall@k and latency of the IVF index against brute-force search.
+
+Run from the app directory:
+    python -m benchmarks.ann_recall_benchmark --size 200000 --dim 384
+"""
+import argparse
+import json
+import time
+import numpy as np
+from infrastructure.external.embeddings.ivf_index import IVFIndex
+
+
+def make_corpus(size: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    # Clustered data is closer to real sentence embeddings than uniform noise
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=size)
+    vectors = centers[labels] + 0.5 * rng.standard_normal((size, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def run(args: argparse.Namespace) -> dict:
+    corpus = make_corpus(args.size, args.dim, args.clusters, args.seed)
+    queries = make_corpus(args.queries, args.dim, args.clusters, args.seed + 1)
+
+    build_start = time.perf_counter()
+    index = IVFIndex.build(corpus, nlist=args.nlist, nprobe=args.nprobe)
+    build_time = time.perf_counter() - build_start
+
+    exact_start = time.perf_counter()
+    exact_scores = queries @ corpus.T
+    exact_ids = np.argsort(-exact_scores, axis=1)[:, :args.k]
+    exact_time = time.perf_counter() - exact_start
+
+    ann_start = time.perf_counter()
+    _, ann_ids = index.search(queries, args.k)
+    ann_time = time.perf_counter() - ann_start
+
+    recall = np.mean([
+        len(set(found) & set(expected)) / args.k
+        for found, expected in zip(ann_ids.tolist(), exact_ids.tolist())
+    ])
+    top1_recall = float(np.mean(ann_ids[:, 0] == exact_ids[:, 0]))
+
+    return {
+        "size": args.size,
+        "dim": args.dim,
+        "nlist": index.nlist,
+        "nprobe": index.nprobe,
+        "k": args.k,
+        f"recall@{args.k}": float(recall),
+        "recall@1": top1_recall,
+        "build_time_s": build_time,
+        "brute_force_ms_per_query": 1000 * exact_time / args.queries,
+        "ann_ms_per_query": 1000 * ann_time / args.queries,
+        "speedup": exact_time / ann_time if ann_time else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IVF index recall benchmark")
+    parser.add_argument("--size", type=int, default=100000, help="Reference vectors")
+    parser.add_argument("--dim", type=int, default=384, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Query vectors")
+    parser.add_argument("--clusters", type=int, default=256, help="Synthetic data clusters")
+    parser.add_argument("--nlist", type=int, default=None, help="Inverted lists")
+    parser.add_argument("--nprobe", type=int, default=16, help="Lists probed per query")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    print(json.dumps(run(parser.parse_args()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
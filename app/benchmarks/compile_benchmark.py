@@ -0,0 +1,116 @@
+# benchmarks/compile_benchmark.py
+"""
+Eager vs torch.compile forward latency on CPU at several batch sizes, for
+embedding passes and next-token scoring passes.
+
+Run from the app directory:
+    python -m benchmarks.compile_benchmark --batch-sizes 1 4 16 32 --runs 10
+"""
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+from infrastructure.external.embeddings.embedder_model import EmbedderModel
+from infrastructure.external.embeddings.embeddings_config import EmbeddingsConfig
+from infrastructure.external.llm.instruct_model import InstructModel
+from infrastructure.external.llm.llm_config import LLMConfig
+
+SENTENCES = [
+    "The quarterly report shows revenue growth across all regions.",
+    "Please verify that the shipment arrived before the deadline.",
+    "A short sentence.",
+    "The committee postponed the vote until more data becomes available next month.",
+]
+CHOICES = {"yes": ["yes", "Yes"], "no": ["no", "No"]}
+
+
+def texts(batch_size: int) -> List[str]:
+    # Cycle the sentences so batches mix lengths, as real traffic does
+    return [SENTENCES[i % len(SENTENCES)] for i in range(batch_size)]
+
+
+def measure(call: Callable[[], object], runs: int) -> Dict[str, float]:
+    # The first call pays for compilation of this shape bucket
+    start = time.perf_counter()
+    call()
+    first = time.perf_counter() - start
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "first_call": first,
+        "median": timings[len(timings) // 2],
+        "p95": timings[min(int(0.95 * len(timings)), len(timings) - 1)]
+    }
+
+
+def run_embeddings(args: argparse.Namespace, use_compile: bool) -> dict:
+    embedder = EmbedderModel(config=EmbeddingsConfig(
+        model_name=args.embeddings_model, device="cpu", use_compile=use_compile, warmup_lengths=[]
+    ))
+    results = {
+        str(size): measure(lambda: embedder.get_embeddings(texts(size)), args.runs)
+        for size in args.batch_sizes
+    }
+    return {"latency": results, "compile": embedder.get_compile_stats()}
+
+
+def run_scoring(args: argparse.Namespace, use_compile: bool) -> dict:
+    llm = InstructModel(config=LLMConfig(
+        model_name=args.llm_model,
+        device="cpu",
+        use_compile=use_compile,
+        warmup_lengths=[],
+        prefix_cache_memory_bytes=0
+    ))
+    results = {
+        str(size): measure(
+            lambda: llm.next_token_probabilities(
+                [("Answer yes or no.", text) for text in texts(size)], CHOICES
+            ),
+            args.runs
+        )
+        for size in args.batch_sizes
+    }
+    return {"latency": results, "compile": llm.get_compile_stats()}
+
+
+def speedups(eager: dict, compiled: dict) -> Dict[str, float]:
+    return {
+        size: eager["latency"][size]["median"] / compiled["latency"][size]["median"]
+        for size in eager["latency"]
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    report = {"batch_sizes": args.batch_sizes, "runs": args.runs}
+    if not args.skip_embeddings:
+        eager, compiled = run_embeddings(args, False), run_embeddings(args, True)
+        report["embeddings"] = {
+            "eager": eager, "compiled": compiled, "speedup": speedups(eager, compiled)
+        }
+    if not args.skip_scoring:
+        eager, compiled = run_scoring(args, False), run_scoring(args, True)
+        report["scoring"] = {
+            "eager": eager, "compiled": compiled, "speedup": speedups(eager, compiled)
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="torch.compile benchmark")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 16, 32], help="Batch sizes")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per batch size")
+    parser.add_argument("--embeddings-model", default=EmbeddingsConfig().model_name, help="Embedding model")
+    parser.add_argument("--llm-model", default=LLMConfig().model_name, help="LLM for scoring passes")
+    parser.add_argument("--skip-embeddings", action="store_true", help="Only benchmark scoring")
+    parser.add_argument("--skip-scoring", action="store_true", help="Only benchmark embeddings")
+    print(json.dumps(run(parser.parse_args()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
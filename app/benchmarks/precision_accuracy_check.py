@@ -0,0 +1,133 @@
+# benchmarks/precision_accuracy_check.py
+"""
+Similarity scores and consensus decisions of a reduced-precision model
+set against fp32, plus memory and throughput of both.
+
+Run from the app directory:
+    python -m benchmarks.precision_accuracy_check --precision int8
+    python -m benchmarks.precision_accuracy_check --precision bf16 --samples samples.json
+
+A samples file is a JSON object with "pairs" (lists of two texts) and
+"statements" (texts to run consensus verification on).
+"""
+import argparse
+import json
+from typing import List, Tuple
+from domain.model.entities.verification import ConsensusMode, VerificationMethod, VerificationMethodType, VerificationMode
+from domain.services.verifier_service import VerifierService
+from infrastructure.external.embeddings.embedder_model import EmbedderModel
+from infrastructure.external.embeddings.embeddings_config import EmbeddingsConfig
+from infrastructure.external.llm.instruct_model import InstructModel
+from infrastructure.external.llm.llm_config import LLMConfig
+from infrastructure.external.precision.model_precision import PRECISIONS
+
+DEFAULT_PAIRS = [
+    ("The cat sat on the mat.", "A cat was sitting on a mat."),
+    ("Paris is the capital of France.", "France's capital city is Paris."),
+    ("The invoice is due next Friday.", "Payment must be made by the end of next week."),
+    ("Water boils at 100 degrees Celsius.", "The stock market closed higher today."),
+    ("He plays the guitar every evening.", "Quantum computers use qubits."),
+    ("The meeting was moved to Tuesday.", "We rescheduled the meeting for Tuesday."),
+]
+
+DEFAULT_STATEMENTS = [
+    "The Earth orbits the Sun once a year.",
+    "Two plus two equals five.",
+    "Water is made of hydrogen and oxygen.",
+    "The Moon is larger than the Earth.",
+    "Python is a programming language.",
+    "Fish can live without water.",
+]
+
+
+def load_samples(path: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    if not path:
+        return DEFAULT_PAIRS, DEFAULT_STATEMENTS
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [tuple(pair) for pair in data.get("pairs", [])], data.get("statements", [])
+
+
+def similarities(embedder: EmbedderModel, pairs: List[Tuple[str, str]]) -> List[float]:
+    return [embedder.get_similarity(a, b).value for a, b in pairs]
+
+
+def consensus(verifier: VerifierService, statements: List[str], required_matches: int) -> List[Tuple[bool, float]]:
+    # Logits mode is deterministic, so any disagreement comes from precision alone
+    method = VerificationMethod(
+        name="consensus",
+        method_type=VerificationMethodType.CONSENSUS,
+        mode=VerificationMode.CUMULATIVE,
+        required_matches=required_matches,
+        consensus_mode=ConsensusMode.LOGITS
+    )
+    summaries = verifier.verify_batch(statements, [method], required_for_confirmed=1, required_for_review=0)
+    return [(summary.results[0].passed, summary.results[0].score) for summary in summaries]
+
+
+def run(args: argparse.Namespace) -> dict:
+    pairs, statements = load_samples(args.samples)
+
+    def build(precision: str):
+        embedder = EmbedderModel(config=EmbeddingsConfig(
+            model_name=args.embeddings_model, device="cpu", precision=precision
+        ))
+        llm = InstructModel(config=LLMConfig(
+            model_name=args.llm_model, device="cpu", precision=precision, prefix_cache_memory_bytes=0
+        ))
+        return embedder, llm, VerifierService(embedder, llm)
+
+    reference_embedder, reference_llm, reference_verifier = build("fp32")
+    reference_scores = similarities(reference_embedder, pairs)
+    reference_decisions = consensus(reference_verifier, statements, args.required_matches)
+
+    embedder, llm, verifier = build(args.precision)
+    scores = similarities(embedder, pairs)
+    decisions = consensus(verifier, statements, args.required_matches)
+
+    errors = [abs(a - b) for a, b in zip(reference_scores, scores)]
+    threshold_agreement = [
+        (a >= args.threshold) == (b >= args.threshold) for a, b in zip(reference_scores, scores)
+    ]
+    decision_agreement = [a[0] == b[0] for a, b in zip(reference_decisions, decisions)]
+    probability_errors = [abs(a[1] - b[1]) for a, b in zip(reference_decisions, decisions)]
+
+    return {
+        "precision": args.precision,
+        "similarity": {
+            "pairs": len(pairs),
+            "mean_abs_error": sum(errors) / len(errors) if errors else 0.0,
+            "max_abs_error": max(errors, default=0.0),
+            "threshold": args.threshold,
+            "threshold_agreement": sum(threshold_agreement) / len(threshold_agreement) if threshold_agreement else 1.0
+        },
+        "consensus": {
+            "statements": len(statements),
+            "decision_agreement": sum(decision_agreement) / len(decision_agreement) if decision_agreement else 1.0,
+            "mean_yes_probability_error": sum(probability_errors) / len(probability_errors) if probability_errors else 0.0,
+            "flipped": [s for s, same in zip(statements, decision_agreement) if not same]
+        },
+        "fp32": {
+            "embeddings": reference_embedder.get_precision_stats(),
+            "llm": reference_llm.get_precision_stats()
+        },
+        args.precision: {
+            "embeddings": embedder.get_precision_stats(),
+            "llm": llm.get_precision_stats()
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reduced-precision accuracy check")
+    parser.add_argument("--precision", choices=[p for p in PRECISIONS if p != "fp32"], default="int8")
+    parser.add_argument("--samples", default=None, help="JSON file with pairs and statements")
+    parser.add_argument("--embeddings-model", default=EmbeddingsConfig().model_name, help="Embedding model")
+    parser.add_argument("--llm-model", default=LLMConfig().model_name, help="LLM used for consensus")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Similarity decision threshold")
+    parser.add_argument("--required-matches", type=int, default=3, help="Consensus matches out of 5")
+    print(json.dumps(run(parser.parse_args()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
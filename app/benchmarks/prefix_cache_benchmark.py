@@ -0,0 +1,83 @@
+# benchmarks/prefix_cache_benchmark.py
+"""
+Prefix KV cache hit rate under the verifier's consensus prompts, against
+the previous layout that put the candidate text in the system prompt.
+
+Run from the app directory:
+    python -m benchmarks.prefix_cache_benchmark --texts 64 --batch-size 8
+"""
+import argparse
+import json
+import time
+from typing import Callable, List, Tuple
+from domain.model.entities.verification import ConsensusMode, VerificationMethod, VerificationMethodType, VerificationMode
+from domain.services.verifier_service import CONSENSUS_CHOICES, VerifierService
+from infrastructure.external.llm.instruct_model import InstructModel
+from infrastructure.external.llm.llm_config import LLMConfig
+from infrastructure.external.llm.prefix_cache import PrefixCacheStats
+
+SUBJECTS = ["The report", "This invoice", "The shipment", "Our meeting", "The contract", "The survey"]
+CLAIMS = ["was signed last week", "arrived on time", "lists three items", "needs a second review"]
+
+
+def make_texts(count: int) -> List[str]:
+    return [
+        f"{SUBJECTS[i % len(SUBJECTS)]} {CLAIMS[(i // len(SUBJECTS)) % len(CLAIMS)]} (case {i})."
+        for i in range(count)
+    ]
+
+
+def legacy_prompts(text: str) -> Tuple[str, str]:
+    # The layout before the candidate text moved into the user turn
+    return f"Verify the following text:\n{text}", "Is this text valid? Respond with 'yes' or 'no'."
+
+
+def measure(model: InstructModel, batches: List[List[str]], score: Callable[[List[str]], object]) -> dict:
+    model.prefix_cache.clear()
+    model.prefix_cache.stats = PrefixCacheStats()
+    start = time.perf_counter()
+    for batch in batches:
+        score(batch)
+    return {"seconds": time.perf_counter() - start, **model.get_prefix_cache_stats()}
+
+
+def run(args: argparse.Namespace) -> dict:
+    model = InstructModel(config=LLMConfig(model_name=args.model, device=args.device))
+    verifier = VerifierService(None, model)
+    method = VerificationMethod(
+        name="consensus",
+        method_type=VerificationMethodType.CONSENSUS,
+        mode=VerificationMode.CUMULATIVE,
+        required_matches=3,
+        consensus_mode=ConsensusMode.LOGITS
+    )
+
+    texts = make_texts(args.texts)
+    batches = [texts[i:i + args.batch_size] for i in range(0, len(texts), args.batch_size)]
+
+    return {
+        "model": args.model,
+        "texts": args.texts,
+        "batch_size": args.batch_size,
+        "consensus_prompts": measure(
+            model, batches,
+            lambda batch: verifier.verify_batch(batch, [method], required_for_confirmed=1, required_for_review=0)
+        ),
+        "legacy_prompts": measure(
+            model, batches,
+            lambda batch: model.next_token_probabilities([legacy_prompts(text) for text in batch], CONSENSUS_CHOICES)
+        )
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefix cache hit rate under consensus prompts")
+    parser.add_argument("--model", default=LLMConfig().model_name, help="Model name or path")
+    parser.add_argument("--texts", type=int, default=64, help="Candidate texts to verify")
+    parser.add_argument("--batch-size", type=int, default=8, help="Texts per verify_batch call")
+    parser.add_argument("--device", default=None, help="Device override")
+    print(json.dumps(run(parser.parse_args()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/speculative_decoding_benchmark.py
+"""
+Decode throughput of a target model with and without a draft model.
+Both run with the default prefix cache: the plain model generates from
+cached prefixes where it can, while the assisted model bypasses the cache
+for single-sequence generation.
+
+Run from the app directory, e.g. with two small local checkpoints:
+    python -m benchmarks.speculative_decoding_benchmark \
+        --target ./checkpoints/target --draft ./checkpoints/draft --lookahead 4
+"""
+import argparse
+import json
+import time
+from typing import List
+from infrastructure.external.llm.instruct_model import InstructModel
+from infrastructure.external.llm.llm_config import LLMConfig
+
+DEFAULT_PROMPTS = [
+    "Explain what a hash table is.",
+    "Summarise the plot of a detective story in three sentences.",
+    "List three uses of a binary search.",
+    "Describe how a bicycle gear works.",
+]
+
+
+def decode(model: InstructModel, prompts: List[str], args: argparse.Namespace) -> dict:
+    tokens = 0
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        for prompt in prompts:
+            result = model.generate(
+                args.system_prompt,
+                prompt,
+                max_tokens=args.max_tokens,
+                temperature=args.temperature
+            )[0]
+            tokens += result.metadata.completion_tokens
+    elapsed = time.perf_counter() - start
+    return {"tokens": tokens, "seconds": elapsed, "tokens_per_second": tokens / elapsed}
+
+
+def run(args: argparse.Namespace) -> dict:
+    prompts = DEFAULT_PROMPTS
+    if args.prompts:
+        with open(args.prompts, "r", encoding="utf-8") as f:
+            prompts = json.load(f)
+
+    base_config = dict(model_name=args.target, device=args.device)
+    plain = InstructModel(config=LLMConfig(**base_config))
+    assisted = InstructModel(config=LLMConfig(
+        **base_config, draft_model_name=args.draft, draft_lookahead=args.lookahead
+    ))
+
+    plain_result = decode(plain, prompts, args)
+    assisted_result = decode(assisted, prompts, args)
+
+    return {
+        "target": args.target,
+        "draft": args.draft,
+        "lookahead": args.lookahead,
+        "plain": plain_result,
+        "assisted": assisted_result,
+        "speedup": assisted_result["tokens_per_second"] / plain_result["tokens_per_second"],
+        "speculation": assisted.get_speculation_stats(),
+        "prefix_cache": {
+            "plain": plain.get_prefix_cache_stats(),
+            "assisted": assisted.get_prefix_cache_stats()
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Speculative decoding benchmark")
+    parser.add_argument("--target", required=True, help="Target model name or path")
+    parser.add_argument("--draft", required=True, help="Draft model name or path")
+    parser.add_argument("--lookahead", type=int, default=5, help="Draft tokens per step")
+    parser.add_argument("--prompts", default=None, help="JSON file with a list of user prompts")
+    parser.add_argument("--system-prompt", default="You are a helpful assistant.", help="System prompt")
+    parser.add_argument("--max-tokens", type=int, default=64, help="Tokens per generation")
+    parser.add_argument("--temperature", type=float, default=1.0, help="Sampling temperature")
+    parser.add_argument("--runs", type=int, default=2, help="Passes over the prompts")
+    parser.add_argument("--device", default=None, help="Device override")
+    print(json.dumps(run(parser.parse_args()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,14 @@
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import datetime
-from domain.model.entities.verification import VerificationSummary
+from domain.model.entities.verification import VerificationMethod, VerificationSummary
 from domain.model.value_objects.benchmark_metrics import BenchmarkMetrics
 
 @dataclass(frozen=True)
 class BenchmarkConfiguration:
     name: str
     description: str
-    verification_methods: List[str]
+    verification_methods: List[VerificationMethod]
     required_success_rate: float
     max_verification_time: float
     tags: List[str] = None
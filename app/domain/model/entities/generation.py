@@ -9,6 +9,18 @@ class GenerationMetadata:
     tokens_used: int
     generation_time: float
     timestamp: datetime = datetime.now()
+    token_budget: Optional[int] = None
+    stop_reason: Optional[str] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    time_to_first_token: Optional[float] = None
+    inter_token_latency: Optional[float] = None
+
+    @property
+    def tokens_saved(self) -> int:
+        if self.token_budget is None:
+            return 0
+        return max(self.token_budget - self.tokens_used, 0)
 
 @dataclass(frozen=True)
 class GeneratedResult:
@@ -20,4 +32,14 @@ class GeneratedResult:
         return text.lower() in self.content.lower()
 
     def word_count(self) -> int:
-        return len(self.content.split())
\ No newline at end of file
+        return len(self.content.split())
+
+@dataclass(frozen=True)
+class GenerationChunk:
+    sequence_index: int
+    text: str
+    result: Optional[GeneratedResult] = None
+
+    @property
+    def is_final(self) -> bool:
+        return self.result is not None
\ No newline at end of file
@@ -1,6 +1,6 @@
 # domain/model/entities/verification.py
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from enum import Enum
 from datetime import datetime
 
@@ -14,6 +14,16 @@ class VerificationMode(Enum):
     ELIMINATORY = "eliminatory"
     CUMULATIVE = "cumulative"
 
+class ConsensusMode(Enum):
+    SAMPLING = "sampling"
+    SEQUENTIAL = "sequential"
+    LOGITS = "logits"
+
+class SimilarityAggregation(Enum):
+    MAX = "max"
+    MEAN = "mean"
+    TOP_K_MEAN = "top_k_mean"
+
 @dataclass(frozen=True)
 class VerificationThresholds:
     lower_bound: float
@@ -31,6 +41,33 @@ class VerificationMethod:
     thresholds: Optional[VerificationThresholds] = None
     reference_text: Optional[str] = None
     required_matches: Optional[int] = None
+    reference_texts: Optional[List[str]] = None
+    aggregation: SimilarityAggregation = SimilarityAggregation.MAX
+    top_k: Optional[int] = None
+    consensus_mode: ConsensusMode = ConsensusMode.SAMPLING
+    max_samples: Optional[int] = None
+    samples_per_round: Optional[int] = None
+    stopping_confidence: Optional[float] = None
+    pattern: Optional[str] = None
+
+    @property
+    def reference_set(self) -> List[str]:
+        if self.reference_texts:
+            return list(self.reference_texts)
+        return [self.reference_text] if self.reference_text else []
+
+@dataclass(frozen=True)
+class PreparedMethod:
+    method: VerificationMethod
+    references: Optional[Any] = None
+
+@dataclass(frozen=True)
+class PreparedMethodSet:
+    methods: List[PreparedMethod]
+
+    @property
+    def raw_methods(self) -> List[VerificationMethod]:
+        return [prepared.method for prepared in self.methods]
 
 @dataclass(frozen=True)
 class VerificationResult:
@@ -45,6 +82,9 @@ class VerificationSummary:
     results: List[VerificationResult]
     final_status: str
     verification_time: float
+    skipped_methods: Optional[List[str]] = None
+    method_times: Optional[Dict[str, float]] = None
+    critical_path_time: Optional[float] = None
     
     @property
     def passed_methods(self) -> List[str]:
@@ -14,6 +14,19 @@ class VerificationStatus(Enum):
         except ValueError:
             return None
 
+    @classmethod
+    def from_cumulative_passes(
+        cls,
+        cumulative_passes: int,
+        required_for_confirmed: int,
+        required_for_review: int
+    ) -> 'VerificationStatus':
+        if cumulative_passes >= required_for_confirmed:
+            return cls.CONFIRMED
+        elif cumulative_passes >= required_for_review:
+            return cls.REVIEW
+        return cls.DISCARDED
+
     def is_final(self) -> bool:
         return self in [VerificationStatus.CONFIRMED, VerificationStatus.DISCARDED]
 
@@ -1,6 +1,6 @@
 # domain/ports/embeddings_port.py
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List, Optional
 from domain.model.value_objects.similarity_score import SimilarityScore
 
 class EmbeddingsPort(ABC):
@@ -31,6 +31,19 @@ class EmbeddingsPort(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get the embedding vectors for several texts at once.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding vector per text, in input order
+        """
+        pass
+    
     @abstractmethod
     def batch_similarities(self, reference_text: str, comparison_texts: List[str]) -> List[SimilarityScore]:
         """
@@ -43,4 +56,39 @@ class EmbeddingsPort(ABC):
         Returns:
             List of SimilarityScore objects for each comparison
         """
+        pass
+    
+    @abstractmethod
+    def prepare_references(self, reference_texts: List[str]) -> Any:
+        """
+        Embed reference texts once so they can be scored against repeatedly.
+        
+        Args:
+            reference_texts: Reference texts to embed
+            
+        Returns:
+            Opaque handle holding the prepared reference embeddings
+        """
+        pass
+    
+    @abstractmethod
+    def reference_similarities(
+        self,
+        references: Any,
+        texts: List[str],
+        top_k: Optional[int] = None
+    ) -> List[List[float]]:
+        """
+        Calculate similarities between texts and previously prepared references.
+        
+        Args:
+            references: Handle returned by prepare_references
+            texts: Texts to compare against the references
+            top_k: If given, only the k highest similarities are returned
+            
+        Returns:
+            For each text, its similarity to every reference in reference order,
+            or its top_k similarities in descending order (approximate when the
+            references are backed by a nearest-neighbour index)
+        """
         pass
\ No newline at end of file
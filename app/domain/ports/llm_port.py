@@ -1,7 +1,7 @@
 # domain/ports/llm_port.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
-from domain.model.entities.generation import GeneratedResult
+from typing import Iterator, List, Optional, Dict, Tuple
+from domain.model.entities.generation import GeneratedResult, GenerationChunk
 
 class LLMPort(ABC):
     @abstractmethod
@@ -12,7 +12,8 @@ class LLMPort(ABC):
         num_sequences: int = 1,
         max_tokens: int = 100,
         temperature: float = 1.0,
-        stop_sequences: Optional[List[str]] = None
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
     ) -> List[GeneratedResult]:
         """
         Generate text using the language model.
@@ -24,12 +25,87 @@ class LLMPort(ABC):
             max_tokens: Maximum number of tokens to generate
             temperature: Sampling temperature
             stop_sequences: Optional list of sequences that will stop generation
+            seed: Optional random seed; with temperature 0 decoding is greedy
             
         Returns:
             List of GeneratedResult objects containing the generated texts and metadata
         """
         pass
 
+    @abstractmethod
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> Iterator[GenerationChunk]:
+        """
+        Generate text, yielding it incrementally as it is decoded.
+        
+        Args:
+            system_prompt: System-level instructions for the model
+            user_prompt: User input/question
+            num_sequences: Number of different sequences to generate
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
+            stop_sequences: Optional list of sequences that will stop generation
+            seed: Optional random seed; with temperature 0 decoding is greedy
+            
+        Returns:
+            Iterator of text chunks tagged with their sequence index, followed
+            by one final chunk per sequence carrying the complete GeneratedResult
+        """
+        pass
+
+    @abstractmethod
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> List[List[GeneratedResult]]:
+        """
+        Generate text for many prompts, batching them through the model.
+        
+        Args:
+            prompts: (system_prompt, user_prompt) pairs
+            num_sequences: Number of different sequences to generate per prompt
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
+            stop_sequences: Optional list of sequences that will stop generation
+            seed: Optional random seed; with temperature 0 decoding is greedy
+            
+        Returns:
+            One list of GeneratedResult objects per prompt, in input order
+        """
+        pass
+
+    @abstractmethod
+    def next_token_probabilities(
+        self,
+        prompts: List[Tuple[str, str]],
+        choices: Dict[str, List[str]]
+    ) -> List[Dict[str, float]]:
+        """
+        Score the model's next token after each prompt, without sampling.
+        
+        Args:
+            prompts: (system_prompt, user_prompt) pairs to score
+            choices: Choice name mapped to the words that count as that choice
+                (e.g. {"yes": ["yes", "Yes"], "no": ["no", "No"]})
+            
+        Returns:
+            For each prompt, the probability mass the model puts on each choice
+        """
+        pass
+
     @abstractmethod
     def get_token_count(self, text: str) -> int:
         """
@@ -0,0 +1,128 @@
+# domain/services/verification_planner.py
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import hashlib
+from domain.model.entities.verification import (
+    VerificationMethod, VerificationMethodType, VerificationMode, PreparedMethod
+)
+from domain.model.value_objects.verification_status import VerificationStatus
+
+# Cost guesses (seconds) used until a method has been measured
+DEFAULT_METHOD_COSTS: Dict[VerificationMethodType, float] = {
+    VerificationMethodType.REGEX: 0.0001,
+    VerificationMethodType.CUSTOM: 0.001,
+    VerificationMethodType.EMBEDDING: 0.02,
+    VerificationMethodType.CONSENSUS: 1.0,
+}
+
+
+@dataclass
+class MethodStats:
+    runs: int = 0
+    passes: int = 0
+    total_time: float = 0.0
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.runs if self.runs else 0.0
+
+    @property
+    def failure_rate(self) -> float:
+        # Laplace-smoothed so unseen methods start at 0.5
+        return (self.runs - self.passes + 1) / (self.runs + 2)
+
+
+class VerificationPlanner:
+    """
+    Orders verification methods by measured cost and selectivity and decides
+    when a text's final status can no longer change.
+
+    ELIMINATORY methods always run first, cheapest-per-rejection first;
+    CUMULATIVE methods follow, cheapest first. Because the final status does
+    not depend on method order, planned runs reach the same status as the
+    configured order.
+
+    Statistics are kept per method identity: name, type, mode and a digest
+    of the full configuration. Unrelated methods that happen to share a
+    name in different requests are measured separately.
+    """
+
+    _MAX_CACHED_KEYS = 1024
+
+    def __init__(self, default_costs: Optional[Dict[VerificationMethodType, float]] = None):
+        self.default_costs = default_costs or DEFAULT_METHOD_COSTS
+        self._stats: Dict[Tuple[str, str, str, str], MethodStats] = {}
+        # Keys by object id; the entry holds the method so its id is not reused
+        self._keys: Dict[int, Tuple[VerificationMethod, Tuple[str, str, str, str]]] = {}
+        self._lock = Lock()
+
+    def order(self, methods: List[PreparedMethod]) -> List[PreparedMethod]:
+        eliminatory = [p for p in methods if p.method.mode == VerificationMode.ELIMINATORY]
+        cumulative = [p for p in methods if p.method.mode != VerificationMode.ELIMINATORY]
+        eliminatory.sort(key=lambda p: self.expected_cost(p.method) / self._failure_rate(p.method))
+        cumulative.sort(key=lambda p: self.expected_cost(p.method))
+        return eliminatory + cumulative
+
+    def record(self, method: VerificationMethod, elapsed: float, passed: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(self._key(method), MethodStats())
+            stats.runs += 1
+            stats.passes += int(passed)
+            stats.total_time += elapsed
+
+    def expected_cost(self, method: VerificationMethod) -> float:
+        stats = self._stats.get(self._key(method))
+        if stats and stats.runs:
+            return stats.average_time
+        return self.default_costs.get(method.method_type, 1.0)
+
+    def settled_status(
+        self,
+        cumulative_passes: int,
+        remaining_cumulative: int,
+        remaining_eliminatory: int,
+        required_for_confirmed: int,
+        required_for_review: int
+    ) -> Optional[VerificationStatus]:
+        """
+        Return the final status if no remaining method can change it, else None.
+        """
+        if remaining_eliminatory > 0:
+            return None
+        lowest = VerificationStatus.from_cumulative_passes(
+            cumulative_passes, required_for_confirmed, required_for_review
+        )
+        highest = VerificationStatus.from_cumulative_passes(
+            cumulative_passes + remaining_cumulative, required_for_confirmed, required_for_review
+        )
+        return lowest if lowest == highest else None
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                ":".join(key): {
+                    "runs": stats.runs,
+                    "passes": stats.passes,
+                    "average_time": stats.average_time,
+                    "failure_rate": stats.failure_rate
+                }
+                for key, stats in self._stats.items()
+            }
+
+    def _failure_rate(self, method: VerificationMethod) -> float:
+        stats = self._stats.get(self._key(method))
+        return stats.failure_rate if stats else 0.5
+
+    def _key(self, method: VerificationMethod) -> Tuple[str, str, str, str]:
+        entry = self._keys.get(id(method))
+        if entry is not None and entry[0] is method:
+            return entry[1]
+
+        # repr covers every configured field, including lists, in a stable order
+        digest = hashlib.sha256(repr(method).encode("utf-8")).hexdigest()[:12]
+        key = (method.name, method.method_type.value, method.mode.value, digest)
+        if len(self._keys) >= self._MAX_CACHED_KEYS:
+            self._keys.clear()
+        self._keys[id(method)] = (method, key)
+        return key
\ No newline at end of file
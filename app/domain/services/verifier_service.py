@@ -1,143 +1,624 @@
 # domain/services/verifier_service.py
-from typing import List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable, Tuple, Union
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from threading import Lock
+import hashlib
+import heapq
+import json
+import math
+from statistics import NormalDist
 from domain.model.entities.verification import (
-    VerificationMethod, VerificationMethodType, VerificationMode,
-    VerificationResult, VerificationSummary
+    VerificationMethod, VerificationMethodType, VerificationMode, SimilarityAggregation, ConsensusMode,
+    VerificationResult, VerificationSummary, PreparedMethod, PreparedMethodSet
 )
 from domain.model.value_objects.verification_status import VerificationStatus
 from domain.model.value_objects.similarity_score import SimilarityScore
 from domain.ports.embeddings_port import EmbeddingsPort
 from domain.ports.llm_port import LLMPort
+from domain.services.verification_planner import VerificationPlanner
+
+# Default independent verifications drawn (or simulated) per consensus check
+CONSENSUS_SAMPLES = 5
+CONSENSUS_SYSTEM_PROMPT = (
+    "You are a careful verifier. The user gives you a text; decide whether "
+    "it is valid and answer with a single word."
+)
+CONSENSUS_QUESTION = "Is this text valid? Respond with 'yes' or 'no'."
+CONSENSUS_CHOICES = {
+    "yes": ["yes", "Yes", "YES"],
+    "no": ["no", "No", "NO"],
+}
+
+
+def consensus_prompts(text: str) -> Tuple[str, str]:
+    # The system prompt is the same for every text so its prefix is shared
+    return CONSENSUS_SYSTEM_PROMPT, f"Verify the following text:\n{text}\n\n{CONSENSUS_QUESTION}"
 
 
 class VerifierService:
-    def __init__(self, embeddings: EmbeddingsPort, llm: LLMPort):
+    def __init__(
+        self,
+        embeddings: EmbeddingsPort,
+        llm: LLMPort,
+        planner: Optional[VerificationPlanner] = None,
+        max_workers: Optional[int] = None,
+        reference_cache: Optional[Any] = None
+    ):
+        """
+        `reference_cache` keeps prepared reference sets between calls. It
+        needs `get(key)` and `put(key, value)` and should bound its own
+        size; without one, every call prepares its references again.
+        """
         self.embeddings = embeddings
         self.llm = llm
+        self.planner = planner
+        self.max_workers = max_workers
+        self.reference_cache = reference_cache
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._references_lock = Lock()
+
+    def prepare_methods(self, methods: List[VerificationMethod]) -> PreparedMethodSet:
+        """
+        Embed every reference set once so repeated verifications only
+        need to embed the candidate text.
+        """
+        prepared = []
+        for method in methods:
+            references = None
+            if method.method_type == VerificationMethodType.EMBEDDING and method.reference_set:
+                references = self._get_prepared_references(tuple(method.reference_set))
+            prepared.append(PreparedMethod(method=method, references=references))
+        return PreparedMethodSet(methods=prepared)
 
     def verify_text(
         self,
         text: str,
-        methods: List[VerificationMethod],
+        methods: Union[List[VerificationMethod], PreparedMethodSet],
         required_for_confirmed: int,
         required_for_review: int
     ) -> VerificationSummary:
+        if not isinstance(methods, PreparedMethodSet):
+            methods = self.prepare_methods(methods)
+        ordered = self._plan(methods)
+
+        if self.max_workers and self.max_workers > 1:
+            return self._verify_text_concurrent(
+                text, ordered, required_for_confirmed, required_for_review
+            )
+
         start_time = datetime.now()
         results: List[VerificationResult] = []
+        skipped: List[str] = []
+        method_times: Dict[str, float] = {}
         cumulative_passes = 0
+        remaining = self._remaining_counts(ordered)
 
-        for method in methods:
-            result = self._apply_verification_method(method, text)
+        for position, prepared in enumerate(ordered):
+            final_status = self._settled_status(
+                cumulative_passes, remaining[position], required_for_confirmed, required_for_review
+            )
+            if final_status is not None:
+                skipped = [p.method.name for p in ordered[position:]]
+                break
+
+            method = prepared.method
+            result, elapsed = self._timed_apply(prepared, text)
+            method_times[method.name] = elapsed
             results.append(result)
 
             if not result.passed and method.mode == VerificationMode.ELIMINATORY:
                 final_status = VerificationStatus.DISCARDED
+                skipped = [p.method.name for p in ordered[position + 1:]]
                 break
             
             if result.passed and method.mode == VerificationMode.CUMULATIVE:
                 cumulative_passes += 1
 
         else:  # Only executed if no break occurred
-            if cumulative_passes >= required_for_confirmed:
-                final_status = VerificationStatus.CONFIRMED
-            elif cumulative_passes >= required_for_review:
-                final_status = VerificationStatus.REVIEW
-            else:
-                final_status = VerificationStatus.DISCARDED
+            final_status = VerificationStatus.from_cumulative_passes(
+                cumulative_passes, required_for_confirmed, required_for_review
+            )
 
         verification_time = (datetime.now() - start_time).total_seconds()
 
         return VerificationSummary(
             results=results,
             final_status=final_status.value,
-            verification_time=verification_time
+            verification_time=verification_time,
+            skipped_methods=skipped or None,
+            method_times=method_times,
+            critical_path_time=sum(method_times.values())
         )
 
+    def _verify_text_concurrent(
+        self,
+        text: str,
+        ordered: List[PreparedMethod],
+        required_for_confirmed: int,
+        required_for_review: int
+    ) -> VerificationSummary:
+        """
+        Run every method on the thread pool at once. A failed ELIMINATORY
+        method (or, with a planner, a settled status) cancels whatever has
+        not finished yet; methods already running are left to complete and
+        their results are dropped.
+        """
+        start_time = datetime.now()
+        executor = self._get_executor()
+        futures = {
+            # Copy the caller's context so model calls keep its request priority
+            executor.submit(copy_context().run, self._timed_apply, prepared, text): position
+            for position, prepared in enumerate(ordered)
+        }
+        completed: Dict[int, Tuple[VerificationResult, float]] = {}
+        remaining = self._remaining_counts(ordered)
+        remaining_cumulative, remaining_eliminatory = remaining[0] if remaining else (0, 0)
+        cumulative_passes = 0
+        final_status = None
+
+        try:
+            for future in as_completed(futures):
+                position = futures[future]
+                result, elapsed = future.result()
+                completed[position] = (result, elapsed)
+                method = ordered[position].method
+
+                if method.mode == VerificationMode.ELIMINATORY:
+                    remaining_eliminatory -= 1
+                    if not result.passed:
+                        final_status = VerificationStatus.DISCARDED
+                        break
+                elif method.mode == VerificationMode.CUMULATIVE:
+                    remaining_cumulative -= 1
+                    if result.passed:
+                        cumulative_passes += 1
+
+                final_status = self._settled_status(
+                    cumulative_passes, (remaining_cumulative, remaining_eliminatory),
+                    required_for_confirmed, required_for_review
+                )
+                if final_status is not None:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+
+        if final_status is None:
+            final_status = VerificationStatus.from_cumulative_passes(
+                cumulative_passes, required_for_confirmed, required_for_review
+            )
+
+        finished = sorted(completed)
+        method_times = {ordered[p].method.name: completed[p][1] for p in finished}
+        skipped = [p.method.name for i, p in enumerate(ordered) if i not in completed]
+
+        return VerificationSummary(
+            results=[completed[p][0] for p in finished],
+            final_status=final_status.value,
+            verification_time=(datetime.now() - start_time).total_seconds(),
+            skipped_methods=skipped or None,
+            method_times=method_times,
+            critical_path_time=max(method_times.values(), default=0.0)
+        )
+
+    def verify_batch(
+        self,
+        texts: List[str],
+        methods: Union[List[VerificationMethod], PreparedMethodSet],
+        required_for_confirmed: int,
+        required_for_review: int
+    ) -> List[VerificationSummary]:
+        """
+        Verify many texts method by method, so each method runs once over
+        every text still in play. Produces the same summaries as calling
+        verify_text on each text; verification_time, method_times and
+        critical_path_time use the text's share of each method's batch time.
+        """
+        if not isinstance(methods, PreparedMethodSet):
+            methods = self.prepare_methods(methods)
+        ordered = self._plan(methods)
+        remaining = self._remaining_counts(ordered)
+
+        results: List[List[VerificationResult]] = [[] for _ in texts]
+        skipped: List[List[str]] = [[] for _ in texts]
+        method_times: List[Dict[str, float]] = [{} for _ in texts]
+        cumulative_passes = [0] * len(texts)
+        elapsed = [0.0] * len(texts)
+        statuses: List[Optional[VerificationStatus]] = [None] * len(texts)
+        active = list(range(len(texts)))
+
+        for position, prepared in enumerate(ordered):
+            still_active = []
+            for i in active:
+                statuses[i] = self._settled_status(
+                    cumulative_passes[i], remaining[position],
+                    required_for_confirmed, required_for_review
+                )
+                if statuses[i] is not None:
+                    skipped[i] = [p.method.name for p in ordered[position:]]
+                else:
+                    still_active.append(i)
+            active = still_active
+            if not active:
+                break
+
+            method = prepared.method
+            start_time = datetime.now()
+            method_results = self._apply_verification_method_batch(
+                prepared, [texts[i] for i in active]
+            )
+            share = (datetime.now() - start_time).total_seconds() / len(active)
+
+            still_active = []
+            for i, result in zip(active, method_results):
+                results[i].append(result)
+                method_times[i][method.name] = share
+                elapsed[i] += share
+                if self.planner is not None:
+                    self.planner.record(method, share, result.passed)
+
+                if not result.passed and method.mode == VerificationMode.ELIMINATORY:
+                    statuses[i] = VerificationStatus.DISCARDED
+                    skipped[i] = [p.method.name for p in ordered[position + 1:]]
+                    continue
+
+                if result.passed and method.mode == VerificationMode.CUMULATIVE:
+                    cumulative_passes[i] += 1
+                still_active.append(i)
+            active = still_active
+
+        for i in active:
+            statuses[i] = VerificationStatus.from_cumulative_passes(
+                cumulative_passes[i], required_for_confirmed, required_for_review
+            )
+
+        return [
+            VerificationSummary(
+                results=results[i],
+                final_status=statuses[i].value,
+                verification_time=elapsed[i],
+                skipped_methods=skipped[i] or None,
+                method_times=method_times[i],
+                critical_path_time=sum(method_times[i].values())
+            )
+            for i in range(len(texts))
+        ]
+
+    def _plan(self, methods: PreparedMethodSet) -> List[PreparedMethod]:
+        if self.planner is None:
+            return methods.methods
+        return self.planner.order(methods.methods)
+
+    def _remaining_counts(self, ordered: List[PreparedMethod]) -> List[Tuple[int, int]]:
+        # (cumulative, eliminatory) methods left to run before each position
+        counts = []
+        cumulative = sum(1 for p in ordered if p.method.mode == VerificationMode.CUMULATIVE)
+        eliminatory = sum(1 for p in ordered if p.method.mode == VerificationMode.ELIMINATORY)
+        for prepared in ordered:
+            counts.append((cumulative, eliminatory))
+            if prepared.method.mode == VerificationMode.CUMULATIVE:
+                cumulative -= 1
+            elif prepared.method.mode == VerificationMode.ELIMINATORY:
+                eliminatory -= 1
+        return counts
+
+    def _settled_status(
+        self,
+        cumulative_passes: int,
+        remaining: Tuple[int, int],
+        required_for_confirmed: int,
+        required_for_review: int
+    ) -> Optional[VerificationStatus]:
+        # Early decisions are part of the opt-in planner
+        if self.planner is None:
+            return None
+        return self.planner.settled_status(
+            cumulative_passes, remaining[0], remaining[1],
+            required_for_confirmed, required_for_review
+        )
+
+    def _timed_apply(self, prepared: PreparedMethod, text: str) -> Tuple[VerificationResult, float]:
+        start_time = datetime.now()
+        result = self._apply_verification_method(prepared, text)
+        elapsed = (datetime.now() - start_time).total_seconds()
+        if self.planner is not None:
+            self.planner.record(prepared.method, elapsed, result.passed)
+        return result, elapsed
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="verifier"
+            )
+        return self._executor
+
+    def _get_prepared_references(self, reference_texts: Tuple[str, ...]) -> Any:
+        if self.reference_cache is None:
+            return self.embeddings.prepare_references(list(reference_texts))
+
+        key = hashlib.sha256(json.dumps(reference_texts).encode("utf-8")).hexdigest()
+        # Held across the prepare so concurrent requests embed a set only once
+        with self._references_lock:
+            references = self.reference_cache.get(key)
+            if references is None:
+                references = self.embeddings.prepare_references(list(reference_texts))
+                self.reference_cache.put(key, references)
+        return references
+
     def _apply_verification_method(
         self,
-        method: VerificationMethod,
+        prepared: PreparedMethod,
         text: str
     ) -> VerificationResult:
+        return self._apply_verification_method_batch(prepared, [text])[0]
+
+    def _apply_verification_method_batch(
+        self,
+        prepared: PreparedMethod,
+        texts: List[str]
+    ) -> List[VerificationResult]:
+        method = prepared.method
         if method.method_type == VerificationMethodType.EMBEDDING:
-            return self._verify_embedding(method, text)
+            return self._verify_embedding_batch(prepared, texts)
         elif method.method_type == VerificationMethodType.CONSENSUS:
-            return self._verify_consensus(method, text)
+            if method.consensus_mode == ConsensusMode.LOGITS:
+                return self._verify_consensus_logits_batch(method, texts)
+            if method.consensus_mode == ConsensusMode.SEQUENTIAL:
+                return [self._verify_consensus_sequential(method, text) for text in texts]
+            return self._verify_consensus_batch(method, texts)
         elif method.method_type == VerificationMethodType.REGEX:
-            return self._verify_regex(method, text)
+            return self._verify_regex_batch(method, texts)
         elif method.method_type == VerificationMethodType.CUSTOM:
-            return self._verify_custom(method, text)
+            return [self._verify_custom(method, text) for text in texts]
         else:
             raise ValueError(f"Unknown verification method type: {method.method_type}")
 
-    def _verify_embedding(self, method: VerificationMethod, text: str) -> VerificationResult:
-        if not method.reference_text or not method.thresholds:
+    def _verify_embedding_batch(
+        self,
+        prepared: PreparedMethod,
+        texts: List[str]
+    ) -> List[VerificationResult]:
+        method = prepared.method
+        if not method.reference_set or not method.thresholds:
             raise ValueError("Embedding verification requires reference text and thresholds")
+        if method.aggregation == SimilarityAggregation.TOP_K_MEAN and not method.top_k:
+            raise ValueError("Top-k mean aggregation requires top_k")
+
+        # Reference embeddings were computed up front; only the candidates are embedded here
+        all_scores = self.embeddings.reference_similarities(
+            prepared.references, texts, top_k=self._similarity_top_k(method)
+        )
+        return [self._embedding_result(method, scores) for scores in all_scores]
+
+    def _embedding_result(self, method: VerificationMethod, scores: List[float]) -> VerificationResult:
+        similarity = self._aggregate_similarities(method, scores)
+        passed = method.thresholds.is_within_bounds(similarity)
 
-        similarity = self.embeddings.get_similarity(method.reference_text, text)
-        passed = method.thresholds.is_within_bounds(similarity.value)
+        details = {
+            "similarity_score": similarity,
+            "thresholds": {
+                "lower": method.thresholds.lower_bound,
+                "upper": method.thresholds.upper_bound
+            }
+        }
+        if method.reference_texts:
+            details["reference_count"] = len(method.reference_texts)
+            details["aggregation"] = method.aggregation.value
+        else:
+            details["reference_text"] = method.reference_text
 
         return VerificationResult(
             method=method,
             passed=passed,
-            score=similarity.value,
-            details={
-                "similarity_score": similarity.value,
-                "reference_text": method.reference_text,
-                "thresholds": {
-                    "lower": method.thresholds.lower_bound,
-                    "upper": method.thresholds.upper_bound
-                }
-            }
+            score=similarity,
+            details=details
         )
 
-    def _verify_consensus(self, method: VerificationMethod, text: str) -> VerificationResult:
+    def _similarity_top_k(self, method: VerificationMethod) -> Optional[int]:
+        # Only MEAN needs every score; the others can use a top-k query
+        if method.aggregation == SimilarityAggregation.MAX:
+            return 1
+        if method.aggregation == SimilarityAggregation.TOP_K_MEAN:
+            return method.top_k
+        return None
+
+    def _aggregate_similarities(self, method: VerificationMethod, scores: List[float]) -> float:
+        if method.aggregation == SimilarityAggregation.MEAN:
+            return sum(scores) / len(scores)
+        if method.aggregation == SimilarityAggregation.TOP_K_MEAN:
+            top = heapq.nlargest(min(method.top_k, len(scores)), scores)
+            return sum(top) / len(top)
+        return max(scores)
+
+    def _verify_consensus_batch(
+        self,
+        method: VerificationMethod,
+        texts: List[str]
+    ) -> List[VerificationResult]:
         if not method.required_matches:
             raise ValueError("Consensus verification requires required_matches")
 
-        # Generate multiple verifications using LLM
-        system_prompt = f"Verify the following text:\n{text}"
-        user_prompt = "Is this text valid? Respond with 'yes' or 'no'."
-        
-        responses = self.llm.generate(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            num_sequences=5,  # Generate 5 independent verifications
+        # Generate multiple verifications per text, all texts in one batched call
+        all_responses = self.llm.generate_batch(
+            [self._consensus_prompts(text) for text in texts],
+            num_sequences=self._sample_budget(method),  # Independent verifications
             max_tokens=10  # Short responses expected
         )
 
-        positive_responses = sum(1 for r in responses if r.content.strip().lower() == 'yes')
-        passed = positive_responses >= method.required_matches
+        results = []
+        for responses in all_responses:
+            positive_responses = sum(1 for r in responses if self._is_affirmative(r.content))
+            passed = positive_responses >= method.required_matches
+
+            results.append(VerificationResult(
+                method=method,
+                passed=passed,
+                score=positive_responses / len(responses),
+                details={
+                    "total_responses": len(responses),
+                    "positive_responses": positive_responses,
+                    "required_matches": method.required_matches
+                }
+            ))
+        return results
+
+    def _verify_consensus_logits_batch(
+        self,
+        method: VerificationMethod,
+        texts: List[str]
+    ) -> List[VerificationResult]:
+        if not method.required_matches:
+            raise ValueError("Consensus verification requires required_matches")
+
+        # One forward pass per prompt instead of sampling CONSENSUS_SAMPLES answers
+        probabilities = self.llm.next_token_probabilities(
+            [self._consensus_prompts(text) for text in texts],
+            CONSENSUS_CHOICES
+        )
+
+        results = []
+        for choice in probabilities:
+            answered = choice["yes"] + choice["no"]
+            # Renormalise over the two answers so stray tokens don't count as "no"
+            yes_probability = choice["yes"] / answered if answered > 0 else 0.0
+            expected_positive = yes_probability * self._sample_budget(method)
+            results.append(VerificationResult(
+                method=method,
+                passed=expected_positive >= method.required_matches,
+                score=yes_probability,
+                details={
+                    "yes_probability": yes_probability,
+                    "answer_mass": answered,
+                    "expected_positive": expected_positive,
+                    "total_responses": self._sample_budget(method),
+                    "required_matches": method.required_matches
+                }
+            ))
+        return results
+
+    def _verify_consensus_sequential(self, method: VerificationMethod, text: str) -> VerificationResult:
+        """
+        Sample in small rounds and stop as soon as the outcome is decided:
+        either `required_matches` answers were positive, or too few samples
+        are left to reach it. With `stopping_confidence` set, also stop once
+        a Wilson interval on the positive rate excludes the required rate.
+        """
+        if not method.required_matches:
+            raise ValueError("Consensus verification requires required_matches")
+
+        system_prompt, user_prompt = self._consensus_prompts(text)
+        budget = self._sample_budget(method)
+        required = method.required_matches
+        drawn = positive = 0
+        passed = None
+        stopped_by = "budget"
+
+        while drawn < budget:
+            # Smallest round that could settle the outcome either way
+            round_size = min(required - positive, budget - drawn - (required - positive) + 1)
+            if method.samples_per_round:
+                round_size = min(round_size, method.samples_per_round)
+            round_size = max(1, min(round_size, budget - drawn))
+
+            responses = self.llm.generate(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                num_sequences=round_size,
+                max_tokens=10  # Short responses expected
+            )
+            drawn += len(responses)
+            positive += sum(1 for r in responses if self._is_affirmative(r.content))
+
+            if positive >= required or positive + (budget - drawn) < required:
+                passed = positive >= required
+                stopped_by = "decided"
+                break
+
+            if method.stopping_confidence:
+                passed = self._confident_decision(
+                    positive, drawn, required / budget, method.stopping_confidence
+                )
+                if passed is not None:
+                    stopped_by = "statistical"
+                    break
+
+        if passed is None:
+            passed = positive >= required
 
         return VerificationResult(
             method=method,
             passed=passed,
-            score=positive_responses / len(responses),
+            score=positive / drawn if drawn else 0.0,
             details={
-                "total_responses": len(responses),
-                "positive_responses": positive_responses,
-                "required_matches": method.required_matches
+                "total_responses": drawn,
+                "positive_responses": positive,
+                "required_matches": required,
+                "sample_budget": budget,
+                "samples_saved": budget - drawn,
+                "stopped_by": stopped_by
             }
         )
 
-    def _verify_regex(self, method: VerificationMethod, text: str) -> VerificationResult:
+    @staticmethod
+    def _confident_decision(
+        positive: int,
+        drawn: int,
+        required_rate: float,
+        confidence: float
+    ) -> Optional[bool]:
+        # Wilson score interval for the positive rate
+        z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+        rate = positive / drawn
+        denominator = 1 + z * z / drawn
+        center = (rate + z * z / (2 * drawn)) / denominator
+        margin = z * math.sqrt(rate * (1 - rate) / drawn + z * z / (4 * drawn * drawn)) / denominator
+        if center - margin > required_rate:
+            return True
+        if center + margin < required_rate:
+            return False
+        return None
+
+    def _sample_budget(self, method: VerificationMethod) -> int:
+        return method.max_samples or CONSENSUS_SAMPLES
+
+    def _consensus_prompts(self, text: str) -> Tuple[str, str]:
+        return consensus_prompts(text)
+
+    @staticmethod
+    def _is_affirmative(content: str) -> bool:
+        # Accept "Yes.", "yes, it is", etc., not just an exact "yes"
+        words = content.strip().split()
+        return bool(words) and words[0].strip(".,!?:;'\"").lower() == "yes"
+
+    def _verify_regex_batch(
+        self,
+        method: VerificationMethod,
+        texts: List[str]
+    ) -> List[VerificationResult]:
         import re
-        if not hasattr(method, 'pattern'):
+        if not method.pattern:
             raise ValueError("Regex verification requires a pattern")
 
-        pattern = getattr(method, 'pattern')
-        matches = re.findall(pattern, text)
-        passed = len(matches) > 0
+        # Compile once for the whole batch
+        pattern = method.pattern
+        compiled = re.compile(pattern)
 
-        return VerificationResult(
-            method=method,
-            passed=passed,
-            score=1.0 if passed else 0.0,
-            details={
-                "matches_found": len(matches),
-                "pattern": pattern
-            }
-        )
+        results = []
+        for text in texts:
+            matches = compiled.findall(text)
+            passed = len(matches) > 0
+            results.append(VerificationResult(
+                method=method,
+                passed=passed,
+                score=1.0 if passed else 0.0,
+                details={
+                    "matches_found": len(matches),
+                    "pattern": pattern
+                }
+            ))
+        return results
 
     def _verify_custom(self, method: VerificationMethod, text: str) -> VerificationResult:
         if not hasattr(method, 'verification_function'):
@@ -0,0 +1,188 @@
+# infrastructure/api/server.py
+from dataclasses import asdict
+from threading import Thread
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, Header
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from application.dto.requests.generate_text_request import GenerateTextRequest as GenerateTextRequestDTO
+from application.dto.requests.parse_request import ParseRequest
+from application.dto.requests.verify_text_request import VerifyTextRequest as VerifyTextRequestDTO
+from application.dto.requests.benchmark_request import BenchmarkRequest
+from application.dto.requests.pipeline_request import PipelineConfigRequest, PipelineRequest
+from application.dto.responses.generate_text_response import GenerateTextResponse as GenerateTextResponseDTO
+from application.use_cases.generation.generate_text_use_case import GenerateTextRequest
+from application.use_cases.parsing.parse_generated_output_use_case import ParseGeneratedOutputRequest
+from application.use_cases.verification.verify_text_use_case import VerifyTextRequest
+from application.use_cases.orchestration.execute_pipeline_use_case import ExecutePipelineRequest
+from application.use_cases.benchmark.run_benchmark_use_case import RunBenchmarkRequest
+from application.interfaces.event_dispatcher import EventPriority
+from application.interfaces.pipeline_orchestrator import PipelineConfig, PipelineStageConfig
+from domain.exceptions.base_exception import DomainError
+from domain.model.entities.benchmark import BenchmarkConfiguration, BenchmarkEntry
+from domain.model.entities.parsing import ParseRule
+from domain.model.entities.verification import VerificationMethod, VerificationThresholds
+from infrastructure.container import ServiceContainer
+from infrastructure.scheduling.admission import AdmissionRejected
+from infrastructure.scheduling.priority import LANES, parse_priority, priority_scope
+
+
+def create_app(container: ServiceContainer, warmup: bool = True) -> FastAPI:
+    """
+    HTTP API over the use cases of a single container.
+
+    Endpoints are synchronous, so FastAPI runs them on its thread pool and
+    concurrent requests share the container's one copy of each model.
+    With `warmup`, models load on a background thread at startup, their
+    warm-up forwards run in the critical lane ahead of any request, and
+    /ready reports 503 until they are in memory.
+
+    Each endpoint runs its model calls in a priority lane: interactive for
+    single requests, batch for benchmarks. An X-Priority header (a lane
+    name or a priority value) overrides the default, and requests turned
+    away by admission control get 503.
+    """
+    app = FastAPI(title="Text Processing Pipeline")
+    warmup_state: Dict[str, Optional[str]] = {"error": None}
+
+    def warm_up():
+        try:
+            with priority_scope(EventPriority.CRITICAL):
+                container.warm_up()
+        except Exception as e:
+            warmup_state["error"] = str(e)
+
+    @app.on_event("startup")
+    def start_warmup():
+        if warmup:
+            Thread(target=warm_up, name="model-warmup", daemon=True).start()
+
+    @app.exception_handler(DomainError)
+    def domain_error(request, error: DomainError):
+        return JSONResponse(status_code=400, content=error.to_dict())
+
+    @app.exception_handler(AdmissionRejected)
+    def admission_rejected(request, error: AdmissionRejected):
+        return JSONResponse(status_code=503, content=error.to_dict())
+
+    @app.get("/health")
+    def health() -> Dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/ready")
+    def ready():
+        body = {
+            "ready": container.models_loaded,
+            "models": {
+                "llm": {
+                    "loaded": container.llm.loaded,
+                    "load_time": container.llm.loader.load_time
+                },
+                "embeddings": {
+                    "loaded": container.embedder.loaded,
+                    "load_time": container.embedder.loader.load_time
+                }
+            },
+            "error": warmup_state["error"]
+        }
+        return JSONResponse(status_code=200 if body["ready"] else 503, content=body)
+
+    @app.get("/metrics")
+    def metrics() -> Any:
+        return {
+            "scheduler": container.get_scheduler_stats(),
+            "models": container.get_load_stats()
+        }
+
+    @app.post("/generate", response_model=GenerateTextResponseDTO)
+    def generate(request: GenerateTextRequestDTO, x_priority: Optional[str] = Header(None)):
+        with priority_scope(_priority(x_priority, "interactive")):
+            result = container.generate_use_case.execute(GenerateTextRequest(**request.dict()))
+            return GenerateTextResponseDTO(**asdict(result))
+
+    @app.post("/parse")
+    def parse(request: ParseRequest, x_priority: Optional[str] = Header(None)) -> Any:
+        with priority_scope(_priority(x_priority, "interactive")):
+            result = container.parse_use_case.execute(ParseGeneratedOutputRequest(
+                text=request.text,
+                rules=[ParseRule(**rule.dict()) for rule in request.rules],
+                require_all_rules=request.require_all_rules
+            ))
+            return jsonable_encoder(result)
+
+    @app.post("/verify")
+    def verify(request: VerifyTextRequestDTO, x_priority: Optional[str] = Header(None)) -> Any:
+        with priority_scope(_priority(x_priority, "interactive")):
+            result = container.verify_use_case.execute(VerifyTextRequest(
+                text=request.text,
+                methods=[_verification_method(method.dict()) for method in request.methods],
+                required_for_confirmed=request.required_for_confirmed,
+                required_for_review=request.required_for_review,
+                context=request.context
+            ))
+            return jsonable_encoder(result)
+
+    @app.post("/pipeline")
+    def pipeline(request: PipelineRequest, x_priority: Optional[str] = Header(None)) -> Any:
+        with priority_scope(_priority(x_priority, "interactive")):
+            result = container.pipeline_use_case.execute(ExecutePipelineRequest(
+                config=_pipeline_config(request.config),
+                initial_input=request.initial_input,
+                context=request.context
+            ))
+            return jsonable_encoder(result)
+
+    @app.post("/benchmark")
+    def benchmark(request: BenchmarkRequest, x_priority: Optional[str] = Header(None)) -> Any:
+        with priority_scope(_priority(x_priority, "batch")):
+            configuration = request.configuration.dict()
+            configuration["verification_methods"] = [
+                _verification_method(method) for method in configuration["verification_methods"]
+            ]
+            result = container.benchmark_use_case.execute(RunBenchmarkRequest(
+                configuration=BenchmarkConfiguration(**configuration),
+                entries=[BenchmarkEntry(**entry.dict()) for entry in request.entries],
+                tags=request.tags
+            ))
+            return jsonable_encoder(result)
+
+    return app
+
+
+def _verification_method(fields: Dict[str, Any]) -> VerificationMethod:
+    thresholds = fields.get("thresholds")
+    if thresholds is not None:
+        fields["thresholds"] = VerificationThresholds(**thresholds)
+    return VerificationMethod(**fields)
+
+
+def _pipeline_config(config: PipelineConfigRequest) -> PipelineConfig:
+    return PipelineConfig(
+        stages=[
+            PipelineStageConfig(
+                stage_type=stage.stage_type,
+                parameters=_stage_parameters(stage.parameters),
+                timeout_seconds=stage.timeout_seconds,
+                retry_count=stage.retry_count
+            )
+            for stage in config.stages
+        ],
+        max_total_time=config.max_total_time,
+        error_handling_strategy=config.error_handling_strategy,
+        metadata=config.metadata
+    )
+
+
+def _stage_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    # Rules and methods arrive as request models; stages run on domain entities
+    parameters = dict(parameters)
+    if "rules" in parameters:
+        parameters["rules"] = [ParseRule(**rule.dict()) for rule in parameters["rules"]]
+    if "methods" in parameters:
+        parameters["methods"] = [_verification_method(method.dict()) for method in parameters["methods"]]
+    return parameters
+
+
+def _priority(header: Optional[str], lane: str) -> EventPriority:
+    return parse_priority(header) or LANES[lane]
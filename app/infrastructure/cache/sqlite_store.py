@@ -0,0 +1,119 @@
+# infrastructure/cache/sqlite_store.py
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+
+
+class SqliteBlobStore:
+    """
+    On-disk key/blob store backed by SQLite in WAL mode, so several
+    processes can share one cache file.
+
+    Entries older than `ttl_seconds` are treated as missing and purged on
+    write; when `max_bytes` is set, the oldest entries are dropped once the
+    stored values exceed it.
+    """
+
+    # SQLite limits the number of bound parameters per statement
+    _MAX_PARAMS = 500
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "blobs",
+        timeout: float = 30.0,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_created_at ON {table} (created_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        keys = list(keys)
+        found: Dict[str, bytes] = {}
+        oldest = time.time() - self.ttl_seconds if self.ttl_seconds is not None else 0.0
+        with self._lock:
+            for i in range(0, len(keys), self._MAX_PARAMS):
+                chunk = keys[i:i + self._MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM {self.table} "
+                    f"WHERE key IN ({placeholders}) AND created_at >= ?",
+                    [*chunk, oldest]
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def put(self, key: str, value: bytes) -> None:
+        self.put_many({key: value})
+
+    def put_many(self, items: Dict[str, bytes]) -> None:
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)",
+                [(key, sqlite3.Binary(value), now) for key, value in items.items()]
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            row = self._conn.execute(f"SELECT COALESCE(SUM(LENGTH(value)), 0) FROM {self.table}").fetchone()
+            return row[0]
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(f"SELECT key FROM {self.table}")]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        # Called with the lock held, inside the write transaction
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+        if self.max_bytes is None:
+            return
+
+        total = self._conn.execute(
+            f"SELECT COALESCE(SUM(LENGTH(value)), 0) FROM {self.table}"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Oldest first until the table fits again
+        stale = []
+        for key, size in self._conn.execute(
+            f"SELECT key, LENGTH(value) FROM {self.table} ORDER BY created_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", stale)
\ No newline at end of file
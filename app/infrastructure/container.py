@@ -0,0 +1,156 @@
+# infrastructure/container.py
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from domain.ports.llm_port import LLMPort
+from domain.ports.embeddings_port import EmbeddingsPort
+from domain.services.parse_service import ParseService
+from domain.services.verifier_service import CONSENSUS_CHOICES, VerifierService, consensus_prompts
+from domain.services.verification_planner import VerificationPlanner
+from domain.services.metrics_service import MetricsService
+from application.use_cases.generation.generate_text_use_case import GenerateTextUseCase
+from application.use_cases.parsing.parse_generated_output_use_case import ParseGeneratedOutputUseCase
+from application.use_cases.verification.verify_text_use_case import VerifyTextUseCase
+from application.use_cases.orchestration.execute_pipeline_use_case import ExecutePipelineUseCase
+from application.use_cases.benchmark.run_benchmark_use_case import RunBenchmarkUseCase
+from infrastructure.external.lazy.lazy_llm import LazyLLM
+from infrastructure.external.lazy.lazy_embeddings import LazyEmbeddings
+from infrastructure.external.lazy.lazy_loader import LazyLoader
+from infrastructure.external.embeddings.embeddings_config import EmbeddingsConfig
+from infrastructure.cache.lru_cache import ByteBoundedLRUCache
+from infrastructure.scheduling.scheduler_config import SchedulerConfig
+from infrastructure.scheduling.batching_llm import BatchingLLM
+from infrastructure.scheduling.batching_embeddings import BatchingEmbeddings
+
+
+def build_llm() -> LLMPort:
+    # Imported here so torch and transformers load only with the model
+    from infrastructure.external.llm.instruct_model import InstructModel
+    from infrastructure.external.llm.llm_config import LLMConfig
+    from infrastructure.external.llm.cached_llm import CachedLLM
+
+    llm_config = LLMConfig()
+    return CachedLLM(InstructModel(config=llm_config), llm_config)
+
+
+def build_embeddings() -> EmbeddingsPort:
+    from infrastructure.external.embeddings.embedder_model import EmbedderModel
+    from infrastructure.external.embeddings.cached_embeddings import CachedEmbeddings
+    from infrastructure.external.embeddings.indexed_embeddings import IndexedEmbeddings
+
+    embeddings_config = EmbeddingsConfig()
+    return IndexedEmbeddings(
+        CachedEmbeddings(EmbedderModel(config=embeddings_config), embeddings_config),
+        embeddings_config
+    )
+
+
+@dataclass
+class ServiceContainer:
+    """
+    Wires ports, services and use cases together. Models load when a use
+    case first calls a port, and one container shares them across callers.
+    """
+    llm: LazyLLM
+    embedder: LazyEmbeddings
+    generate_use_case: GenerateTextUseCase
+    parse_use_case: ParseGeneratedOutputUseCase
+    verify_use_case: VerifyTextUseCase
+    pipeline_use_case: ExecutePipelineUseCase
+    benchmark_use_case: RunBenchmarkUseCase
+    batching_llm: Optional[BatchingLLM] = None
+    batching_embeddings: Optional[BatchingEmbeddings] = None
+
+    @property
+    def models_loaded(self) -> bool:
+        return self.llm.loaded and self.embedder.loaded
+
+    def warm_up(self) -> None:
+        """
+        Load both models and run one forward through each. With batching,
+        the forwards go through the schedulers in the caller's lane, so
+        requests that arrive while the models load queue behind them.
+        """
+        embeddings = self.batching_embeddings or self.embedder
+        llm = self.batching_llm or self.llm
+        embeddings.get_embeddings(["warm-up"])
+        # A consensus prompt, so its shared system prefix is seen once
+        llm.next_token_probabilities([consensus_prompts("warm-up")], CONSENSUS_CHOICES)
+
+    def get_load_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "llm": _adapter_stats(self.llm.loader, "get_load_stats"),
+            "embeddings": _adapter_stats(self.embedder.loader, "get_load_stats")
+        }
+
+    def get_scheduler_stats(self) -> Dict[str, Dict[str, float]]:
+        stats = {}
+        for port in (self.batching_llm, self.batching_embeddings):
+            if port is not None:
+                stats.update(port.get_scheduler_stats())
+        return stats
+
+
+def _adapter_stats(loader: LazyLoader, getter: str) -> Dict[str, Any]:
+    # The model adapter sits under the cache and index decorators
+    if not loader.loaded:
+        return {}
+    port = loader.get()
+    while not hasattr(port, getter):
+        port = getattr(port, "llm", None) or getattr(port, "embeddings", None)
+        if port is None:
+            return {}
+    return getattr(port, getter)()
+
+
+def _reference_bytes(references: Any) -> int:
+    # A numpy matrix or torch tensor, or an IVF index made of several arrays
+    if hasattr(references, "nbytes"):
+        return int(references.nbytes)
+    return sum(int(value.nbytes) for value in vars(references).values() if hasattr(value, "nbytes"))
+
+
+def build_container(
+    plan: bool = False,
+    workers: Optional[int] = None,
+    batching: bool = False
+) -> ServiceContainer:
+    llm = LazyLLM(build_llm)
+    embedder = LazyEmbeddings(build_embeddings)
+
+    # Concurrent callers (the HTTP server) share forwards through micro-batching
+    batching_llm = batching_embeddings = None
+    llm_port: LLMPort = llm
+    embeddings_port: EmbeddingsPort = embedder
+    if batching:
+        scheduler_config = SchedulerConfig()
+        llm_port = batching_llm = BatchingLLM(llm, scheduler_config)
+        embeddings_port = batching_embeddings = BatchingEmbeddings(embedder, scheduler_config)
+
+    parse_service = ParseService()
+    planner = VerificationPlanner() if plan else None
+    # Prepared reference matrices and indexes, bounded by their array sizes
+    reference_cache = ByteBoundedLRUCache(
+        max_bytes=EmbeddingsConfig().reference_cache_memory_bytes,
+        sizeof=_reference_bytes
+    )
+    verifier_service = VerifierService(
+        embeddings_port, llm_port, planner, max_workers=workers, reference_cache=reference_cache
+    )
+    metrics_service = MetricsService()
+
+    generate_use_case = GenerateTextUseCase(llm_port)
+    parse_use_case = ParseGeneratedOutputUseCase(parse_service)
+    verify_use_case = VerifyTextUseCase(verifier_service)
+    return ServiceContainer(
+        llm=llm,
+        embedder=embedder,
+        generate_use_case=generate_use_case,
+        parse_use_case=parse_use_case,
+        verify_use_case=verify_use_case,
+        pipeline_use_case=ExecutePipelineUseCase(
+            generate_use_case, parse_use_case, verify_use_case
+        ),
+        benchmark_use_case=RunBenchmarkUseCase(verifier_service, metrics_service),
+        batching_llm=batching_llm,
+        batching_embeddings=batching_embeddings
+    )
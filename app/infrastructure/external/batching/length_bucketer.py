@@ -0,0 +1,101 @@
+# infrastructure/external/batching/length_bucketer.py
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass
+class BucketingStats:
+    batches: int = 0
+    items: int = 0
+    real_tokens: int = 0
+    padded_tokens: int = 0
+    naive_padded_tokens: int = 0
+
+    @property
+    def padding_tokens(self) -> int:
+        return self.padded_tokens - self.real_tokens
+
+    @property
+    def padding_avoided(self) -> int:
+        return self.naive_padded_tokens - self.padded_tokens
+
+    @property
+    def padding_ratio(self) -> float:
+        if self.padded_tokens == 0:
+            return 0.0
+        return self.padding_tokens / self.padded_tokens
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "real_tokens": self.real_tokens,
+            "padded_tokens": self.padded_tokens,
+            "naive_padded_tokens": self.naive_padded_tokens,
+            "padding_tokens": self.padding_tokens,
+            "padding_avoided": self.padding_avoided,
+            "padding_ratio": self.padding_ratio
+        }
+
+
+class LengthBucketer:
+    """
+    Groups inputs of similar token length into batches whose padded size
+    (batch length x longest member) stays under a token budget.
+    """
+
+    def __init__(self, max_tokens: int, max_batch_size: Optional[int] = None):
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
+        self.stats = BucketingStats()
+
+    def plan(self, lengths: List[int]) -> List[List[int]]:
+        """
+        Split input indices into length-sorted buckets.
+
+        Args:
+            lengths: Token length of every input, in original order
+
+        Returns:
+            List of buckets, each a list of indices into `lengths`
+        """
+        order = sorted(range(len(lengths)), key=lengths.__getitem__)
+        buckets: List[List[int]] = []
+        current: List[int] = []
+
+        for index in order:
+            # Inputs are visited shortest first, so the newcomer sets the padded width
+            width = max(lengths[index], 1)
+            full = self.max_batch_size is not None and len(current) >= self.max_batch_size
+            if current and (full or (len(current) + 1) * width > self.max_tokens):
+                buckets.append(current)
+                current = []
+            current.append(index)
+
+        if current:
+            buckets.append(current)
+
+        self._record(lengths, buckets)
+        return buckets
+
+    def reset_stats(self) -> None:
+        self.stats = BucketingStats()
+
+    def _record(self, lengths: List[int], buckets: List[List[int]]) -> None:
+        if not buckets:
+            return
+
+        self.stats.batches += len(buckets)
+        self.stats.items += len(lengths)
+        self.stats.real_tokens += sum(lengths)
+        self.stats.padded_tokens += sum(
+            len(bucket) * max(lengths[i] for i in bucket) for bucket in buckets
+        )
+
+        # Baseline: fixed-size batches in arrival order
+        naive_size = self.max_batch_size or max(len(bucket) for bucket in buckets)
+        for i in range(0, len(lengths), naive_size):
+            chunk = lengths[i:i + naive_size]
+            self.stats.naive_padded_tokens += len(chunk) * max(chunk)
\ No newline at end of file
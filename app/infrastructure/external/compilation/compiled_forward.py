@@ -0,0 +1,154 @@
+# infrastructure/external/compilation/compiled_forward.py
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+import torch
+
+
+@dataclass
+class CompileStats:
+    compiled_calls: int = 0
+    eager_calls: int = 0
+    oversized_calls: int = 0
+    fallbacks: int = 0
+    compile_time: float = 0.0
+    padded_tokens: int = 0
+    real_tokens: int = 0
+    shapes: Set[Tuple[int, int]] = field(default_factory=set)
+    disabled_reason: Optional[str] = None
+
+    @property
+    def padding_overhead(self) -> float:
+        total = self.padded_tokens + self.real_tokens
+        return self.padded_tokens / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "compiled_calls": self.compiled_calls,
+            "eager_calls": self.eager_calls,
+            "oversized_calls": self.oversized_calls,
+            "fallbacks": self.fallbacks,
+            "compile_time": self.compile_time,
+            "compiled_shapes": sorted(self.shapes),
+            "padding_overhead": self.padding_overhead,
+            "disabled_reason": self.disabled_reason
+        }
+
+
+class CompiledForward:
+    """
+    Forward pass through torch.compile with inputs padded to fixed shapes.
+
+    A compiled graph is specialised to its input shapes, so every new
+    (batch, length) pair would recompile. Rows are padded up to the next
+    of `batch_sizes` by repeating the last row, and sequences up to the
+    next of `lengths` on `padding_side`, which keeps the number of graphs
+    bounded. Outputs are cut back to the real rows and positions. Inputs
+    longer or wider than the largest bucket run eagerly, and any error
+    from the compiled call switches this forward back to eager for good.
+    With `enabled` off every call goes straight to the model.
+    """
+
+    # Padding value per input; input_ids take the pad token
+    _PAD_VALUES = {"attention_mask": 0, "token_type_ids": 0, "position_ids": 0}
+
+    def __init__(
+        self,
+        model,
+        enabled: bool,
+        lengths: List[int],
+        batch_sizes: List[int],
+        pad_token_id: int,
+        padding_side: str = "right",
+        mode: str = "default"
+    ):
+        self.model = model
+        self.lengths = sorted(lengths)
+        self.batch_sizes = sorted(batch_sizes)
+        self.pad_token_id = pad_token_id
+        self.padding_side = padding_side
+        self.stats = CompileStats()
+        self.compiled = None
+        if enabled:
+            try:
+                # One graph per (batch, length) bucket; dynamo keeps only 8 by default
+                torch._dynamo.config.cache_size_limit = max(
+                    torch._dynamo.config.cache_size_limit, len(self.lengths) * len(self.batch_sizes)
+                )
+                self.compiled = torch.compile(model, mode=mode, dynamic=False)
+            except Exception as e:
+                self.stats.disabled_reason = f"torch.compile unavailable: {e}"
+
+    @property
+    def enabled(self) -> bool:
+        return self.compiled is not None
+
+    def __call__(self, **inputs):
+        if self.compiled is None:
+            return self.model(**inputs)
+
+        rows, length = inputs["input_ids"].shape
+        target_rows = self._bucket(self.batch_sizes, rows)
+        target_length = self._bucket(self.lengths, length)
+        if target_rows is None or target_length is None:
+            self.stats.oversized_calls += 1
+            self.stats.eager_calls += 1
+            return self.model(**inputs)
+
+        padded = {
+            key: self._pad(value, self._PAD_VALUES.get(key, self.pad_token_id), target_rows, target_length)
+            if isinstance(value, torch.Tensor) and value.shape[:2] == (rows, length) else value
+            for key, value in inputs.items()
+        }
+
+        shape = (target_rows, target_length)
+        first_call = shape not in self.stats.shapes
+        start = time.perf_counter()
+        try:
+            output = self.compiled(**padded)
+        except Exception as e:
+            # Unsupported ops or a failed backend: stay eager from here on
+            self.compiled = None
+            self.stats.fallbacks += 1
+            self.stats.disabled_reason = f"{type(e).__name__}: {e}"
+            self.stats.eager_calls += 1
+            return self.model(**inputs)
+
+        if first_call:
+            self.stats.shapes.add(shape)
+            self.stats.compile_time += time.perf_counter() - start
+        self.stats.compiled_calls += 1
+        self.stats.real_tokens += rows * length
+        self.stats.padded_tokens += target_rows * target_length - rows * length
+        return self._unpad(output, rows, length, shape)
+
+    def get_stats(self) -> Dict[str, float]:
+        return {**self.stats.to_dict(), "enabled": self.enabled}
+
+    @staticmethod
+    def _bucket(sizes: List[int], value: int) -> Optional[int]:
+        for size in sizes:
+            if size >= value:
+                return size
+        return None
+
+    def _pad(self, tensor: torch.Tensor, value: int, rows: int, length: int) -> torch.Tensor:
+        extra = length - tensor.shape[1]
+        if extra:
+            padding = torch.full(
+                (tensor.shape[0], extra) + tuple(tensor.shape[2:]),
+                value, dtype=tensor.dtype, device=tensor.device
+            )
+            parts = [padding, tensor] if self.padding_side == "left" else [tensor, padding]
+            tensor = torch.cat(parts, dim=1)
+        if rows > tensor.shape[0]:
+            # Repeat a real row so the filler rows never see an all-masked input
+            tensor = torch.cat([tensor, tensor[-1:].expand(rows - tensor.shape[0], *tensor.shape[1:])])
+        return tensor
+
+    def _unpad(self, output, rows: int, length: int, shape: Tuple[int, int]):
+        positions = slice(-length, None) if self.padding_side == "left" else slice(0, length)
+        for key, value in list(output.items()):
+            if isinstance(value, torch.Tensor) and value.dim() >= 2 and tuple(value.shape[:2]) == shape:
+                output[key] = value[:rows, positions]
+        return output
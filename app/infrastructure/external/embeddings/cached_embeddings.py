@@ -0,0 +1,193 @@
+# infrastructure/external/embeddings/cached_embeddings.py
+import hashlib
+import io
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import numpy as np
+from domain.ports.embeddings_port import EmbeddingsPort
+from domain.model.value_objects.similarity_score import SimilarityScore
+from infrastructure.cache.lru_cache import ByteBoundedLRUCache
+from infrastructure.cache.sqlite_store import SqliteBlobStore
+from infrastructure.external.embeddings.embeddings_config import EmbeddingsConfig
+from infrastructure.external.precision.effective_precision import effective_precision
+
+
+@dataclass
+class EmbeddingCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.memory_hits + self.disk_hits) / total
+
+
+class CachedEmbeddings(EmbeddingsPort):
+    """
+    Content-addressed embedding cache in front of another EmbeddingsPort.
+
+    Vectors are looked up in a byte-bounded in-memory LRU first, then in an
+    optional SQLite store shared across processes, and only the remaining
+    texts are sent to the wrapped port in a single batched call.
+    """
+
+    def __init__(
+        self,
+        embeddings: EmbeddingsPort,
+        config: Optional[EmbeddingsConfig] = None
+    ):
+        self.embeddings = embeddings
+        self.config = config or EmbeddingsConfig()
+        self.model_name = self.config.model_name
+        # Vectors from an fp32 and an int8 model must never share a key
+        self.precision = effective_precision(embeddings, self.config.precision)
+        self.stats = EmbeddingCacheStats()
+        self.memory = ByteBoundedLRUCache(
+            max_bytes=self.config.cache_memory_bytes,
+            sizeof=lambda vector: vector.nbytes
+        )
+        self.disk = (
+            SqliteBlobStore(self.config.cache_path, table="embeddings")
+            if self.config.cache_path else None
+        )
+        self.matrix_disk = (
+            SqliteBlobStore(self.config.cache_path, table="reference_matrices")
+            if self.config.cache_path else None
+        )
+
+    def get_similarity(self, text1: str, text2: str) -> SimilarityScore:
+        vectors = self._lookup([text1, text2])
+        return SimilarityScore(
+            value=self._cosine(vectors[0], vectors[1]),
+            method=self.model_name,
+            reference_text=text1,
+            compared_text=text2
+        )
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self._lookup([text])[0].tolist()
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [vector.tolist() for vector in self._lookup(texts)]
+
+    def batch_similarities(
+        self,
+        reference_text: str,
+        comparison_texts: List[str]
+    ) -> List[SimilarityScore]:
+        if not comparison_texts:
+            return []
+
+        vectors = self._lookup([reference_text] + comparison_texts)
+        reference, comparisons = vectors[0], np.stack(vectors[1:])
+        norms = np.linalg.norm(comparisons, axis=1) * np.linalg.norm(reference)
+        values = (comparisons @ reference) / np.maximum(norms, 1e-12)
+
+        return [
+            SimilarityScore(
+                value=float(value),
+                method=self.model_name,
+                reference_text=reference_text,
+                compared_text=text
+            )
+            for text, value in zip(comparison_texts, values)
+        ]
+
+    def prepare_references(self, reference_texts: List[str]) -> np.ndarray:
+        # Whole reference matrices are stored too, so a later run loads them in one read
+        key = self._key("\0".join(reference_texts))
+        if self.matrix_disk is not None:
+            blob = self.matrix_disk.get(key)
+            if blob is not None:
+                return np.load(io.BytesIO(blob))
+
+        matrix = np.ascontiguousarray(self._normalize(np.stack(self._lookup(reference_texts))))
+        if self.matrix_disk is not None:
+            buffer = io.BytesIO()
+            np.save(buffer, matrix)
+            self.matrix_disk.put(key, buffer.getvalue())
+        return matrix
+
+    def reference_similarities(
+        self,
+        references: np.ndarray,
+        texts: List[str],
+        top_k: Optional[int] = None
+    ) -> List[List[float]]:
+        if not texts:
+            return []
+        candidates = self._normalize(np.stack(self._lookup(texts)))
+        # float32 rounding can push identical vectors just past 1.0
+        scores = np.clip(candidates @ references.T, -1.0, 1.0)
+        if top_k is not None:
+            scores = -np.sort(-scores, axis=1)[:, :top_k]
+        return scores.tolist()
+
+    def get_cache_stats(self) -> Dict[str, float]:
+        return {
+            "memory_hits": self.stats.memory_hits,
+            "disk_hits": self.stats.disk_hits,
+            "misses": self.stats.misses,
+            "hit_rate": self.stats.hit_rate,
+            "evictions": self.memory.evictions,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.current_bytes
+        }
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{self.precision}:{self.config.max_length}:{digest}"
+
+    def _lookup(self, texts: List[str]) -> List[np.ndarray]:
+        keys = [self._key(text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
+        pending: Dict[str, str] = {}
+
+        # Tier 1: in-memory LRU
+        for key, text in zip(keys, texts):
+            if key in found or key in pending:
+                continue
+            vector = self.memory.get(key)
+            if vector is not None:
+                found[key] = vector
+                self.stats.memory_hits += 1
+            else:
+                pending[key] = text
+
+        # Tier 2: shared on-disk store
+        if pending and self.disk is not None:
+            for key, blob in self.disk.get_many(pending.keys()).items():
+                vector = np.frombuffer(blob, dtype=np.float32)
+                found[key] = vector
+                self.memory.put(key, vector)
+                del pending[key]
+                self.stats.disk_hits += 1
+
+        # Misses: one batched call to the wrapped port
+        if pending:
+            self.stats.misses += len(pending)
+            computed = self.embeddings.get_embeddings(list(pending.values()))
+            new_blobs = {}
+            for key, values in zip(pending.keys(), computed):
+                vector = np.asarray(values, dtype=np.float32)
+                found[key] = vector
+                self.memory.put(key, vector)
+                new_blobs[key] = vector.tobytes()
+            if self.disk is not None:
+                self.disk.put_many(new_blobs)
+
+        return [found[key] for key in keys]
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+    @staticmethod
+    def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+        denominator = max(float(np.linalg.norm(a) * np.linalg.norm(b)), 1e-12)
+        return float(np.dot(a, b) / denominator)
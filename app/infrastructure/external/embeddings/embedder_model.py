@@ -1,36 +1,64 @@
 # infrastructure/external/embeddings/embedder_model.py
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 import torch
 import torch.nn.functional as F
 from transformers import AutoModel, AutoTokenizer
 from domain.ports.embeddings_port import EmbeddingsPort
 from domain.model.value_objects.similarity_score import SimilarityScore
+from infrastructure.external.embeddings.embeddings_config import EmbeddingsConfig
+from infrastructure.external.batching.length_bucketer import LengthBucketer
+from infrastructure.external.precision.model_precision import apply_precision
+from infrastructure.external.loading.model_loader import load_pretrained, warm_up
+from infrastructure.external.compilation.compiled_forward import CompiledForward
 
 class EmbedderModel(EmbeddingsPort):
     def __init__(
         self,
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        config: Optional[EmbeddingsConfig] = None
     ):
-        self.model_name = model_name
-        self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
-        
+        self.config = config or EmbeddingsConfig(model_name=model_name, device=device)
+        self.model_name = self.config.model_name
+        self.device = self.config.device or ('cuda' if torch.cuda.is_available() else 'cpu')
+        self.bucketer = LengthBucketer(
+            max_tokens=self.config.max_batch_tokens,
+            max_batch_size=self.config.batch_size
+        )
+
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModel.from_pretrained(model_name)
-            self.model.to(self.device)
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self.model, self.loading = load_pretrained(
+                AutoModel, self.model_name, self.device, self.config
+            )
+            self.model, self.precision = apply_precision(
+                self.model, self.config.precision, self.device, unit="texts"
+            )
+            warm_up(
+                self.model, self.config.warmup_lengths, self.tokenizer.pad_token_id or 0, self.device, self.loading
+            )
         except Exception as e:
             raise e
 
+        self.forward = CompiledForward(
+            self.model,
+            enabled=self.config.use_compile,
+            lengths=self.config.compile_lengths,
+            batch_sizes=self.config.compile_batch_sizes,
+            pad_token_id=self.tokenizer.pad_token_id or 0,
+            padding_side=self.tokenizer.padding_side,
+            mode=self.config.compile_mode
+        )
+
     def get_similarity(self, text1: str, text2: str) -> SimilarityScore:
         try:
-            emb1 = self._get_embedding(text1)
-            emb2 = self._get_embedding(text2)
-            
-            # Calculate cosine similarity
-            similarity = F.cosine_similarity(emb1, emb2).item()
-            
+            # Both texts go through a single forward pass
+            embeddings = self._get_embeddings([text1, text2])
+
+            # Embeddings are L2-normalised, so cosine similarity is a dot product
+            similarity = torch.dot(embeddings[0], embeddings[1]).item()
+
             return SimilarityScore(
                 value=similarity,
                 method=self.model_name,
@@ -47,56 +75,122 @@ class EmbedderModel(EmbeddingsPort):
         except Exception as e:
             raise e
 
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        try:
+            if not texts:
+                return []
+            return self._get_embeddings(texts).tolist()
+        except Exception as e:
+            raise e
+
     def batch_similarities(
         self,
         reference_text: str,
         comparison_texts: List[str]
     ) -> List[SimilarityScore]:
         try:
+            if not comparison_texts:
+                return []
+
             ref_embedding = self._get_embedding(reference_text)
-            similarities = []
-            
-            # Process in batches
-            batch_size = 32
-            for i in range(0, len(comparison_texts), batch_size):
-                batch = comparison_texts[i:i + batch_size]
-                batch_embeddings = torch.cat([
-                    self._get_embedding(text) for text in batch
-                ])
-                
-                # Calculate similarities for the batch
-                batch_similarities = F.cosine_similarity(
-                    batch_embeddings,
-                    ref_embedding.expand(len(batch), -1)
+            comparison_embeddings = self._get_embeddings(comparison_texts)
+
+            # [N, D] @ [D] -> [N]
+            values = torch.mv(comparison_embeddings, ref_embedding[0]).tolist()
+
+            return [
+                SimilarityScore(
+                    value=value,
+                    method=self.model_name,
+                    reference_text=reference_text,
+                    compared_text=text
                 )
-                
-                # Create SimilarityScore objects
-                for text, sim in zip(batch, batch_similarities):
-                    similarities.append(SimilarityScore(
-                        value=sim.item(),
-                        method=self.model_name,
-                        reference_text=reference_text,
-                        compared_text=text
-                    ))
-            
-            return similarities
+                for text, value in zip(comparison_texts, values)
+            ]
         except Exception as e:
             raise e
 
+    def prepare_references(self, reference_texts: List[str]) -> torch.Tensor:
+        try:
+            # Normalised [R, D] matrix that stays on the model's device
+            return self._get_embeddings(reference_texts)
+        except Exception as e:
+            raise e
+
+    def reference_similarities(
+        self,
+        references: torch.Tensor,
+        texts: List[str],
+        top_k: Optional[int] = None
+    ) -> List[List[float]]:
+        try:
+            if not texts:
+                return []
+            # [N, D] @ [D, R] -> [N, R]
+            scores = self._get_embeddings(texts) @ references.T
+            # float32 rounding can push identical vectors just past 1.0
+            scores = scores.clamp(-1.0, 1.0)
+            if top_k is not None:
+                # Select on the device; only k values per text come back
+                scores = torch.topk(scores, min(top_k, scores.shape[1]), dim=1).values
+            return scores.tolist()
+        except Exception as e:
+            raise e
+
+    def get_batching_stats(self) -> Dict[str, float]:
+        return self.bucketer.stats.to_dict()
+
+    def get_precision_stats(self) -> Dict[str, float]:
+        return self.precision.to_dict()
+
+    def get_load_stats(self) -> Dict[str, float]:
+        return self.loading.to_dict()
+
+    def get_compile_stats(self) -> Dict[str, float]:
+        return self.forward.get_stats()
+
     def _get_embedding(self, text: str) -> torch.Tensor:
-        # Tokenize and prepare input
-        tokens = self.tokenizer(
-            text,
-            max_length=512,
+        return self._get_embeddings([text])
+
+    def _get_embeddings(self, texts: List[str]) -> torch.Tensor:
+        start_time = datetime.now()
+        # Tokenize once without padding so inputs can be bucketed by length
+        encodings = self.tokenizer(
+            texts,
+            max_length=self.config.max_length,
+            truncation=True
+        )
+        lengths = [len(ids) for ids in encodings["input_ids"]]
+        buckets = self.bucketer.plan(lengths)
+
+        # One padded forward pass per bucket
+        outputs = []
+        for bucket in buckets:
+            features = [{key: encodings[key][i] for key in encodings.keys()} for i in bucket]
+            outputs.append(self._forward(features))
+
+        # Scatter bucket rows back into the original order
+        order = torch.tensor([i for bucket in buckets for i in bucket], device=self.device)
+        stacked = torch.cat(outputs)
+        embeddings = torch.empty_like(stacked)
+        embeddings[order] = stacked
+        elapsed = (datetime.now() - start_time).total_seconds()
+        self.precision.record(len(texts), elapsed)
+        self.loading.record_request(elapsed)
+        return embeddings
+
+    def _forward(self, features: List[Dict[str, List[int]]]) -> torch.Tensor:
+        # Pad the bucket to its longest member
+        tokens = self.tokenizer.pad(
+            features,
             padding=True,
-            truncation=True,
             return_tensors='pt'
         ).to(self.device)
-        
+
         # Get embeddings
         with torch.no_grad():
-            output = self.model(**tokens)
-        
-        # Use CLS token embedding and normalize
-        embedding = F.normalize(output.last_hidden_state[:, 0], p=2, dim=1)
+            output = self.forward(**tokens)
+
+        # Use CLS token embedding and normalize -> [N, D], in fp32 whatever the model runs in
+        embedding = F.normalize(output.last_hidden_state[:, 0].float(), p=2, dim=1)
         return embedding
\ No newline at end of file
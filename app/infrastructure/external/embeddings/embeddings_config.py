@@ -1,12 +1,34 @@
 # infrastructure/external/embeddings/embeddings_config.py
-from typing import Optional
+from typing import List, Literal, Optional
 from pydantic import BaseSettings
 
 class EmbeddingsConfig(BaseSettings):
     model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
     device: Optional[str] = None
+    # fp32, bf16 where the device supports it, or dynamic int8 on CPU
+    precision: Literal["fp32", "bf16", "int8"] = "fp32"
     max_length: int = 512
+    use_safetensors: bool = True
+    low_cpu_mem_usage: bool = True
+    num_threads: Optional[int] = None
+    num_interop_threads: Optional[int] = None
+    # Forward passes run at load time; empty to skip warm-up
+    warmup_lengths: List[int] = [16, 128]
+    # torch.compile for steady-state forwards, padded to fixed shape buckets
+    use_compile: bool = False
+    compile_mode: Literal["default", "reduce-overhead", "max-autotune"] = "default"
+    compile_lengths: List[int] = [32, 64, 128, 256, 512]
+    compile_batch_sizes: List[int] = [1, 2, 4, 8, 16, 32]
     batch_size: int = 32
+    max_batch_tokens: int = 8192
+    # Prepared reference sets the verifier keeps between requests
+    reference_cache_memory_bytes: int = 64 * 1024 * 1024
+    cache_memory_bytes: int = 64 * 1024 * 1024
+    cache_path: Optional[str] = None
+    ann_min_references: int = 20000
+    ann_nlist: Optional[int] = None
+    ann_nprobe: int = 16
+    ann_index_dir: Optional[str] = None
 
     class Config:
         env_prefix = "EMBEDDINGS_"
\ No newline at end of file
@@ -0,0 +1,99 @@
+# infrastructure/external/embeddings/indexed_embeddings.py
+import hashlib
+import os
+from typing import Any, List, Optional
+import numpy as np
+from domain.ports.embeddings_port import EmbeddingsPort
+from domain.model.value_objects.similarity_score import SimilarityScore
+from infrastructure.external.embeddings.embeddings_config import EmbeddingsConfig
+from infrastructure.external.embeddings.ivf_index import IVFIndex
+from infrastructure.external.precision.effective_precision import effective_precision
+
+
+class IndexedEmbeddings(EmbeddingsPort):
+    """
+    Serves large reference sets from an IVF nearest-neighbour index.
+
+    Reference sets with at least `ann_min_references` texts are indexed
+    (and persisted under `ann_index_dir` when set); smaller sets and every
+    other call go straight to the wrapped port.
+    """
+
+    def __init__(
+        self,
+        embeddings: EmbeddingsPort,
+        config: Optional[EmbeddingsConfig] = None
+    ):
+        self.embeddings = embeddings
+        self.config = config or EmbeddingsConfig()
+        self.precision = effective_precision(embeddings, self.config.precision)
+
+    def get_similarity(self, text1: str, text2: str) -> SimilarityScore:
+        return self.embeddings.get_similarity(text1, text2)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.embeddings.get_embedding(text)
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.get_embeddings(texts)
+
+    def batch_similarities(
+        self,
+        reference_text: str,
+        comparison_texts: List[str]
+    ) -> List[SimilarityScore]:
+        return self.embeddings.batch_similarities(reference_text, comparison_texts)
+
+    def prepare_references(self, reference_texts: List[str]) -> Any:
+        if len(reference_texts) < self.config.ann_min_references:
+            return self.embeddings.prepare_references(reference_texts)
+
+        directory = self._index_directory(reference_texts)
+        if directory and IVFIndex.exists(directory):
+            return IVFIndex.load(directory, nprobe=self.config.ann_nprobe)
+
+        vectors = np.asarray(self.embeddings.get_embeddings(reference_texts), dtype=np.float32)
+        index = IVFIndex.build(
+            vectors,
+            nlist=self.config.ann_nlist,
+            nprobe=self.config.ann_nprobe
+        )
+        if directory:
+            index.save(directory)
+        return index
+
+    def reference_similarities(
+        self,
+        references: Any,
+        texts: List[str],
+        top_k: Optional[int] = None
+    ) -> List[List[float]]:
+        if not isinstance(references, IVFIndex):
+            return self.embeddings.reference_similarities(references, texts, top_k=top_k)
+        if not texts:
+            return []
+
+        queries = np.asarray(self.embeddings.get_embeddings(texts), dtype=np.float32)
+        if top_k is None:
+            return np.clip(references.search_exact(queries), -1.0, 1.0).tolist()
+
+        scores, ids = references.search(queries, top_k)
+        rows = [row[row_ids >= 0] for row, row_ids in zip(scores, ids)]
+
+        # With many duplicate references every probed list can be empty;
+        # those queries are scored exactly so no row comes back without scores
+        empty = [i for i, row in enumerate(rows) if len(row) == 0]
+        if empty:
+            exact = -np.sort(-references.search_exact(queries[empty]), axis=1)[:, :top_k]
+            for i, row in zip(empty, exact):
+                rows[i] = row
+        return [np.clip(row, -1.0, 1.0).tolist() for row in rows]
+
+    def _index_directory(self, reference_texts: List[str]) -> Optional[str]:
+        if not self.config.ann_index_dir:
+            return None
+        digest = hashlib.sha256()
+        digest.update(f"{self.config.model_name}:{self.precision}:{self.config.max_length}".encode("utf-8"))
+        for text in reference_texts:
+            digest.update(b"\0" + text.encode("utf-8"))
+        return os.path.join(self.config.ann_index_dir, digest.hexdigest())
@@ -0,0 +1,163 @@
+# infrastructure/external/embeddings/ivf_index.py
+import json
+import math
+from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
+
+
+class IVFIndex:
+    """
+    Inverted-file approximate nearest-neighbour index over L2-normalised
+    vectors, scored by inner product (cosine similarity).
+
+    Vectors are clustered with spherical k-means and stored grouped by
+    cluster, so a query only scans the `nprobe` clusters whose centroids
+    are closest to it.
+    """
+
+    _FILES = ("centroids", "vectors", "ids", "offsets")
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        vectors: np.ndarray,
+        ids: np.ndarray,
+        offsets: np.ndarray,
+        nprobe: int = 8
+    ):
+        self.centroids = centroids
+        self.vectors = vectors
+        self.ids = ids
+        self.offsets = offsets
+        self.nprobe = min(nprobe, len(centroids))
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        iterations: int = 10,
+        seed: int = 0
+    ) -> "IVFIndex":
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        n = len(vectors)
+        nlist = max(1, min(nlist or int(4 * math.sqrt(n)), n))
+        rng = np.random.default_rng(seed)
+
+        # Train centroids on a sample; ~64 points per list is plenty for k-means
+        sample_size = min(n, nlist * 64)
+        sample = vectors[rng.choice(n, size=sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignment = _assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            counts = np.bincount(assignment, minlength=nlist)
+
+            # Re-seed empty lists with random sample points
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+            centroids = _normalize(sums)
+
+        assignment = _assign(vectors, centroids)
+        order = np.argsort(assignment, kind="stable")
+        offsets = np.searchsorted(assignment[order], np.arange(nlist + 1)).astype(np.int64)
+
+        return cls(
+            centroids=centroids,
+            vectors=np.ascontiguousarray(vectors[order]),
+            ids=order.astype(np.int64),
+            offsets=offsets,
+            nprobe=nprobe
+        )
+
+    def search(self, queries: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate top-k search.
+
+        Args:
+            queries: [Q, D] query vectors
+            top_k: Number of neighbours per query
+
+        Returns:
+            (scores, ids), both [Q, k] and sorted by descending score. Rows
+            are padded with -inf / -1 when the probed lists hold fewer than
+            k vectors.
+        """
+        queries = _normalize(np.asarray(queries, dtype=np.float32))
+        coarse = queries @ self.centroids.T
+        probes = np.argpartition(-coarse, self.nprobe - 1, axis=1)[:, :self.nprobe]
+
+        scores = np.full((len(queries), top_k), -np.inf, dtype=np.float32)
+        ids = np.full((len(queries), top_k), -1, dtype=np.int64)
+
+        for row, (query, lists) in enumerate(zip(queries, probes)):
+            positions = np.concatenate([
+                np.arange(self.offsets[l], self.offsets[l + 1]) for l in lists
+            ])
+            if len(positions) == 0:
+                continue
+            candidate_scores = self.vectors[positions] @ query
+            k = min(top_k, len(positions))
+            best = np.argpartition(-candidate_scores, k - 1)[:k]
+            best = best[np.argsort(-candidate_scores[best])]
+            scores[row, :k] = candidate_scores[best]
+            ids[row, :k] = self.ids[positions[best]]
+
+        return scores, ids
+
+    def search_exact(self, queries: np.ndarray) -> np.ndarray:
+        """Brute-force scores against every vector, [Q, N] in original id order."""
+        queries = _normalize(np.asarray(queries, dtype=np.float32))
+        scores = np.empty((len(queries), len(self)), dtype=np.float32)
+        scores[:, self.ids] = queries @ self.vectors.T
+        return scores
+
+    def save(self, directory: str) -> None:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in self._FILES:
+            np.save(path / f"{name}.npy", getattr(self, name))
+        with open(path / "meta.json", "w", encoding="utf-8") as f:
+            json.dump({"nprobe": self.nprobe, "size": len(self), "nlist": self.nlist}, f)
+
+    @classmethod
+    def load(cls, directory: str, nprobe: Optional[int] = None, mmap: bool = True) -> "IVFIndex":
+        path = Path(directory)
+        with open(path / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in cls._FILES
+        }
+        # Centroids and offsets are small and hit on every query
+        arrays["centroids"] = np.asarray(arrays["centroids"])
+        arrays["offsets"] = np.asarray(arrays["offsets"])
+        return cls(nprobe=nprobe or meta["nprobe"], **arrays)
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        return (Path(directory) / "meta.json").exists()
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+    assignment = np.empty(len(vectors), dtype=np.int64)
+    for i in range(0, len(vectors), chunk_size):
+        assignment[i:i + chunk_size] = np.argmax(vectors[i:i + chunk_size] @ centroids.T, axis=1)
+    return assignment
\ No newline at end of file
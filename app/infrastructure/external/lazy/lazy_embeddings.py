@@ -0,0 +1,45 @@
+# infrastructure/external/lazy/lazy_embeddings.py
+from typing import Any, Callable, List, Optional
+from domain.ports.embeddings_port import EmbeddingsPort
+from domain.model.value_objects.similarity_score import SimilarityScore
+from infrastructure.external.lazy.lazy_loader import LazyLoader
+
+
+class LazyEmbeddings(EmbeddingsPort):
+    """
+    EmbeddingsPort that builds the real adapter the first time a method is called.
+    """
+
+    def __init__(self, factory: Callable[[], EmbeddingsPort]):
+        self.loader = LazyLoader("embeddings", factory)
+
+    @property
+    def loaded(self) -> bool:
+        return self.loader.loaded
+
+    def get_similarity(self, text1: str, text2: str) -> SimilarityScore:
+        return self.loader.get().get_similarity(text1, text2)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.loader.get().get_embedding(text)
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self.loader.get().get_embeddings(texts)
+
+    def batch_similarities(
+        self,
+        reference_text: str,
+        comparison_texts: List[str]
+    ) -> List[SimilarityScore]:
+        return self.loader.get().batch_similarities(reference_text, comparison_texts)
+
+    def prepare_references(self, reference_texts: List[str]) -> Any:
+        return self.loader.get().prepare_references(reference_texts)
+
+    def reference_similarities(
+        self,
+        references: Any,
+        texts: List[str],
+        top_k: Optional[int] = None
+    ) -> List[List[float]]:
+        return self.loader.get().reference_similarities(references, texts, top_k)
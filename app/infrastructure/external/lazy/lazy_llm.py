@@ -0,0 +1,69 @@
+# infrastructure/external/lazy/lazy_llm.py
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from domain.ports.llm_port import LLMPort
+from domain.model.entities.generation import GeneratedResult, GenerationChunk
+from infrastructure.external.lazy.lazy_loader import LazyLoader
+
+
+class LazyLLM(LLMPort):
+    """
+    LLMPort that builds the real adapter the first time a method is called.
+    """
+
+    def __init__(self, factory: Callable[[], LLMPort]):
+        self.loader = LazyLoader("llm", factory)
+
+    @property
+    def loaded(self) -> bool:
+        return self.loader.loaded
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> List[GeneratedResult]:
+        return self.loader.get().generate(
+            system_prompt, user_prompt, num_sequences, max_tokens, temperature, stop_sequences, seed
+        )
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> Iterator[GenerationChunk]:
+        return self.loader.get().generate_stream(
+            system_prompt, user_prompt, num_sequences, max_tokens, temperature, stop_sequences, seed
+        )
+
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> List[List[GeneratedResult]]:
+        return self.loader.get().generate_batch(
+            prompts, num_sequences, max_tokens, temperature, stop_sequences, seed
+        )
+
+    def next_token_probabilities(
+        self,
+        prompts: List[Tuple[str, str]],
+        choices: Dict[str, List[str]]
+    ) -> List[Dict[str, float]]:
+        return self.loader.get().next_token_probabilities(prompts, choices)
+
+    def get_token_count(self, text: str) -> int:
+        return self.loader.get().get_token_count(text)
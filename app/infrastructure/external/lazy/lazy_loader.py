@@ -0,0 +1,36 @@
+# infrastructure/external/lazy/lazy_loader.py
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyLoader(Generic[T]):
+    """
+    Builds an object on first use, exactly once, even under concurrent access.
+
+    Factories should import their heavy dependencies (torch, transformers)
+    inside the function body so nothing is imported until the first call.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        self.name = name
+        self.factory = factory
+        self.load_time: Optional[float] = None
+        self._instance: Optional[T] = None
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def get(self) -> T:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    start_time = datetime.now()
+                    instance = self.factory()
+                    self.load_time = (datetime.now() - start_time).total_seconds()
+                    self._instance = instance
+        return self._instance
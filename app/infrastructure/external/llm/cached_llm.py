@@ -0,0 +1,250 @@
+# infrastructure/external/llm/cached_llm.py
+import hashlib
+import json
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from domain.ports.llm_port import LLMPort
+from domain.model.entities.generation import GeneratedResult, GenerationMetadata, GenerationChunk
+from infrastructure.cache.lru_cache import ByteBoundedLRUCache
+from infrastructure.cache.sqlite_store import SqliteBlobStore
+from infrastructure.external.llm.llm_config import LLMConfig
+from infrastructure.external.precision.effective_precision import effective_precision
+
+
+@dataclass
+class GenerationCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    uncacheable: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.memory_hits + self.disk_hits) / total
+
+
+class CachedLLM(LLMPort):
+    """
+    Generation result cache in front of another LLMPort.
+
+    Only deterministic requests are cached: greedy decoding (temperature 0)
+    or sampling with an explicit seed, which InstructModel draws for each
+    prompt on its own and under its sampling lock. Results are keyed on the model name,
+    both prompts and every sampling parameter, and looked up in a
+    byte-bounded in-memory LRU, then in an optional SQLite store with a
+    TTL and size cap. Everything else passes straight through.
+    """
+
+    def __init__(self, llm: LLMPort, config: Optional[LLMConfig] = None):
+        self.llm = llm
+        self.config = config or LLMConfig()
+        self.model_name = self.config.model_name
+        # Generations from an fp32 and an int8 model must never share a key
+        self.precision = effective_precision(llm, self.config.precision)
+        self.stats = GenerationCacheStats()
+        self.memory = ByteBoundedLRUCache(
+            max_bytes=self.config.cache_memory_bytes,
+            sizeof=lambda entry: len(entry[1])
+        )
+        self.disk = (
+            SqliteBlobStore(
+                self.config.cache_path,
+                table="generations",
+                ttl_seconds=self.config.cache_ttl_seconds,
+                max_bytes=self.config.cache_max_disk_bytes
+            )
+            if self.config.cache_path else None
+        )
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> List[GeneratedResult]:
+        return self.generate_batch(
+            [(system_prompt, user_prompt)],
+            num_sequences=num_sequences,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop_sequences=stop_sequences,
+            seed=seed
+        )[0]
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> Iterator[GenerationChunk]:
+        params = (num_sequences, max_tokens, temperature, stop_sequences, seed)
+        if not self._cacheable(temperature, seed):
+            self.stats.uncacheable += 1
+            yield from self.llm.generate_stream(system_prompt, user_prompt, *params)
+            return
+
+        key = self._key(system_prompt, user_prompt, *params)
+        cached = self._lookup([key]).get(key)
+        if cached is not None:
+            # Replay a hit as one chunk per sequence
+            for row, result in enumerate(cached):
+                yield GenerationChunk(sequence_index=row, text=result.content)
+            for row, result in enumerate(cached):
+                yield GenerationChunk(sequence_index=row, text="", result=result)
+            return
+
+        results = []
+        for chunk in self.llm.generate_stream(system_prompt, user_prompt, *params):
+            if chunk.is_final:
+                results.append(chunk.result)
+            yield chunk
+        self._store({key: results})
+
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> List[List[GeneratedResult]]:
+        params = dict(
+            num_sequences=num_sequences,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop_sequences=stop_sequences,
+            seed=seed
+        )
+        if not self._cacheable(temperature, seed):
+            self.stats.uncacheable += len(prompts)
+            return self.llm.generate_batch(prompts, **params)
+
+        keys = [
+            self._key(system, user, num_sequences, max_tokens, temperature, stop_sequences, seed)
+            for system, user in prompts
+        ]
+        found = self._lookup(keys)
+
+        # Misses: one batched call to the wrapped port
+        pending: Dict[str, Tuple[str, str]] = {}
+        for key, prompt in zip(keys, prompts):
+            if key not in found and key not in pending:
+                pending[key] = prompt
+        if pending:
+            computed = self.llm.generate_batch(list(pending.values()), **params)
+            new_entries = dict(zip(pending.keys(), computed))
+            self._store(new_entries)
+            found.update(new_entries)
+
+        return [found[key] for key in keys]
+
+    def next_token_probabilities(
+        self,
+        prompts: List[Tuple[str, str]],
+        choices: Dict[str, List[str]]
+    ) -> List[Dict[str, float]]:
+        return self.llm.next_token_probabilities(prompts, choices)
+
+    def get_token_count(self, text: str) -> int:
+        return self.llm.get_token_count(text)
+
+    def get_cache_stats(self) -> Dict[str, float]:
+        return {
+            "memory_hits": self.stats.memory_hits,
+            "disk_hits": self.stats.disk_hits,
+            "misses": self.stats.misses,
+            "uncacheable": self.stats.uncacheable,
+            "hit_rate": self.stats.hit_rate,
+            "evictions": self.memory.evictions,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.current_bytes,
+            "disk_bytes": self.disk.total_bytes() if self.disk else 0
+        }
+
+    @staticmethod
+    def _cacheable(temperature: float, seed: Optional[int]) -> bool:
+        return temperature <= 0 or seed is not None
+
+    def _key(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int,
+        max_tokens: int,
+        temperature: float,
+        stop_sequences: Optional[List[str]],
+        seed: Optional[int]
+    ) -> str:
+        payload = json.dumps([
+            system_prompt, user_prompt, num_sequences, max_tokens,
+            temperature, stop_sequences or [], seed
+        ])
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{self.precision}:{digest}"
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[GeneratedResult]]:
+        found: Dict[str, List[GeneratedResult]] = {}
+        pending = []
+        now = time.time()
+
+        # Tier 1: in-memory LRU, honouring the same TTL as the disk store
+        for key in dict.fromkeys(keys):
+            entry = self.memory.get(key)
+            if entry is not None and not self._expired(entry[0], now):
+                found[key] = self._decode(entry[1])
+                self.stats.memory_hits += 1
+            else:
+                pending.append(key)
+
+        # Tier 2: shared on-disk store
+        if pending and self.disk is not None:
+            for key, blob in self.disk.get_many(pending).items():
+                found[key] = self._decode(blob)
+                self.memory.put(key, (now, blob))
+                self.stats.disk_hits += 1
+
+        self.stats.misses += len(pending) - sum(1 for key in pending if key in found)
+        return found
+
+    def _store(self, entries: Dict[str, List[GeneratedResult]]) -> None:
+        now = time.time()
+        blobs = {key: self._encode(results) for key, results in entries.items()}
+        for key, blob in blobs.items():
+            self.memory.put(key, (now, blob))
+        if self.disk is not None:
+            self.disk.put_many(blobs)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        ttl = self.config.cache_ttl_seconds
+        return ttl is not None and now - created_at > ttl
+
+    @staticmethod
+    def _encode(results: List[GeneratedResult]) -> bytes:
+        return json.dumps([asdict(result) for result in results], default=str).encode("utf-8")
+
+    @staticmethod
+    def _decode(blob: bytes) -> List[GeneratedResult]:
+        results = []
+        for item in json.loads(blob):
+            metadata = dict(item["metadata"])
+            metadata["timestamp"] = datetime.fromisoformat(metadata["timestamp"])
+            results.append(GeneratedResult(
+                content=item["content"],
+                metadata=GenerationMetadata(**metadata),
+                reference_data=item.get("reference_data")
+            ))
+        return results
@@ -0,0 +1,156 @@
+# infrastructure/external/llm/draft_assistant.py
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import local
+from typing import Dict, Iterator, Optional
+from transformers import AutoModelForCausalLM, AutoTokenizer
+from infrastructure.external.precision.model_precision import apply_precision
+from infrastructure.external.loading.model_loader import load_pretrained
+
+
+@dataclass
+class SpeculationStats:
+    assisted_calls: int = 0
+    assisted_tokens: int = 0
+    assisted_time: float = 0.0
+    plain_calls: int = 0
+    plain_tokens: int = 0
+    plain_time: float = 0.0
+    draft_tokens: int = 0
+    verify_steps: int = 0
+    fallbacks: int = 0
+
+    @property
+    def accepted_tokens(self) -> int:
+        # Each verification step keeps the accepted draft tokens plus one token
+        # of the target model's own
+        return max(self.assisted_tokens - self.verify_steps, 0)
+
+    @property
+    def acceptance_rate(self) -> float:
+        if self.draft_tokens == 0:
+            return 0.0
+        return min(self.accepted_tokens / self.draft_tokens, 1.0)
+
+    @property
+    def assisted_tokens_per_second(self) -> float:
+        return self.assisted_tokens / self.assisted_time if self.assisted_time else 0.0
+
+    @property
+    def plain_tokens_per_second(self) -> float:
+        return self.plain_tokens / self.plain_time if self.plain_time else 0.0
+
+    @property
+    def speedup(self) -> float:
+        if not self.plain_tokens_per_second:
+            return 0.0
+        return self.assisted_tokens_per_second / self.plain_tokens_per_second
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "assisted_calls": self.assisted_calls,
+            "assisted_tokens": self.assisted_tokens,
+            "plain_calls": self.plain_calls,
+            "plain_tokens": self.plain_tokens,
+            "draft_tokens": self.draft_tokens,
+            "accepted_tokens": self.accepted_tokens,
+            "acceptance_rate": self.acceptance_rate,
+            "assisted_tokens_per_second": self.assisted_tokens_per_second,
+            "plain_tokens_per_second": self.plain_tokens_per_second,
+            "speedup": self.speedup,
+            "fallbacks": self.fallbacks
+        }
+
+
+class DraftAssistant:
+    """
+    Small draft model for assisted (speculative) generation.
+
+    The draft proposes `draft_lookahead` tokens per step and the target model
+    verifies them in a single forward pass. Forward hooks on both models
+    count proposed tokens and verification steps, but only for forwards
+    made by the thread inside `tracking()`, so concurrent scoring and
+    plain generates on the shared target do not skew the acceptance rate.
+    The draft is loaded and converted like the target, from the same
+    config. A draft whose vocabulary differs from the target's cannot be
+    verified token by token and is left disabled.
+    """
+
+    def __init__(self, model_name: str, target_model, target_tokenizer, device: str, config):
+        self.model_name = model_name
+        self.stats = SpeculationStats()
+        self.model = None
+        self.loading = None
+        self.precision = None
+        self.disabled_reason: Optional[str] = None
+        self._local = local()
+
+        try:
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            if tokenizer.get_vocab() != target_tokenizer.get_vocab():
+                self.disabled_reason = "tokenizer mismatch"
+                return
+
+            self.model, self.loading = load_pretrained(AutoModelForCausalLM, model_name, device, config)
+            self.model, self.precision = apply_precision(self.model, config.precision, device, unit="tokens")
+        except Exception as e:
+            raise e
+
+        # Fixed lookahead instead of the default heuristic schedule
+        self.model.generation_config.num_assistant_tokens = config.draft_lookahead
+        self.model.generation_config.num_assistant_tokens_schedule = "constant"
+        self.model.register_forward_hook(self._count_draft)
+        target_model.register_forward_hook(self._count_target)
+
+    @property
+    def available(self) -> bool:
+        return self.model is not None
+
+    @contextmanager
+    def tracking(self) -> Iterator[Dict[str, int]]:
+        """Count draft and target forwards made by this thread within the block."""
+        counts = {"draft": 0, "target": 0}
+        self._local.counts = counts
+        try:
+            yield counts
+        finally:
+            self._local.counts = None
+
+    def record(
+        self,
+        assisted: bool,
+        tokens: int,
+        elapsed: float,
+        counts: Dict[str, int]
+    ) -> None:
+        if assisted:
+            self.stats.assisted_calls += 1
+            self.stats.assisted_tokens += tokens
+            self.stats.assisted_time += elapsed
+            # One draft forward per proposed token, one target forward per step
+            self.stats.draft_tokens += counts["draft"]
+            self.stats.verify_steps += counts["target"]
+        else:
+            self.stats.plain_calls += 1
+            self.stats.plain_tokens += tokens
+            self.stats.plain_time += elapsed
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            **self.stats.to_dict(),
+            "draft_model": self.model_name,
+            "enabled": self.available,
+            "disabled_reason": self.disabled_reason,
+            "precision": self.precision.applied if self.precision else None,
+            "load_time": self.loading.load_time if self.loading else None
+        }
+
+    def _count_draft(self, module, inputs, output) -> None:
+        counts = getattr(self._local, "counts", None)
+        if counts is not None:
+            counts["draft"] += 1
+
+    def _count_target(self, module, inputs, output) -> None:
+        counts = getattr(self._local, "counts", None)
+        if counts is not None:
+            counts["target"] += 1
@@ -1,29 +1,88 @@
 # infrastructure/external/llm/instruct_model.py
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict, Tuple
+from contextlib import nullcontext
+from threading import Lock, Thread
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
-import re
+from transformers import AutoModelForCausalLM, AutoTokenizer, DynamicCache, StoppingCriteriaList, set_seed
 from datetime import datetime
 from domain.ports.llm_port import LLMPort
-from domain.model.entities.generation import GeneratedResult, GenerationMetadata
+from domain.model.entities.generation import GeneratedResult, GenerationMetadata, GenerationChunk
+from infrastructure.external.llm.llm_config import LLMConfig
+from infrastructure.external.batching.length_bucketer import LengthBucketer
+from infrastructure.external.llm.stop_sequence_criteria import StopSequenceCriteria
+from infrastructure.external.llm.prefix_cache import PrefixKVCache, PrefixEntry, KeyValues
+from infrastructure.external.llm.sequence_streamer import SequenceStreamer
+from infrastructure.external.llm.draft_assistant import DraftAssistant
+from infrastructure.external.precision.model_precision import apply_precision
+from infrastructure.external.loading.model_loader import load_pretrained, warm_up
+from infrastructure.external.compilation.compiled_forward import CompiledForward
+
+# torch's default generator is process-wide: sampling anywhere advances it,
+# so a seeded generate must not interleave with any other sampling call
+_SAMPLING_LOCK = Lock()
 
 class InstructModel(LLMPort):
+    # Stands in for the user turn when rendering a system prompt's shared prefix
+    _USER_PLACEHOLDER = "\uE000"
+
     def __init__(
         self,
         model_name: str = "EleutherAI/gpt-neo-125M",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        config: Optional[LLMConfig] = None
     ):
-        self.model_name = model_name
-        self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
-        self.instruct_mode = "instruct" in model_name.lower()
+        self.config = config or LLMConfig(model_name=model_name, device=device)
+        self.model_name = self.config.model_name
+        self.device = self.config.device or ('cuda' if torch.cuda.is_available() else 'cpu')
+        self.instruct_mode = "instruct" in self.model_name.lower()
+        self.bucketer = LengthBucketer(
+            max_tokens=self.config.max_batch_tokens,
+            max_batch_size=self.config.max_batch_size
+        )
         
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForCausalLM.from_pretrained(model_name)
-            self.model.to(self.device)
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self.model, self.loading = load_pretrained(
+                AutoModelForCausalLM, self.model_name, self.device, self.config
+            )
+            self.model, self.precision = apply_precision(
+                self.model, self.config.precision, self.device, unit="tokens"
+            )
         except Exception as e:
             raise e
 
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        warm_up(
+            self.model, self.config.warmup_lengths, self.tokenizer.pad_token_id, self.device, self.loading
+        )
+        # Only full-prompt scoring passes go through the compiled forward;
+        # generate() and cached-prefix passes keep the eager model
+        self.forward = CompiledForward(
+            self.model,
+            enabled=self.config.use_compile,
+            lengths=self.config.compile_lengths,
+            batch_sizes=self.config.compile_batch_sizes,
+            pad_token_id=self.tokenizer.pad_token_id,
+            padding_side="left",
+            mode=self.config.compile_mode
+        )
+
+        self.prefix_cache = (
+            PrefixKVCache(self.config.prefix_cache_memory_bytes, prefill=self._prefill)
+            if self.config.prefix_cache_memory_bytes > 0 else None
+        )
+        self.draft = (
+            DraftAssistant(
+                self.config.draft_model_name,
+                target_model=self.model,
+                target_tokenizer=self.tokenizer,
+                device=self.device,
+                config=self.config
+            )
+            if self.config.draft_model_name else None
+        )
+
     def generate(
         self,
         system_prompt: str,
@@ -31,70 +90,151 @@ class InstructModel(LLMPort):
         num_sequences: int = 1,
         max_tokens: int = 100,
         temperature: float = 1.0,
-        stop_sequences: Optional[List[str]] = None
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
     ) -> List[GeneratedResult]:
-        start_time = datetime.now()
-        
+        return self.generate_batch(
+            [(system_prompt, user_prompt)],
+            num_sequences=num_sequences,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop_sequences=stop_sequences,
+            seed=seed
+        )[0]
+
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> List[List[GeneratedResult]]:
         try:
-            # Prepare input based on model type
-            if self.instruct_mode:
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ]
-                prompt = self.tokenizer.apply_chat_template(
-                    messages,
-                    tokenize=False,
-                    add_generation_prompt=True
-                )
-            else:
-                prompt = f"{system_prompt}\n{user_prompt}"
+            start_time = datetime.now()
+            encodings = self.tokenizer([self._build_prompt(system, user) for system, user in prompts])
 
-            # Tokenize input
-            inputs = self.tokenizer(
-                [prompt],
-                return_tensors="pt"
-            ).to(self.device)
+            # Budget covers prompt plus new tokens for every returned sequence
+            lengths = [
+                (len(ids) + max_tokens) * num_sequences for ids in encodings["input_ids"]
+            ]
+            results: List[List[GeneratedResult]] = [[] for _ in prompts]
 
-            # Generate responses
-            outputs = self.model.generate(
-                **inputs,
-                max_new_tokens=max_tokens,
-                num_return_sequences=num_sequences,
-                do_sample=True,
-                temperature=temperature,
-                pad_token_id=self.tokenizer.eos_token_id
-            )
+            # A seeded prompt is sampled on its own so its output does not depend
+            # on what else happened to share the batch; assisted prompts decode
+            # one at a time anyway
+            assisted = self._assists(num_sequences, temperature)
+            alone = assisted or (seed is not None and temperature > 0)
+            for prefix, indices in self._prefix_groups(prompts, encodings, assisted).items():
+                plan = (
+                    [[i] for i in range(len(indices))] if alone
+                    else self.bucketer.plan([lengths[i] for i in indices])
+                )
+                for positions in plan:
+                    bucket = [indices[i] for i in positions]
+                    self._generate_bucket(
+                        bucket, prefix, encodings, results,
+                        num_sequences, max_tokens, temperature, stop_sequences, seed
+                    )
 
-            # Decode outputs
-            decoded_outputs = self.tokenizer.batch_decode(
-                outputs,
-                skip_special_tokens=True
+            elapsed = (datetime.now() - start_time).total_seconds()
+            self.precision.record(
+                sum(result.metadata.completion_tokens for rows in results for result in rows), elapsed
             )
+            self.loading.record_request(elapsed)
+            return results
 
-            # Process outputs
-            results = []
-            for output in decoded_outputs:
-                content = self._extract_assistant_response(output) if self.instruct_mode else output
-                
-                # Apply stop sequences if provided
-                if stop_sequences:
-                    for stop_seq in stop_sequences:
-                        if stop_seq in content:
-                            content = content[:content.index(stop_seq)]
-
-                # Create generation metadata
-                metadata = GenerationMetadata(
-                    model_name=self.model_name,
-                    tokens_used=len(self.tokenizer.encode(content)),
-                    generation_time=(datetime.now() - start_time).total_seconds()
+        except Exception as e:
+            raise e
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> Iterator[GenerationChunk]:
+        started_at = datetime.now()
+        prompts = [(system_prompt, user_prompt)]
+        encodings = self.tokenizer([self._build_prompt(system_prompt, user_prompt)])
+        assisted = self._assists(num_sequences, temperature)
+        prefix = next(iter(self._prefix_groups(prompts, encodings, assisted)))
+        streamer = SequenceStreamer(self.tokenizer, num_sequences, started_at, stop_sequences)
+        results: List[List[GeneratedResult]] = [[]]
+        errors: List[Exception] = []
+
+        # generate() feeds the streamer from this thread while we drain it
+        def decode():
+            try:
+                self._generate_bucket(
+                    [0], prefix, encodings, results,
+                    num_sequences, max_tokens, temperature, stop_sequences, seed,
+                    streamer=streamer
                 )
+            except Exception as e:
+                errors.append(e)
+            finally:
+                streamer.end()
+
+        thread = Thread(target=decode, daemon=True)
+        thread.start()
+        for row, text in streamer:
+            yield GenerationChunk(sequence_index=row, text=text)
+        thread.join()
+
+        if errors:
+            raise errors[0]
+        for row, result in enumerate(results[0]):
+            yield GenerationChunk(sequence_index=row, text="", result=result)
+
+    def get_batching_stats(self) -> Dict[str, float]:
+        return self.bucketer.stats.to_dict()
 
-                results.append(GeneratedResult(
-                    content=content.strip(),
-                    metadata=metadata
-                ))
+    def get_prefix_cache_stats(self) -> Dict[str, float]:
+        return self.prefix_cache.get_stats() if self.prefix_cache else {}
 
+    def get_speculation_stats(self) -> Dict[str, float]:
+        return self.draft.get_stats() if self.draft else {}
+
+    def get_precision_stats(self) -> Dict[str, float]:
+        return self.precision.to_dict()
+
+    def get_load_stats(self) -> Dict[str, float]:
+        return self.loading.to_dict()
+
+    def get_compile_stats(self) -> Dict[str, float]:
+        return self.forward.get_stats()
+
+    def next_token_probabilities(
+        self,
+        prompts: List[Tuple[str, str]],
+        choices: Dict[str, List[str]]
+    ) -> List[Dict[str, float]]:
+        try:
+            start_time = datetime.now()
+            token_sets = {
+                name: self._choice_token_ids(words) for name, words in choices.items()
+            }
+            encodings = self.tokenizer([self._build_prompt(system, user) for system, user in prompts])
+            results: List[Optional[Dict[str, float]]] = [None] * len(prompts)
+            batch_size = self.config.max_batch_size
+
+            for prefix, indices in self._prefix_groups(prompts, encodings).items():
+                for i in range(0, len(indices), batch_size):
+                    chunk = indices[i:i + batch_size]
+                    logits = self._next_token_logits(chunk, prefix, encodings)
+                    probabilities = torch.softmax(logits.float(), dim=-1)
+
+                    for index, row in zip(chunk, probabilities):
+                        results[index] = {
+                            name: row[ids].sum().item() for name, ids in token_sets.items()
+                        }
+
+            self.loading.record_request((datetime.now() - start_time).total_seconds())
             return results
 
         except Exception as e:
@@ -106,9 +246,318 @@ class InstructModel(LLMPort):
         except Exception as e:
             raise e
 
-    def _extract_assistant_response(self, text: str) -> str:
-        # Extract content after "assistant" or "Assistant:"
-        match = re.search(r"(?:assistant|Assistant):\s*(.*)", text, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return text.strip()
\ No newline at end of file
+    def _generate_bucket(
+        self,
+        bucket: List[int],
+        prefix: Tuple[int, ...],
+        encodings,
+        results: List[List[GeneratedResult]],
+        num_sequences: int,
+        max_tokens: int,
+        temperature: float,
+        stop_sequences: Optional[List[str]],
+        seed: Optional[int] = None,
+        streamer: Optional[SequenceStreamer] = None
+    ) -> None:
+        start_time = datetime.now()
+        if prefix:
+            inputs = self._prefixed_inputs(
+                self.prefix_cache.fetch(prefix, rows=len(bucket)),
+                [encodings["input_ids"][i][len(prefix):] for i in bucket]
+            )
+        else:
+            inputs = self._pad_left([
+                {key: encodings[key][i] for key in encodings.keys()} for i in bucket
+            ])
+
+        outputs, token_counts, stop_reasons = self._generate_ids(
+            inputs, num_sequences, max_tokens, temperature, stop_sequences, seed, streamer
+        )
+        generation_time = (datetime.now() - start_time).total_seconds()
+
+        # Prompts are left padded, so new tokens start at the same column;
+        # only those are decoded, never the prompt
+        generated = outputs[:, inputs["input_ids"].shape[1]:]
+        decoded_outputs = self.tokenizer.batch_decode(generated, skip_special_tokens=True)
+
+        # generate() returns num_sequences consecutive rows per prompt
+        for row, content in enumerate(decoded_outputs):
+            index = bucket[row // num_sequences]
+            content = self._apply_stop_sequences(content, stop_sequences)
+            results[index].append(GeneratedResult(
+                content=content.strip(),
+                metadata=GenerationMetadata(
+                    model_name=self.model_name,
+                    tokens_used=token_counts[row],
+                    generation_time=generation_time,
+                    token_budget=max_tokens,
+                    stop_reason=stop_reasons[row],
+                    prompt_tokens=len(encodings["input_ids"][index]),
+                    completion_tokens=token_counts[row],
+                    time_to_first_token=streamer.time_to_first_token(row) if streamer else None,
+                    inter_token_latency=streamer.inter_token_latency(row) if streamer else None
+                )
+            ))
+
+    def _build_prompt(self, system_prompt: str, user_prompt: str) -> str:
+        # Prepare input based on model type
+        if self.instruct_mode:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ]
+            return self.tokenizer.apply_chat_template(
+                messages,
+                tokenize=False,
+                add_generation_prompt=True
+            )
+        return f"{system_prompt}\n{user_prompt}"
+
+    def _next_token_logits(
+        self,
+        chunk: List[int],
+        prefix: Tuple[int, ...],
+        encodings
+    ) -> torch.Tensor:
+        if prefix:
+            inputs = self._prefixed_inputs(
+                self.prefix_cache.fetch(prefix, rows=len(chunk)),
+                [encodings["input_ids"][i][len(prefix):] for i in chunk]
+            )
+        else:
+            inputs = self._pad_left([
+                {key: encodings[key][i] for key in encodings.keys()} for i in chunk
+            ])
+
+        key_values = inputs.pop("past_key_values", None)
+        position_ids = (inputs["attention_mask"].cumsum(-1) - 1).clamp(min=0)
+        if key_values is not None:
+            # Only the uncached suffix is fed; the mask still spans the prefix
+            inputs["input_ids"] = inputs["input_ids"][:, len(prefix):]
+            position_ids = position_ids[:, len(prefix):]
+            inputs["past_key_values"] = self._model_cache(
+                PrefixKVCache.expand(key_values, len(chunk))
+            )
+
+        # A single forward pass; the last position predicts the next token
+        with torch.no_grad():
+            if key_values is not None:
+                return self.model(**inputs, position_ids=position_ids).logits[:, -1, :]
+            return self.forward(**inputs, position_ids=position_ids, use_cache=False).logits[:, -1, :]
+
+    def _assists(self, num_sequences: int, temperature: float) -> bool:
+        # Greedy decoding runs one row per prompt whatever num_sequences is
+        return (
+            self.draft is not None
+            and self.draft.available
+            and (num_sequences == 1 or temperature <= 0)
+        )
+
+    def _prefix_groups(
+        self,
+        prompts: List[Tuple[str, str]],
+        encodings,
+        assisted: bool = False
+    ) -> Dict[Tuple[int, ...], List[int]]:
+        """
+        Group prompt indices by the cacheable token prefix they share. The
+        empty tuple collects prompts that are encoded without the prefix cache.
+        Assisted generation cannot start from a passed-in cache, so with
+        `assisted` set every prompt skips the prefix cache: the draft model
+        takes precedence for single-sequence generation, and the prefix
+        cache still serves sampling with several sequences and scoring.
+        """
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        prefixes: Dict[str, List[int]] = {}
+
+        for index, (system_prompt, _) in enumerate(prompts):
+            prefix: Tuple[int, ...] = ()
+            if self.prefix_cache is not None and not assisted:
+                if system_prompt not in prefixes:
+                    prefixes[system_prompt] = self._prefix_ids(system_prompt)
+                prefix_ids = prefixes[system_prompt]
+                input_ids = encodings["input_ids"][index]
+
+                # Tokenization must split at the prefix boundary and leave a suffix to feed
+                if (
+                    len(prefix_ids) >= self.config.prefix_cache_min_tokens
+                    and len(input_ids) > len(prefix_ids)
+                    and list(input_ids[:len(prefix_ids)]) == prefix_ids
+                ):
+                    prefix = tuple(prefix_ids)
+            groups.setdefault(prefix, []).append(index)
+
+        # Prefixes seen for the first time take the plain path instead
+        for prefix in [p for p in groups if p]:
+            if not self.prefix_cache.admits(prefix, rows=len(groups[prefix])):
+                groups.setdefault((), []).extend(groups.pop(prefix))
+        return groups
+
+    def _prefix_ids(self, system_prompt: str) -> List[int]:
+        # Everything the prompt template renders before the user turn
+        template = self._build_prompt(system_prompt, self._USER_PLACEHOLDER)
+        cut = template.find(self._USER_PLACEHOLDER)
+        if cut <= 0:
+            return []
+        return self.tokenizer(template[:cut])["input_ids"]
+
+    def _prefixed_inputs(self, entry: PrefixEntry, suffixes: List[List[int]]) -> Dict:
+        # Rows are laid out as [prefix][padding][suffix]; position ids follow the
+        # attention mask, so padding between the two parts is skipped over
+        suffix_inputs = self._pad_left([{"input_ids": ids} for ids in suffixes])
+        prefix_ids = torch.tensor([entry.token_ids], device=self.device).expand(len(suffixes), -1)
+        return {
+            "input_ids": torch.cat([prefix_ids, suffix_inputs["input_ids"]], dim=1),
+            "attention_mask": torch.cat(
+                [torch.ones_like(prefix_ids), suffix_inputs["attention_mask"]], dim=1
+            ),
+            "past_key_values": entry.key_values
+        }
+
+    def _prefill(self, token_ids: List[int]) -> KeyValues:
+        with torch.no_grad():
+            output = self.model(
+                input_ids=torch.tensor([token_ids], device=self.device),
+                use_cache=True
+            )
+        key_values = output.past_key_values
+        if hasattr(key_values, "to_legacy_cache"):
+            key_values = key_values.to_legacy_cache()
+        return tuple((key, value) for key, value in key_values)
+
+    def _model_cache(self, key_values: KeyValues):
+        # Models that moved to Cache objects reject the legacy tuple layout
+        if getattr(self.model, "_supports_cache_class", True):
+            return DynamicCache.from_legacy_cache(key_values)
+        return key_values
+
+    def _pad_left(self, features) -> Dict[str, torch.Tensor]:
+        # Left padding keeps every prompt's last token in the final position
+        self.tokenizer.padding_side = "left"
+        return self.tokenizer.pad(
+            features,
+            padding=True,
+            return_tensors="pt"
+        ).to(self.device)
+
+    def _generate_ids(
+        self,
+        inputs: Dict[str, torch.Tensor],
+        num_sequences: int,
+        max_tokens: int,
+        temperature: float,
+        stop_sequences: Optional[List[str]],
+        seed: Optional[int] = None,
+        streamer: Optional[SequenceStreamer] = None
+    ) -> Tuple[torch.Tensor, List[int], List[str]]:
+        """
+        Run model.generate with stop sequences enforced during decoding.
+
+        Returns the output ids plus, per row, the number of tokens actually
+        generated and why decoding ended ("stop_sequence", "eos" or "length").
+        """
+        prompt_length = inputs["input_ids"].shape[1]
+
+        # Temperature 0 means greedy decoding, whose sequences are all identical:
+        # decode one per prompt and repeat it. A seed makes sampling repeatable.
+        repeats = 1
+        if temperature > 0:
+            sampling = {"do_sample": True, "temperature": temperature}
+        else:
+            sampling = {"do_sample": False}
+            repeats, num_sequences = num_sequences, 1
+
+        cache_kwargs = {}
+        if "past_key_values" in inputs:
+            # generate() does not expand a passed-in cache, so rows are repeated here
+            rows = inputs["input_ids"].shape[0] * num_sequences
+            cache_kwargs["past_key_values"] = self._model_cache(
+                PrefixKVCache.expand(inputs["past_key_values"], rows)
+            )
+            inputs = {
+                key: inputs[key].repeat_interleave(num_sequences, dim=0)
+                for key in ("input_ids", "attention_mask")
+            }
+            num_sequences = 1
+        criteria = (
+            StopSequenceCriteria(self.tokenizer, stop_sequences, prompt_length)
+            if stop_sequences else None
+        )
+
+        # Assisted generation only handles one sequence without a passed-in cache
+        assisted = False
+        if self.draft is not None:
+            assisted = (
+                self.draft.available
+                and inputs["input_ids"].shape[0] * num_sequences == 1
+                and not cache_kwargs
+            )
+            if assisted:
+                cache_kwargs["assistant_model"] = self.draft.model
+            else:
+                self.draft.stats.fallbacks += 1
+            start_time = datetime.now()
+
+        # Only forwards of this assisted call count towards the acceptance rate
+        tracking = self.draft.tracking() if assisted else nullcontext({})
+        with tracking as counts, _SAMPLING_LOCK if sampling["do_sample"] else nullcontext():
+            # Seeding under the lock keeps other threads from drawing in between
+            if seed is not None and sampling["do_sample"]:
+                set_seed(seed)
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=max_tokens,
+                num_return_sequences=num_sequences,
+                **sampling,
+                pad_token_id=self.tokenizer.eos_token_id,
+                stopping_criteria=StoppingCriteriaList([criteria]) if criteria else None,
+                streamer=streamer,
+                **cache_kwargs
+            )
+
+        token_counts, hit_eos = self._completion_lengths(outputs[:, prompt_length:])
+        stop_reasons = ["eos" if eos else "length" for eos in hit_eos]
+
+        # Only single-sequence calls are comparable with assisted ones
+        if self.draft is not None and (assisted or len(token_counts) == 1):
+            elapsed = (datetime.now() - start_time).total_seconds()
+            self.draft.record(assisted, sum(token_counts), elapsed, counts)
+
+        # Rows halted by a stop sequence are padded afterwards; use the recorded length
+        if criteria is not None:
+            for row, length in enumerate(criteria.stop_lengths):
+                if length is not None:
+                    token_counts[row] = length
+                    stop_reasons[row] = "stop_sequence"
+
+        if repeats > 1:
+            outputs = outputs.repeat_interleave(repeats, dim=0)
+            token_counts = [count for count in token_counts for _ in range(repeats)]
+            stop_reasons = [reason for reason in stop_reasons for _ in range(repeats)]
+
+        return outputs, token_counts, stop_reasons
+
+    def _completion_lengths(self, generated: torch.Tensor) -> Tuple[List[int], List[bool]]:
+        # Tokens up to and including the first EOS; the rest is padding
+        is_eos = generated == self.tokenizer.eos_token_id
+        has_eos = is_eos.any(dim=1)
+        first_eos = is_eos.int().argmax(dim=1)
+        lengths = torch.where(has_eos, first_eos + 1, torch.full_like(first_eos, generated.shape[1]))
+        return lengths.tolist(), has_eos.tolist()
+
+    def _apply_stop_sequences(self, content: str, stop_sequences: Optional[List[str]]) -> str:
+        if stop_sequences:
+            for stop_seq in stop_sequences:
+                if stop_seq in content:
+                    content = content[:content.index(stop_seq)]
+        return content
+
+    def _choice_token_ids(self, words: List[str]) -> torch.Tensor:
+        # First token of each word, with and without a leading space
+        ids = set()
+        for word in words:
+            for form in (word, f" {word}"):
+                encoded = self.tokenizer.encode(form, add_special_tokens=False)
+                if encoded:
+                    ids.add(encoded[0])
+        return torch.tensor(sorted(ids), device=self.device)
\ No newline at end of file
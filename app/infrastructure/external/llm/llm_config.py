@@ -1,13 +1,36 @@
-# infrastructure/external/embeddings/embeddings_config.py
-from typing import Optional
+# infrastructure/external/llm/llm_config.py
+from typing import List, Literal, Optional
 from pydantic import BaseSettings
 
 class LLMConfig(BaseSettings):
     model_name: str = "EleutherAI/gpt-neo-125M"
     device: Optional[str] = None
+    # fp32, bf16 where the device supports it, or dynamic int8 on CPU
+    precision: Literal["fp32", "bf16", "int8"] = "fp32"
     max_length: int = 2048
+    use_safetensors: bool = True
+    low_cpu_mem_usage: bool = True
+    num_threads: Optional[int] = None
+    num_interop_threads: Optional[int] = None
+    # Forward passes run at load time; empty to skip warm-up
+    warmup_lengths: List[int] = [16, 128]
+    # torch.compile for steady-state forwards, padded to fixed shape buckets
+    use_compile: bool = False
+    compile_mode: Literal["default", "reduce-overhead", "max-autotune"] = "default"
+    compile_lengths: List[int] = [32, 64, 128, 256, 512]
+    compile_batch_sizes: List[int] = [1, 2, 4, 8, 16, 32]
     default_temperature: float = 1.0
     max_batch_size: int = 4
+    max_batch_tokens: int = 4096
+    prefix_cache_memory_bytes: int = 256 * 1024 * 1024
+    prefix_cache_min_tokens: int = 16
+    # Assisted decoding; single-sequence generations then bypass the prefix cache
+    draft_model_name: Optional[str] = None
+    draft_lookahead: int = 5
+    cache_memory_bytes: int = 16 * 1024 * 1024
+    cache_path: Optional[str] = None
+    cache_ttl_seconds: Optional[float] = None
+    cache_max_disk_bytes: Optional[int] = None
 
     class Config:
         env_prefix = "LLM_"
\ No newline at end of file
@@ -0,0 +1,143 @@
+# infrastructure/external/llm/prefix_cache.py
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+import torch
+from infrastructure.cache.lru_cache import ByteBoundedLRUCache
+
+# Legacy past_key_values layout: one (key, value) pair per layer,
+# each [batch, heads, length, head_dim]
+KeyValues = Tuple[Tuple[torch.Tensor, torch.Tensor], ...]
+
+
+@dataclass
+class PrefixCacheStats:
+    hits: int = 0
+    misses: int = 0
+    first_sightings: int = 0
+    prefill_time: float = 0.0
+    prefill_time_saved: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "first_sightings": self.first_sightings,
+            "prefill_time": self.prefill_time,
+            "prefill_time_saved": self.prefill_time_saved
+        }
+
+
+@dataclass(frozen=True)
+class PrefixEntry:
+    token_ids: Tuple[int, ...]
+    key_values: KeyValues
+    prefill_time: float
+
+    @property
+    def length(self) -> int:
+        return len(self.token_ids)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(t.numel() * t.element_size() for pair in self.key_values for t in pair)
+
+
+class PrefixKVCache:
+    """
+    LRU cache of the attention key/value states for shared prompt prefixes.
+
+    Each entry holds a prefix prefilled once with batch size 1. Callers get
+    copies repeated to their batch size, so stored tensors are never mutated.
+    A prefix is only admitted once it is seen a second time, or shared by
+    several prompts of one call, so one-off prompts never evict entries
+    that are reused.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        prefill: Callable[[List[int]], KeyValues],
+        max_seen: int = 4096
+    ):
+        self.prefill = prefill
+        self.max_seen = max_seen
+        self.stats = PrefixCacheStats()
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self.entries = ByteBoundedLRUCache(
+            max_bytes=max_bytes,
+            sizeof=lambda entry: entry.nbytes
+        )
+
+    def admits(self, token_ids: Tuple[int, ...], rows: int = 1) -> bool:
+        """Whether `rows` prompts sharing `token_ids` should use the cache."""
+        key = self._key(token_ids)
+        if rows > 1 or key in self.entries or key in self._seen:
+            return True
+        self._seen[key] = None
+        while len(self._seen) > self.max_seen:
+            self._seen.popitem(last=False)
+        self.stats.first_sightings += rows
+        return False
+
+    def fetch(self, token_ids: Tuple[int, ...], rows: int = 1) -> PrefixEntry:
+        """
+        Return the entry for `token_ids`, prefilling it on a miss.
+
+        `rows` is the number of prompts served from the entry; every row
+        after the first prefill skips re-encoding the prefix.
+        """
+        key = self._key(token_ids)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.stats.hits += rows
+            self.stats.prefill_time_saved += entry.prefill_time * rows
+            return entry
+
+        start_time = datetime.now()
+        key_values = self.prefill(list(token_ids))
+        entry = PrefixEntry(
+            token_ids=token_ids,
+            key_values=key_values,
+            prefill_time=(datetime.now() - start_time).total_seconds()
+        )
+        self.entries.put(key, entry)
+
+        self.stats.misses += 1
+        self.stats.hits += rows - 1
+        self.stats.prefill_time += entry.prefill_time
+        self.stats.prefill_time_saved += entry.prefill_time * (rows - 1)
+        return entry
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            **self.stats.to_dict(),
+            "entries": len(self.entries),
+            "cached_bytes": self.entries.current_bytes,
+            "evictions": self.entries.evictions
+        }
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self._seen.clear()
+
+    @staticmethod
+    def expand(key_values: KeyValues, rows: int) -> KeyValues:
+        return tuple(
+            (key.repeat(rows, 1, 1, 1), value.repeat(rows, 1, 1, 1))
+            for key, value in key_values
+        )
+
+    @staticmethod
+    def _key(token_ids: Tuple[int, ...]) -> str:
+        return hashlib.sha256(repr(token_ids).encode("utf-8")).hexdigest()
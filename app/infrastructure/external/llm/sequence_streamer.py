@@ -0,0 +1,116 @@
+# infrastructure/external/llm/sequence_streamer.py
+from datetime import datetime
+from queue import Queue
+from typing import Iterator, List, Optional, Tuple
+from transformers.generation.streamers import BaseStreamer
+
+
+class SequenceStreamer(BaseStreamer):
+    """
+    Streamer for model.generate that handles several sequences at once.
+
+    generate() calls put() from its decode thread with the prompt first and
+    then one token per row each step; the consumer iterates (row, text)
+    deltas from a queue. Text is held back while it ends in an incomplete
+    character or could still turn into a stop sequence, and a row stops
+    streaming at EOS or at the first stop sequence.
+    """
+
+    def __init__(
+        self,
+        tokenizer,
+        rows: int,
+        started_at: datetime,
+        stop_sequences: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ):
+        self.tokenizer = tokenizer
+        self.stop_sequences = [s for s in stop_sequences or [] if s]
+        self.started_at = started_at
+        self.timeout = timeout
+        self.queue: "Queue[Optional[Tuple[int, str]]]" = Queue()
+
+        self.tokens: List[List[int]] = [[] for _ in range(rows)]
+        self.emitted: List[int] = [0] * rows
+        self.finished: List[bool] = [False] * rows
+        self.token_times: List[List[datetime]] = [[] for _ in range(rows)]
+        self._prompt_seen = False
+        self._ended = False
+
+    def put(self, value) -> None:
+        # The first call carries the prompt ids
+        if not self._prompt_seen:
+            self._prompt_seen = True
+            return
+
+        # Regular decoding sends [rows]; assisted decoding sends [1, accepted]
+        now = datetime.now()
+        steps = value.tolist() if value.dim() == 2 else [[token] for token in value.tolist()]
+        for row, tokens in enumerate(steps):
+            for token in tokens:
+                if self.finished[row]:
+                    break
+                if token == self.tokenizer.eos_token_id:
+                    self._flush(row)
+                    break
+                self.tokens[row].append(token)
+                self.token_times[row].append(now)
+            if not self.finished[row]:
+                self._emit(row, final=False)
+
+    def end(self) -> None:
+        if self._ended:
+            return
+        self._ended = True
+        for row in range(len(self.tokens)):
+            if not self.finished[row]:
+                self._flush(row)
+        self.queue.put(None)
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        while True:
+            item = self.queue.get(timeout=self.timeout)
+            if item is None:
+                return
+            yield item
+
+    def time_to_first_token(self, row: int) -> Optional[float]:
+        if not self.token_times[row]:
+            return None
+        return (self.token_times[row][0] - self.started_at).total_seconds()
+
+    def inter_token_latency(self, row: int) -> Optional[float]:
+        times = self.token_times[row]
+        if len(times) < 2:
+            return None
+        return (times[-1] - times[0]).total_seconds() / (len(times) - 1)
+
+    def _flush(self, row: int) -> None:
+        self._emit(row, final=True)
+        self.finished[row] = True
+
+    def _emit(self, row: int, final: bool) -> None:
+        text = self.tokenizer.decode(self.tokens[row], skip_special_tokens=True)
+
+        for stop in self.stop_sequences:
+            if stop in text:
+                text = text[:text.index(stop)]
+                self.finished[row] = True
+                final = True
+
+        safe_length = len(text) if final else self._safe_length(text)
+        if safe_length > self.emitted[row]:
+            self.queue.put((row, text[self.emitted[row]:safe_length]))
+            self.emitted[row] = safe_length
+
+    def _safe_length(self, text: str) -> int:
+        # A trailing replacement character is an incomplete multi-byte token
+        text = text.rstrip("�")
+        # Longest tail that is the start of some stop sequence
+        held = 0
+        for stop in self.stop_sequences:
+            for k in range(min(len(stop) - 1, len(text)), held, -1):
+                if text.endswith(stop[:k]):
+                    held = k
+                    break
+        return len(text) - held
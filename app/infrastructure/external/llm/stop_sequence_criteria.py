@@ -0,0 +1,45 @@
+# infrastructure/external/llm/stop_sequence_criteria.py
+from typing import List, Optional
+import torch
+from transformers import StoppingCriteria
+
+
+class StopSequenceCriteria(StoppingCriteria):
+    """
+    Stops each sequence of a batch as soon as its generated text contains
+    one of the stop sequences. Returns a per-row mask, so generate() pads
+    finished rows and halts once every row has stopped.
+    """
+
+    def __init__(
+        self,
+        tokenizer,
+        stop_sequences: List[str],
+        prompt_length: int
+    ):
+        self.tokenizer = tokenizer
+        self.stop_sequences = [s for s in stop_sequences if s]
+        self.prompt_length = prompt_length
+        # Only the tail that could hold a stop sequence is decoded each step
+        self.lookback = max(
+            (len(tokenizer.encode(s, add_special_tokens=False)) for s in self.stop_sequences),
+            default=0
+        ) + 2
+        self.stopped: Optional[torch.Tensor] = None
+        self.stop_lengths: List[Optional[int]] = []
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        if self.stopped is None:
+            self.stopped = torch.zeros(input_ids.shape[0], dtype=torch.bool, device=input_ids.device)
+            self.stop_lengths = [None] * input_ids.shape[0]
+
+        generated_length = input_ids.shape[1] - self.prompt_length
+        start = max(self.prompt_length, input_ids.shape[1] - self.lookback)
+
+        for row in (~self.stopped).nonzero().flatten().tolist():
+            tail = self.tokenizer.decode(input_ids[row, start:], skip_special_tokens=True)
+            if any(stop in tail for stop in self.stop_sequences):
+                self.stopped[row] = True
+                self.stop_lengths[row] = generated_length
+
+        return self.stopped.clone()
@@ -0,0 +1,145 @@
+# infrastructure/external/loading/model_loader.py
+import time
+from dataclasses import dataclass, field
+from threading import Event, Lock, Thread
+from typing import Dict, List, Optional, Tuple
+import torch
+from infrastructure.external.precision.model_precision import resident_memory_bytes
+
+_threads_lock = Lock()
+_threads_configured = False
+
+
+@dataclass
+class LoadStats:
+    load_time: float = 0.0
+    weights_format: str = "unknown"
+    low_cpu_mem_usage: bool = True
+    rss_before: int = 0
+    peak_rss: int = 0
+    rss_after: int = 0
+    num_threads: int = 0
+    num_interop_threads: int = 0
+    warmup_lengths: List[int] = field(default_factory=list)
+    warmup_time: float = 0.0
+    first_request_latency: Optional[float] = None
+
+    def record_request(self, elapsed: float) -> None:
+        if self.first_request_latency is None:
+            self.first_request_latency = elapsed
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "load_time": self.load_time,
+            "weights_format": self.weights_format,
+            "low_cpu_mem_usage": self.low_cpu_mem_usage,
+            "rss_before": self.rss_before,
+            "peak_rss": self.peak_rss,
+            "rss_after": self.rss_after,
+            "peak_load_overhead": self.peak_rss - self.rss_before,
+            "num_threads": self.num_threads,
+            "num_interop_threads": self.num_interop_threads,
+            "warmup_lengths": list(self.warmup_lengths),
+            "warmup_time": self.warmup_time,
+            "first_request_latency": self.first_request_latency
+        }
+
+
+class _PeakSampler:
+    """Samples RSS on a background thread; ru_maxrss is process-lifetime only."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = resident_memory_bytes()
+        self._stop = Event()
+        self._thread = Thread(target=self._loop, name="rss-sampler", daemon=True)
+
+    def __enter__(self) -> "_PeakSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, resident_memory_bytes())
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, resident_memory_bytes())
+
+
+def configure_threads(num_threads: Optional[int], num_interop_threads: Optional[int]) -> Tuple[int, int]:
+    """
+    Apply intra-op and inter-op thread counts once per process.
+
+    Both settings are global to torch, and the inter-op pool can only be
+    sized before it first runs work, so later calls leave them as they are.
+    """
+    global _threads_configured
+    with _threads_lock:
+        if not _threads_configured:
+            _threads_configured = True
+            if num_threads:
+                torch.set_num_threads(num_threads)
+            if num_interop_threads:
+                try:
+                    torch.set_num_interop_threads(num_interop_threads)
+                except RuntimeError:
+                    # Inter-op work already ran, e.g. in a model loaded earlier
+                    pass
+    return torch.get_num_threads(), torch.get_num_interop_threads()
+
+
+def load_pretrained(model_class, model_name: str, device: str, config) -> Tuple[object, LoadStats]:
+    """
+    Load weights with as little peak memory as the checkpoint allows.
+
+    safetensors checkpoints are memory-mapped rather than read into a
+    state dict, and low_cpu_mem_usage builds the model without a randomly
+    initialised copy of every weight. Checkpoints without safetensors
+    files fall back to the pickle format. `config` is an LLMConfig or
+    EmbeddingsConfig.
+    """
+    stats = LoadStats(low_cpu_mem_usage=config.low_cpu_mem_usage)
+    stats.num_threads, stats.num_interop_threads = configure_threads(
+        config.num_threads, config.num_interop_threads
+    )
+    stats.rss_before = resident_memory_bytes()
+    start = time.perf_counter()
+
+    with _PeakSampler() as sampler:
+        kwargs = {"low_cpu_mem_usage": config.low_cpu_mem_usage}
+        model = None
+        if config.use_safetensors:
+            try:
+                model = model_class.from_pretrained(model_name, use_safetensors=True, **kwargs)
+                stats.weights_format = "safetensors"
+            except OSError:
+                model = None
+        if model is None:
+            model = model_class.from_pretrained(model_name, **kwargs)
+            stats.weights_format = "pytorch"
+        model.to(device)
+        model.eval()
+
+    stats.load_time = time.perf_counter() - start
+    stats.peak_rss = sampler.peak
+    stats.rss_after = resident_memory_bytes()
+    return model, stats
+
+
+def warm_up(model, lengths: List[int], token_id: int, device: str, stats: LoadStats) -> None:
+    """
+    Run one forward pass per sequence length so the allocator, kernel
+    selection and any lazy initialisation happen before the first request.
+    """
+    start = time.perf_counter()
+    max_length = getattr(model.config, "max_position_embeddings", None)
+    for length in lengths:
+        if max_length:
+            length = min(length, max_length)
+        input_ids = torch.full((1, length), token_id, dtype=torch.long, device=device)
+        with torch.no_grad():
+            model(input_ids=input_ids, attention_mask=torch.ones_like(input_ids))
+        stats.warmup_lengths.append(length)
+    stats.warmup_time = time.perf_counter() - start
@@ -0,0 +1,18 @@
+# infrastructure/external/precision/effective_precision.py
+from typing import Any
+
+
+def effective_precision(port: Any, requested: str) -> str:
+    """
+    Precision the model adapter under `port` actually runs at.
+
+    Decorators are walked through their `llm` or `embeddings` attribute
+    down to the adapter. A requested precision the device cannot run falls
+    back to fp32 there, so the applied mode is what cached outputs depend
+    on. Ports without precision stats report `requested`.
+    """
+    while port is not None and not hasattr(port, "get_precision_stats"):
+        port = getattr(port, "llm", None) or getattr(port, "embeddings", None)
+    if port is None:
+        return requested
+    return port.get_precision_stats().get("applied", requested)
@@ -0,0 +1,113 @@
+# infrastructure/external/precision/model_precision.py
+import gc
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import torch
+
+PRECISIONS = ("fp32", "bf16", "int8")
+
+
+def resident_memory_bytes() -> int:
+    # Current RSS from /proc where available, otherwise the peak RSS
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def bf16_supported(device: str) -> bool:
+    if device.startswith("cuda"):
+        return torch.cuda.is_bf16_supported()
+    if device != "cpu":
+        return False
+    # Without AVX512-BF16 or AMX, bf16 matmuls are emulated and slower than fp32
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
+
+
+@dataclass
+class PrecisionStats:
+    requested: str
+    applied: str = "fp32"
+    fallback_reason: Optional[str] = None
+    memory_before: int = 0
+    memory_after: int = 0
+    convert_time: float = 0.0
+    quantized_layers: int = 0
+    unit: str = "items"
+    processed: int = 0
+    busy_time: float = 0.0
+
+    @property
+    def memory_saved(self) -> int:
+        return self.memory_before - self.memory_after
+
+    @property
+    def throughput(self) -> float:
+        return self.processed / self.busy_time if self.busy_time else 0.0
+
+    def record(self, count: int, elapsed: float) -> None:
+        self.processed += count
+        self.busy_time += elapsed
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "requested": self.requested,
+            "applied": self.applied,
+            "fallback_reason": self.fallback_reason,
+            "memory_before": self.memory_before,
+            "memory_after": self.memory_after,
+            "memory_saved": self.memory_saved,
+            "convert_time": self.convert_time,
+            "quantized_layers": self.quantized_layers,
+            f"{self.unit}_processed": self.processed,
+            f"{self.unit}_per_second": self.throughput
+        }
+
+
+def apply_precision(model, precision: str, device: str, unit: str = "items") -> Tuple[object, PrecisionStats]:
+    """
+    Convert a loaded fp32 model to the requested precision.
+
+    int8 applies dynamic quantization to nn.Linear layers: weights are
+    stored as int8 and activations are quantized on the fly, which only
+    the CPU backends support. bf16 casts every weight and needs native
+    bf16 support on the device. Anything unsupported stays in fp32 and
+    the reason is recorded. Resident memory is sampled around the
+    conversion.
+    """
+    stats = PrecisionStats(requested=precision, unit=unit)
+    gc.collect()
+    stats.memory_before = resident_memory_bytes()
+    start = time.perf_counter()
+
+    if precision == "int8":
+        if device != "cpu":
+            stats.fallback_reason = f"dynamic int8 quantization needs the CPU, not {device}"
+        else:
+            stats.quantized_layers = sum(
+                1 for module in model.modules() if isinstance(module, torch.nn.Linear)
+            )
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            stats.applied = "int8"
+    elif precision == "bf16":
+        if not bf16_supported(device):
+            stats.fallback_reason = f"no native bf16 support on {device}"
+        else:
+            model = model.to(torch.bfloat16)
+            stats.applied = "bf16"
+
+    stats.convert_time = time.perf_counter() - start
+    gc.collect()
+    stats.memory_after = resident_memory_bytes()
+    return model, stats
@@ -0,0 +1,26 @@
+# infrastructure/scheduling/admission.py
+from typing import Optional
+from domain.exceptions.base_exception import DomainError
+
+
+class AdmissionRejected(DomainError):
+    """A request was turned away because it would miss its lane's latency SLO."""
+
+    def __init__(
+        self,
+        lane: str,
+        estimated_latency: Optional[float],
+        slo_seconds: Optional[float],
+        reason: str
+    ):
+        super().__init__(
+            message=f"Request rejected in lane '{lane}': {reason}",
+            code="ADMISSION_REJECTED",
+            details={
+                "lane": lane,
+                "estimated_latency": estimated_latency,
+                "slo_seconds": slo_seconds,
+                "reason": reason
+            }
+        )
+        self.estimated_latency = estimated_latency
@@ -0,0 +1,116 @@
+# infrastructure/scheduling/batching_embeddings.py
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from domain.ports.embeddings_port import EmbeddingsPort
+from domain.model.value_objects.similarity_score import SimilarityScore
+from infrastructure.scheduling.micro_batcher import MicroBatcher, split_batch
+from infrastructure.scheduling.priority import lane_policies
+from infrastructure.scheduling.scheduler_config import SchedulerConfig
+
+# (references, texts, top_k)
+ScoreCall = Tuple[Any, List[str], Optional[int]]
+# (kind, payload): "encode" carries texts, "score" a ScoreCall, "call" a
+# (method name, args) pair that runs on its own
+EmbeddingsCall = Tuple[str, Any]
+
+
+class BatchingEmbeddings(EmbeddingsPort):
+    """
+    Micro-batches concurrent embedding calls to another EmbeddingsPort.
+
+    get_embedding()/get_embeddings() calls are merged into one
+    get_embeddings(), and reference_similarities() calls against the same
+    prepared references into one scoring pass. The remaining methods also
+    queue, one call per batch, so every forward pass on the model goes
+    through a single scheduler and worker. Batch cost is the number of
+    texts, queued in the caller's priority lane.
+    """
+
+    def __init__(self, embeddings: EmbeddingsPort, config: Optional[SchedulerConfig] = None):
+        self.embeddings = embeddings
+        self.config = config or SchedulerConfig()
+        self.scheduler = MicroBatcher(
+            "embeddings",
+            self._run,
+            max_batch_size=self.config.max_batch_size,
+            max_wait=self.config.max_wait_ms / 1000,
+            cost=self._cost,
+            key=self._key,
+            delay_window=self.config.delay_window,
+            lanes=lane_policies(self.config),
+            defer_timeout=self.config.defer_timeout_seconds,
+            result_timeout=self.config.result_timeout_seconds
+        )
+
+    def get_similarity(self, text1: str, text2: str) -> SimilarityScore:
+        return self.scheduler(("call", ("get_similarity", (text1, text2))))
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.scheduler(("encode", [text]))[0]
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self.scheduler(("encode", texts))
+
+    def batch_similarities(
+        self,
+        reference_text: str,
+        comparison_texts: List[str]
+    ) -> List[SimilarityScore]:
+        return self.scheduler(("call", ("batch_similarities", (reference_text, comparison_texts))))
+
+    def prepare_references(self, reference_texts: List[str]) -> Any:
+        return self.scheduler(("call", ("prepare_references", (reference_texts,))))
+
+    def reference_similarities(
+        self,
+        references: Any,
+        texts: List[str],
+        top_k: Optional[int] = None
+    ) -> List[List[float]]:
+        if not texts:
+            return []
+        return self.scheduler(("score", (references, texts, top_k)))
+
+    def get_scheduler_stats(self) -> Dict[str, Dict[str, float]]:
+        return {"embeddings": self.scheduler.stats.to_dict()}
+
+    @staticmethod
+    def _key(call: EmbeddingsCall) -> Hashable:
+        kind, payload = call
+        if kind == "score":
+            return kind, id(payload[0]), payload[2]
+        if kind == "call":
+            # Never merged with another call
+            return kind, id(call)
+        return kind
+
+    @staticmethod
+    def _cost(call: EmbeddingsCall) -> int:
+        kind, payload = call
+        if kind == "encode":
+            return len(payload)
+        if kind == "score":
+            return len(payload[1])
+        return sum(len(arg) if isinstance(arg, list) else 1 for arg in payload[1])
+
+    def _run(self, calls: List[EmbeddingsCall]) -> List[Any]:
+        # Calls in a batch share their key, so they are all of one kind
+        kind = calls[0][0]
+        if kind == "encode":
+            return self._run_encodings([texts for _, texts in calls])
+        if kind == "score":
+            return self._run_scores([payload for _, payload in calls])
+        return [getattr(self.embeddings, name)(*args) for _, (name, args) in calls]
+
+    def _run_encodings(self, calls: List[List[str]]) -> List[List[List[float]]]:
+        vectors = self.embeddings.get_embeddings([text for texts in calls for text in texts])
+        return split_batch(vectors, [len(texts) for texts in calls])
+
+    def _run_scores(self, calls: List[ScoreCall]) -> List[List[List[float]]]:
+        # Calls in a batch share their references and top_k
+        references, _, top_k = calls[0]
+        scores = self.embeddings.reference_similarities(
+            references, [text for _, texts, _ in calls for text in texts], top_k
+        )
+        return split_batch(scores, [len(texts) for _, texts, _ in calls])
@@ -0,0 +1,155 @@
+# infrastructure/scheduling/batching_llm.py
+import json
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+from domain.ports.llm_port import LLMPort
+from domain.model.entities.generation import GeneratedResult, GenerationChunk
+from infrastructure.scheduling.micro_batcher import MicroBatcher, split_batch
+from infrastructure.scheduling.priority import lane_policies
+from infrastructure.scheduling.scheduler_config import SchedulerConfig
+
+# (prompts, num_sequences, max_tokens, temperature, stop_sequences, seed)
+GenerateCall = Tuple[List[Tuple[str, str]], int, int, float, Tuple[str, ...], Optional[int]]
+ScoreCall = Tuple[List[Tuple[str, str]], Dict[str, List[str]]]
+# ("generate", GenerateCall) or ("next_token", ScoreCall)
+LLMCall = Tuple[str, Any]
+
+
+class BatchingLLM(LLMPort):
+    """
+    Micro-batches concurrent calls to another LLMPort.
+
+    generate() and generate_batch() calls with identical sampling
+    parameters are merged into one generate_batch(), and
+    next_token_probabilities() calls with the same choices into one
+    scoring pass. Both go through one scheduler, so the model never runs
+    two queued forwards at once. Batches are capped by request
+    count and by an estimated token budget (prompt plus requested new
+    tokens). Streams run on the caller's thread but go through admission.
+    Each call waits in the lane of the caller's current priority (see
+    priority_scope).
+    """
+
+    def __init__(self, llm: LLMPort, config: Optional[SchedulerConfig] = None):
+        self.llm = llm
+        self.config = config or SchedulerConfig()
+        # One scheduler and worker for the model, whatever the call type
+        self.scheduler = MicroBatcher(
+            "llm",
+            self._run,
+            max_batch_size=self.config.max_batch_size,
+            max_wait=self.config.max_wait_ms / 1000,
+            max_batch_cost=self.config.max_batch_tokens,
+            cost=self._cost,
+            key=self._key,
+            delay_window=self.config.delay_window,
+            lanes=lane_policies(self.config),
+            defer_timeout=self.config.defer_timeout_seconds,
+            result_timeout=self.config.result_timeout_seconds
+        )
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> List[GeneratedResult]:
+        return self.generate_batch(
+            [(system_prompt, user_prompt)], num_sequences, max_tokens, temperature, stop_sequences, seed
+        )[0]
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> Iterator[GenerationChunk]:
+        # The caller consumes the stream, so it cannot wait in the queue;
+        # it still counts against its lane's in-flight limit and SLO
+        cost = (self._prompt_tokens(system_prompt, user_prompt) + max_tokens) * num_sequences
+        with self.scheduler.admitted(cost):
+            yield from self.llm.generate_stream(
+                system_prompt, user_prompt, num_sequences, max_tokens, temperature, stop_sequences, seed
+            )
+
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ) -> List[List[GeneratedResult]]:
+        if not prompts:
+            return []
+        return self.scheduler(("generate", (
+            list(prompts), num_sequences, max_tokens, temperature, tuple(stop_sequences or ()), seed
+        )))
+
+    def next_token_probabilities(
+        self,
+        prompts: List[Tuple[str, str]],
+        choices: Dict[str, List[str]]
+    ) -> List[Dict[str, float]]:
+        return self.scheduler(("next_token", (prompts, choices)))
+
+    def get_token_count(self, text: str) -> int:
+        return self.llm.get_token_count(text)
+
+    def get_scheduler_stats(self) -> Dict[str, Dict[str, float]]:
+        return {"llm": self.scheduler.stats.to_dict()}
+
+    @staticmethod
+    def _key(call: LLMCall) -> Hashable:
+        kind, payload = call
+        if kind == "generate":
+            return kind, payload[1:]
+        return kind, json.dumps(payload[1], sort_keys=True)
+
+    def _cost(self, call: LLMCall) -> int:
+        # Estimated tokens: prompt plus requested new tokens for generation
+        kind, payload = call
+        if kind == "generate":
+            prompts, num_sequences, max_tokens = payload[:3]
+            return sum(
+                (self._prompt_tokens(system, user) + max_tokens) * num_sequences for system, user in prompts
+            )
+        return sum(self._prompt_tokens(system, user) for system, user in payload[0])
+
+    def _prompt_tokens(self, system_prompt: str, user_prompt: str) -> int:
+        return self.llm.get_token_count(f"{system_prompt}\n{user_prompt}")
+
+    def _run(self, calls: List[LLMCall]) -> List[Any]:
+        # Calls in a batch share their key, so they are all of one kind
+        payloads = [payload for _, payload in calls]
+        if calls[0][0] == "generate":
+            return self._run_generations(payloads)
+        return self._run_scores(payloads)
+
+    def _run_generations(self, calls: List[GenerateCall]) -> List[List[List[GeneratedResult]]]:
+        # Every call in a batch shares its sampling parameters
+        num_sequences, max_tokens, temperature, stop_sequences, seed = calls[0][1:]
+        results = self.llm.generate_batch(
+            [prompt for prompts, *_ in calls for prompt in prompts],
+            num_sequences=num_sequences,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop_sequences=list(stop_sequences) or None,
+            seed=seed
+        )
+        return split_batch(results, [len(prompts) for prompts, *_ in calls])
+
+    def _run_scores(self, calls: List[ScoreCall]) -> List[List[Dict[str, float]]]:
+        # Calls in a batch share their choices
+        scores = self.llm.next_token_probabilities(
+            [prompt for prompts, _ in calls for prompt in prompts], calls[0][1]
+        )
+        return split_batch(scores, [len(prompts) for prompts, _ in calls])
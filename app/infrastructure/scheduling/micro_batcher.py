@@ -0,0 +1,362 @@
+# infrastructure/scheduling/micro_batcher.py
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from threading import Condition, Thread
+from typing import Callable, Deque, Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+from application.interfaces.event_dispatcher import EventPriority
+from infrastructure.scheduling.admission import AdmissionRejected
+from infrastructure.scheduling.priority import LanePolicy, current_priority
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class SchedulerStats:
+    requests: int = 0
+    batches: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    lane_depths: Dict[str, int] = field(default_factory=dict)
+    lane_requests: Dict[str, int] = field(default_factory=dict)
+    batch_sizes: Dict[int, int] = field(default_factory=dict)
+    total_queue_delay: float = 0.0
+    max_queue_delay: float = 0.0
+    recent_delays: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+    deferred: int = 0
+    rejected: int = 0
+    throughput: Optional[float] = None
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+    @property
+    def mean_queue_delay(self) -> float:
+        return self.total_queue_delay / self.requests if self.requests else 0.0
+
+    def delay_percentile(self, q: float) -> float:
+        if not self.recent_delays:
+            return 0.0
+        ordered = sorted(self.recent_delays)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "lane_depths": dict(self.lane_depths),
+            "lane_requests": dict(self.lane_requests),
+            "mean_batch_size": self.mean_batch_size,
+            "batch_size_histogram": dict(sorted(self.batch_sizes.items())),
+            "mean_queue_delay": self.mean_queue_delay,
+            "p50_queue_delay": self.delay_percentile(0.5),
+            "p95_queue_delay": self.delay_percentile(0.95),
+            "max_queue_delay": self.max_queue_delay,
+            "deferred": self.deferred,
+            "rejected": self.rejected,
+            "cost_per_second": self.throughput or 0.0
+        }
+
+
+@dataclass
+class _Pending(Generic[T]):
+    item: T
+    key: Hashable
+    cost: int
+    priority: EventPriority
+    enqueued_at: float
+    future: Future
+
+
+def split_batch(rows: List[R], sizes: List[int]) -> List[List[R]]:
+    """Split a flat batch result back into consecutive parts of the given sizes."""
+    parts, offset = [], 0
+    for size in sizes:
+        parts.append(rows[offset:offset + size])
+        offset += size
+    return parts
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Merges concurrent calls into batches for a single worker thread.
+
+    Callers submit items and get a Future. Items wait in one queue per
+    priority lane; the next batch comes from the lane with the least
+    weighted service so far (stride scheduling), so heavy batch traffic
+    cannot starve interactive calls. Within the lane, the oldest item is
+    joined by later items with the same key (calls that can share one
+    forward pass) until the batch is full by count or by cost, or until
+    the oldest item has waited `max_wait` seconds. `run_batch` handles the
+    whole batch and returns one result per item, in order.
+
+    Admission happens on submit: a lane at its in-flight limit, or a call
+    whose estimated wait (queued cost ahead of it over measured cost per
+    second) exceeds the lane's SLO, is rejected with AdmissionRejected or
+    deferred until it fits, depending on the lane policy.
+
+    Any error while running a batch, including a result list of the wrong
+    length, is set on every future of that batch and the worker moves on;
+    a worker that died anyway is restarted by the next submit. Blocking
+    calls wait at most `result_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run_batch: Callable[[List[T]], List[R]],
+        max_batch_size: int = 16,
+        max_wait: float = 0.005,
+        max_batch_cost: Optional[int] = None,
+        cost: Optional[Callable[[T], int]] = None,
+        key: Optional[Callable[[T], Hashable]] = None,
+        delay_window: int = 1000,
+        lanes: Optional[Dict[EventPriority, LanePolicy]] = None,
+        defer_timeout: float = 300.0,
+        result_timeout: Optional[float] = None
+    ):
+        self.name = name
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_batch_cost = max_batch_cost
+        self.cost = cost or (lambda item: 1)
+        self.key = key or (lambda item: None)
+        self.lanes = lanes or {}
+        self.defer_timeout = defer_timeout
+        self.result_timeout = result_timeout
+        self.stats = SchedulerStats(recent_delays=deque(maxlen=delay_window))
+        self._queues: Dict[EventPriority, Deque[_Pending]] = {p: deque() for p in EventPriority}
+        self._in_flight: Dict[EventPriority, int] = {p: 0 for p in EventPriority}
+        self._passes: Dict[EventPriority, float] = {p: 0.0 for p in EventPriority}
+        self._virtual_time = 0.0
+        self._condition = Condition()
+        self._worker: Optional[Thread] = None
+
+    def submit(self, item: T, priority: Optional[EventPriority] = None) -> "Future[R]":
+        pending = _Pending(
+            item=item,
+            key=self.key(item),
+            cost=self.cost(item),
+            priority=priority or current_priority(),
+            enqueued_at=time.monotonic(),
+            future=Future()
+        )
+        with self._condition:
+            self._admit(pending)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = Thread(target=self._loop, name=f"{self.name}-batcher", daemon=True)
+                self._worker.start()
+
+            queue = self._queues[pending.priority]
+            if not queue:
+                # A lane returning from idle gets no credit for the time it was empty
+                self._passes[pending.priority] = max(
+                    self._passes[pending.priority], self._virtual_time
+                )
+            pending.enqueued_at = time.monotonic()
+            queue.append(pending)
+            self._in_flight[pending.priority] += 1
+            self._update_depths()
+            self._condition.notify_all()
+        return pending.future
+
+    @contextmanager
+    def admitted(self, cost: int, priority: Optional[EventPriority] = None) -> Iterator[None]:
+        """
+        Admission control for work that cannot be queued, such as a stream
+        consumed by the caller: the block counts against its lane's
+        in-flight limit and SLO but runs on the calling thread.
+        """
+        pending = _Pending(
+            item=None,
+            key=None,
+            cost=cost,
+            priority=priority or current_priority(),
+            enqueued_at=time.monotonic(),
+            future=Future()
+        )
+        with self._condition:
+            self._admit(pending)
+            self._in_flight[pending.priority] += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight[pending.priority] -= 1
+                self._condition.notify_all()
+
+    def __call__(self, item: T) -> R:
+        future = self.submit(item)
+        try:
+            return future.result(timeout=self.result_timeout)
+        except FutureTimeoutError:
+            # Still queued: drop it so the worker never runs it
+            future.cancel()
+            raise
+
+    def _policy(self, priority: EventPriority) -> LanePolicy:
+        return self.lanes.get(priority) or LanePolicy()
+
+    def _admit(self, pending: _Pending) -> None:
+        # Called with the condition held; waits release it while deferred
+        policy = self._policy(pending.priority)
+        deadline = time.monotonic() + self.defer_timeout
+        deferred = False
+
+        while True:
+            reason, estimate = self._overload(pending, policy)
+            if reason is None:
+                return
+
+            remaining = deadline - time.monotonic()
+            if policy.overload == "reject" or remaining <= 0:
+                self.stats.rejected += 1
+                raise AdmissionRejected(
+                    lane=pending.priority.value,
+                    estimated_latency=estimate,
+                    slo_seconds=policy.slo_seconds,
+                    reason=reason if remaining > 0 else f"{reason} (deferred too long)"
+                )
+            if not deferred:
+                self.stats.deferred += 1
+                deferred = True
+            self._condition.wait(timeout=remaining)
+
+    def _overload(self, pending: _Pending, policy: LanePolicy) -> Tuple[Optional[str], Optional[float]]:
+        if policy.max_in_flight is not None and self._in_flight[pending.priority] >= policy.max_in_flight:
+            return "lane is at its concurrency limit", None
+        if policy.slo_seconds is None or not self.stats.throughput:
+            return None, None
+
+        # Work queued in lanes weighted at least as high is served first, on average
+        weight = policy.weight
+        ahead = sum(
+            queued.cost
+            for priority, queue in self._queues.items()
+            if self._policy(priority).weight >= weight
+            for queued in queue
+        )
+        estimate = (ahead + pending.cost) / self.stats.throughput
+        # With nothing ahead the call cannot get faster by waiting
+        if ahead and estimate > policy.slo_seconds:
+            return "estimated latency exceeds the lane SLO", estimate
+        return None, estimate
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self._run(batch)
+            except BaseException as e:
+                # Never leave a caller waiting on a future the worker dropped
+                self._fail(batch, e)
+                if not isinstance(e, Exception):
+                    raise
+
+    def _next_batch(self) -> List[_Pending]:
+        with self._condition:
+            while not any(self._queues.values()):
+                self._condition.wait()
+
+            # Stride scheduling: least weighted service first, heavier lanes on ties
+            lane = min(
+                (p for p, queue in self._queues.items() if queue),
+                key=lambda p: (self._passes[p], -self._policy(p).weight)
+            )
+            queue = self._queues[lane]
+            deadline = queue[0].enqueued_at + self.max_wait
+            while True:
+                batch, full = self._collect(queue)
+                remaining = deadline - time.monotonic()
+                if full or remaining <= 0:
+                    break
+                self._condition.wait(timeout=remaining)
+
+            taken = {id(pending) for pending in batch}
+            self._queues[lane] = deque(p for p in queue if id(p) not in taken)
+            self._virtual_time = self._passes[lane]
+            self._passes[lane] += len(batch) / max(self._policy(lane).weight, 1e-9)
+            self._update_depths()
+
+            # Callers that timed out cancelled their futures; skip those items
+            running = [p for p in batch if p.future.set_running_or_notify_cancel()]
+            running_ids = {id(p) for p in running}
+            for pending in batch:
+                if id(pending) not in running_ids:
+                    self._in_flight[pending.priority] -= 1
+            if len(running) < len(batch):
+                self._condition.notify_all()
+            return running
+
+    def _collect(self, queue: Deque[_Pending]):
+        # Oldest item first, then later items that share its key, in FIFO order
+        first = queue[0]
+        batch = [first]
+        total_cost = first.cost
+        for pending in list(queue)[1:]:
+            if pending.key != first.key:
+                continue
+            if len(batch) >= self.max_batch_size:
+                return batch, True
+            if self.max_batch_cost is not None and total_cost + pending.cost > self.max_batch_cost:
+                return batch, True
+            batch.append(pending)
+            total_cost += pending.cost
+        return batch, len(batch) >= self.max_batch_size
+
+    def _update_depths(self) -> None:
+        self.stats.lane_depths = {p.value: len(q) for p, q in self._queues.items()}
+        self.stats.queue_depth = sum(self.stats.lane_depths.values())
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+
+    def _run(self, batch: List[_Pending]) -> None:
+        if not batch:
+            return
+        started = time.monotonic()
+        try:
+            self.stats.requests += len(batch)
+            self.stats.batches += 1
+            self.stats.batch_sizes[len(batch)] = self.stats.batch_sizes.get(len(batch), 0) + 1
+            lane = batch[0].priority.value
+            self.stats.lane_requests[lane] = self.stats.lane_requests.get(lane, 0) + len(batch)
+            for pending in batch:
+                delay = started - pending.enqueued_at
+                self.stats.total_queue_delay += delay
+                self.stats.max_queue_delay = max(self.stats.max_queue_delay, delay)
+                self.stats.recent_delays.append(delay)
+
+            results = self.run_batch([pending.item for pending in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"{self.name} batch returned {len(results)} results for {len(batch)} calls"
+                )
+
+            # Cost per second feeds the admission estimate
+            elapsed = time.monotonic() - started
+            if elapsed > 0:
+                rate = sum(pending.cost for pending in batch) / elapsed
+                previous = self.stats.throughput
+                self.stats.throughput = rate if previous is None else 0.8 * previous + 0.2 * rate
+
+            for pending, result in zip(batch, results):
+                pending.future.set_result(result)
+        except Exception as e:
+            self._fail(batch, e)
+        finally:
+            with self._condition:
+                for pending in batch:
+                    self._in_flight[pending.priority] -= 1
+                self._condition.notify_all()
+
+    @staticmethod
+    def _fail(batch: List[_Pending], error: BaseException) -> None:
+        for pending in batch:
+            if not pending.future.done():
+                pending.future.set_exception(error)
@@ -0,0 +1,71 @@
+# infrastructure/scheduling/priority.py
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+from application.interfaces.event_dispatcher import EventPriority
+
+# Traffic classes mapped onto the existing priority levels. CRITICAL is
+# reserved for internal work such as warm-up and is never rejected.
+LANES = {
+    "interactive": EventPriority.HIGH,
+    "batch": EventPriority.NORMAL,
+    "background": EventPriority.LOW,
+}
+
+_current_priority: ContextVar[EventPriority] = ContextVar(
+    "request_priority", default=EventPriority.HIGH
+)
+
+
+def current_priority() -> EventPriority:
+    return _current_priority.get()
+
+
+@contextmanager
+def priority_scope(priority: EventPriority) -> Iterator[None]:
+    """Run model calls made inside the block in the given lane."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def parse_priority(value: Optional[str]) -> Optional[EventPriority]:
+    """
+    Accept a client-facing lane name ("interactive") or its priority value
+    ("high"). Anything else, CRITICAL included, returns None so callers
+    fall back to their default lane.
+    """
+    if not value:
+        return None
+    value = value.strip().lower()
+    if value in LANES:
+        return LANES[value]
+    try:
+        priority = EventPriority(value)
+    except ValueError:
+        return None
+    return priority if priority in LANES.values() else None
+
+
+@dataclass(frozen=True)
+class LanePolicy:
+    weight: float = 1.0
+    max_in_flight: Optional[int] = None
+    slo_seconds: Optional[float] = None
+    overload: str = "defer"
+
+
+def lane_policies(config) -> Dict[EventPriority, LanePolicy]:
+    """Build one LanePolicy per priority from a SchedulerConfig."""
+    return {
+        priority: LanePolicy(
+            weight=config.lane_weights.get(priority.value, 1.0),
+            max_in_flight=config.lane_max_in_flight.get(priority.value),
+            slo_seconds=config.lane_slo_seconds.get(priority.value),
+            overload=config.lane_overload.get(priority.value, "defer")
+        )
+        for priority in EventPriority
+    }
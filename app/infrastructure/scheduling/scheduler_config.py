@@ -0,0 +1,30 @@
+# infrastructure/scheduling/scheduler_config.py
+from typing import Dict, Optional
+from pydantic import BaseSettings, Field
+
+class SchedulerConfig(BaseSettings):
+    max_wait_ms: float = 5.0
+    max_batch_size: int = 16
+    max_batch_tokens: Optional[int] = 8192
+    delay_window: int = 1000
+    # Longest a blocking call waits for its batch result
+    result_timeout_seconds: Optional[float] = 600.0
+
+    # Per-lane settings, keyed by EventPriority value
+    lane_weights: Dict[str, float] = Field(
+        default_factory=lambda: {"critical": 16.0, "high": 8.0, "normal": 3.0, "low": 1.0}
+    )
+    lane_max_in_flight: Dict[str, int] = Field(
+        default_factory=lambda: {"critical": 1024, "high": 64, "normal": 256, "low": 256}
+    )
+    lane_slo_seconds: Dict[str, Optional[float]] = Field(
+        default_factory=lambda: {"critical": None, "high": 2.0, "normal": 60.0, "low": 600.0}
+    )
+    # "reject" fails fast when a request would miss its SLO; "defer" waits for room
+    lane_overload: Dict[str, str] = Field(
+        default_factory=lambda: {"critical": "defer", "high": "reject", "normal": "defer", "low": "defer"}
+    )
+    defer_timeout_seconds: float = 300.0
+
+    class Config:
+        env_prefix = "SCHEDULER_"
@@ -1,11 +1,18 @@
+import time
+
+# Measured before anything else is imported, for the --timings report
+_START_TIME = time.perf_counter()
+
 import argparse
 import json
+import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import asdict
 
-from infrastructure.external.llm.instruct_model import InstructModel
-from infrastructure.external.embeddings.embedder_model import EmbedderModel
+# Model adapters are imported by the container's factories, so commands that
+# never touch a model never import torch or transformers
+from infrastructure.container import ServiceContainer, build_container
 
 from application.use_cases.generation.generate_text_use_case import (
     GenerateTextUseCase,
@@ -28,6 +35,7 @@ from application.use_cases.benchmark.run_benchmark_use_case import (
     RunBenchmarkRequest,
 )
 
+from domain.model.entities.generation import GeneratedResult
 from domain.model.entities.parsing import (
     ParseRule,
     ParseMode,
@@ -39,9 +47,8 @@ from domain.model.entities.verification import (
     VerificationMethodType,
     VerificationMode,
 )
-from domain.services.parse_service import ParseService
-from domain.services.verifier_service import VerifierService
-from domain.services.metrics_service import MetricsService
+
+_IMPORTS_DONE = time.perf_counter()
 
 def load_json_file(file_path: str) -> Dict[str, Any]:
     with open(file_path, "r", encoding="utf-8") as f:
@@ -52,16 +59,58 @@ def save_json_file(data: Dict[str, Any], file_path: str):
     with open(file_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
+def startup_report(
+    setup_done: float,
+    command_done: float,
+    container: ServiceContainer
+) -> Dict[str, Any]:
+    # Model load time is spent inside the command, on first use of the port
+    return {
+        "imports": _IMPORTS_DONE - _START_TIME,
+        "setup": setup_done - _IMPORTS_DONE,
+        "command": command_done - setup_done,
+        "llm_load": container.llm.loader.load_time,
+        "embeddings_load": container.embedder.loader.load_time,
+        "models": container.get_load_stats(),
+        "total": command_done - _START_TIME,
+        "torch_imported": "torch" in sys.modules
+    }
+
+
+def stream_generation(
+    use_case: GenerateTextUseCase, request: GenerateTextRequest
+) -> List[GeneratedResult]:
+    results = []
+    current = None
+    for chunk in use_case.execute_stream(request):
+        if chunk.is_final:
+            results.append(chunk.result)
+            continue
+        # Label output whenever it switches to another sequence
+        if request.num_sequences > 1 and chunk.sequence_index != current:
+            print(f"\n[{chunk.sequence_index}] ", end="")
+        current = chunk.sequence_index
+        print(chunk.text, end="", flush=True)
+    print()
+    return results
+
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Text Processing Pipeline")
 
     # Global arguments
+    parser.add_argument(
+        "--timings", action="store_true", help="Print a startup time breakdown to stderr"
+    )
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Generate command
     gen_parser = subparsers.add_parser("generate", help="Generate text")
     gen_parser.add_argument("--system-prompt", required=True, help="System prompt")
-    gen_parser.add_argument("--user-prompt", required=True, help="User prompt")
+    user_prompt_group = gen_parser.add_mutually_exclusive_group(required=True)
+    user_prompt_group.add_argument("--user-prompt", help="User prompt")
+    user_prompt_group.add_argument(
+        "--user-prompts", help="JSON file containing a list of user prompts to generate in batch"
+    )
     gen_parser.add_argument(
         "--num-sequences", type=int, default=1, help="Number of sequences to generate"
     )
@@ -71,6 +120,15 @@ def create_parser() -> argparse.ArgumentParser:
     gen_parser.add_argument(
         "--temperature", type=float, default=1.0, help="Generation temperature"
     )
+    gen_parser.add_argument(
+        "--stop", action="append", default=None, help="Stop sequence (repeatable)"
+    )
+    gen_parser.add_argument(
+        "--stream", action="store_true", help="Print text as it is generated"
+    )
+    gen_parser.add_argument(
+        "--seed", type=int, default=None, help="Random seed; seeded requests are cached"
+    )
 
     # Parse command
     parse_parser = subparsers.add_parser("parse", help="Parse text")
@@ -91,6 +149,12 @@ def create_parser() -> argparse.ArgumentParser:
     verify_parser.add_argument(
         "--required-review", type=int, required=True, help="Required reviews"
     )
+    verify_parser.add_argument(
+        "--plan", action="store_true", help="Reorder methods by cost and stop once decided"
+    )
+    verify_parser.add_argument(
+        "--workers", type=int, default=None, help="Run methods concurrently on this many threads"
+    )
 
     # Pipeline command
     pipeline_parser = subparsers.add_parser("pipeline", help="Execute pipeline")
@@ -109,6 +173,23 @@ def create_parser() -> argparse.ArgumentParser:
     benchmark_parser.add_argument(
         "--entries", required=True, help="JSON file containing benchmark entries"
     )
+    benchmark_parser.add_argument(
+        "--plan", action="store_true", help="Reorder methods by cost and stop once decided"
+    )
+
+    # Serve command
+    serve_parser = subparsers.add_parser("serve", help="Run the HTTP API with models kept warm")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    serve_parser.add_argument("--port", type=int, default=8000, help="Bind port")
+    serve_parser.add_argument(
+        "--no-warmup", action="store_true", help="Load models on first request instead of at startup"
+    )
+    serve_parser.add_argument(
+        "--plan", action="store_true", help="Reorder methods by cost and stop once decided"
+    )
+    serve_parser.add_argument(
+        "--workers", type=int, default=None, help="Run verification methods on this many threads"
+    )
 
     return parser
 
@@ -120,36 +201,63 @@ def main():
     if not args.command:
         parser.print_help()
         return
+    if getattr(args, "stream", False) and args.user_prompts:
+        parser.error("--stream cannot be combined with --user-prompts")
 
-    # Initialize services
-    llm = InstructModel()
-    embedder = EmbedderModel()
+    # Initialize services; models load when a use case first calls the port
+    container = build_container(
+        plan=getattr(args, "plan", False),
+        workers=getattr(args, "workers", None),
+        batching=args.command == "serve"
+    )
+    generate_use_case = container.generate_use_case
+    parse_use_case = container.parse_use_case
+    verify_use_case = container.verify_use_case
+    pipeline_use_case = container.pipeline_use_case
+    benchmark_use_case = container.benchmark_use_case
+    setup_done = time.perf_counter()
 
-    parse_service = ParseService()
-    verifier_service = VerifierService(embedder, llm)
-    metrics_service = MetricsService()
+    if args.command == "serve":
+        # One process keeps one copy of each model; requests share it
+        import uvicorn
+        from infrastructure.api.server import create_app
 
-    # Initialize use cases
-    generate_use_case = GenerateTextUseCase(llm)
-    parse_use_case = ParseGeneratedOutputUseCase(parse_service)
-    verify_use_case = VerifyTextUseCase(verifier_service)
-    pipeline_use_case = ExecutePipelineUseCase(
-        generate_use_case, parse_use_case, verify_use_case
-    )
-    benchmark_use_case = RunBenchmarkUseCase(verifier_service, metrics_service)
+        app = create_app(container, warmup=not args.no_warmup)
+        uvicorn.run(app, host=args.host, port=args.port, workers=1)
+        return
 
     try:
         result = None
 
-        if args.command == "generate":
+        if args.command == "generate" and args.user_prompts:
+            requests = [
+                GenerateTextRequest(
+                    system_prompt=args.system_prompt,
+                    user_prompt=user_prompt,
+                    num_sequences=args.num_sequences,
+                    max_tokens=args.max_tokens,
+                    temperature=args.temperature,
+                    stop_sequences=args.stop,
+                    seed=args.seed,
+                )
+                for user_prompt in load_json_file(args.user_prompts)
+            ]
+            result = generate_use_case.execute_batch(requests)
+
+        elif args.command == "generate":
             request = GenerateTextRequest(
                 system_prompt=args.system_prompt,
                 user_prompt=args.user_prompt,
                 num_sequences=args.num_sequences,
                 max_tokens=args.max_tokens,
                 temperature=args.temperature,
+                stop_sequences=args.stop,
+                seed=args.seed,
             )
-            result = generate_use_case.execute(request)
+            if args.stream:
+                result = stream_generation(generate_use_case, request)
+            else:
+                result = generate_use_case.execute(request)
 
         elif args.command == "parse":
             rules_data = load_json_file(args.rules)
@@ -183,6 +291,10 @@ def main():
         if result:
             print(result)
 
+        if args.timings:
+            report = startup_report(setup_done, time.perf_counter(), container)
+            print(json.dumps(report, indent=2), file=sys.stderr)
+
     except Exception as e:
         raise e
 
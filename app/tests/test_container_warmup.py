@@ -0,0 +1,38 @@
+# tests/test_container_warmup.py
+from application.interfaces.event_dispatcher import EventPriority
+from domain.services.verifier_service import CONSENSUS_SYSTEM_PROMPT
+from infrastructure import container as container_module
+from infrastructure.scheduling.priority import priority_scope
+
+
+class FakeLLM:
+    def __init__(self):
+        self.scored = []
+
+    def next_token_probabilities(self, prompts, choices):
+        self.scored.extend(prompts)
+        return [{choice: 1.0 / len(choices) for choice in choices} for _ in prompts]
+
+    def get_token_count(self, text):
+        return len(text.split())
+
+
+class FakeEmbeddings:
+    def get_embeddings(self, texts):
+        return [[1.0, 0.0] for _ in texts]
+
+
+def test_warm_up_runs_through_the_critical_lane(monkeypatch):
+    llm = FakeLLM()
+    monkeypatch.setattr(container_module, "build_llm", lambda: llm)
+    monkeypatch.setattr(container_module, "build_embeddings", FakeEmbeddings)
+    container = container_module.build_container(batching=True)
+
+    with priority_scope(EventPriority.CRITICAL):
+        container.warm_up()
+
+    assert container.models_loaded
+    stats = container.get_scheduler_stats()
+    assert stats["llm"]["lane_requests"] == {"critical": 1}
+    assert stats["embeddings"]["lane_requests"] == {"critical": 1}
+    assert llm.scored[0][0] == CONSENSUS_SYSTEM_PROMPT
@@ -0,0 +1,125 @@
+# tests/test_draft_assistant.py
+import threading
+from types import SimpleNamespace
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from infrastructure.external.llm import draft_assistant
+from infrastructure.external.llm.draft_assistant import DraftAssistant
+from infrastructure.external.llm.instruct_model import InstructModel
+from infrastructure.external.llm.llm_config import LLMConfig
+from infrastructure.external.loading.model_loader import LoadStats
+
+VOCAB = {"<eos>": 0, "a": 1, "b": 2}
+
+
+class FakeTokenizer:
+    eos_token_id = 0
+
+    def __init__(self, vocab=VOCAB):
+        self.vocab = vocab
+
+    def get_vocab(self):
+        return dict(self.vocab)
+
+
+class TinyModel(torch.nn.Module):
+    """
+    One linear layer whose generate() makes `steps` forwards of its own,
+    plus `num_assistant_tokens` draft forwards per step when assisted.
+    """
+
+    def __init__(self, steps=2):
+        super().__init__()
+        self.linear = torch.nn.Linear(2, 2)
+        self.generation_config = SimpleNamespace()
+        self.steps = steps
+        self.calls = []
+
+    def forward(self, *args, **kwargs):
+        return self.linear(torch.zeros(1, 2))
+
+    def generate(self, input_ids, attention_mask=None, max_new_tokens=1, num_return_sequences=1, **kwargs):
+        self.calls.append(kwargs)
+        assistant = kwargs.get("assistant_model")
+        for _ in range(self.steps):
+            if assistant is not None:
+                for _ in range(assistant.generation_config.num_assistant_tokens):
+                    assistant()
+            self()
+        prompts = input_ids.repeat_interleave(num_return_sequences, dim=0)
+        return torch.cat([prompts, torch.ones(len(prompts), max_new_tokens, dtype=torch.long)], dim=1)
+
+
+def make_draft(monkeypatch, target, vocab=VOCAB, lookahead=3):
+    draft_model = TinyModel()
+    monkeypatch.setattr(
+        draft_assistant, "AutoTokenizer", SimpleNamespace(from_pretrained=lambda name: FakeTokenizer(vocab))
+    )
+    monkeypatch.setattr(
+        draft_assistant, "load_pretrained", lambda model_class, name, device, config: (draft_model, LoadStats())
+    )
+    config = LLMConfig(precision="fp32", draft_lookahead=lookahead)
+    return DraftAssistant("tiny-draft", target, FakeTokenizer(), "cpu", config)
+
+
+def make_llm(target, draft):
+    llm = InstructModel.__new__(InstructModel)
+    llm.model, llm.tokenizer, llm.draft = target, FakeTokenizer(), draft
+    return llm
+
+
+def prompt():
+    return {"input_ids": torch.tensor([[1, 2, 1]]), "attention_mask": torch.ones(1, 3, dtype=torch.long)}
+
+
+def test_mismatched_vocabulary_disables_the_draft(monkeypatch):
+    target = TinyModel()
+    draft = make_draft(monkeypatch, target, vocab={"<eos>": 0, "x": 1})
+    assert not draft.available
+    assert draft.disabled_reason == "tokenizer mismatch"
+
+    llm = make_llm(target, draft)
+    assert not llm._assists(1, 0.0)
+    _, token_counts, _ = llm._generate_ids(prompt(), 1, 4, 0.0, None)
+
+    assert token_counts == [4]
+    assert "assistant_model" not in target.calls[-1]
+    assert draft.stats.plain_calls == 1
+    assert draft.stats.assisted_calls == 0
+
+
+def test_only_single_sequence_or_greedy_calls_use_the_draft(monkeypatch):
+    target = TinyModel()
+    llm = make_llm(target, make_draft(monkeypatch, target))
+
+    assert llm._assists(1, 1.0)
+    assert llm._assists(3, 0.0)
+    assert not llm._assists(3, 1.0)
+
+    llm._generate_ids(prompt(), 1, 4, 0.0, None)
+    assert target.calls[-1]["assistant_model"] is llm.draft.model
+    llm._generate_ids(prompt(), 3, 4, 1.0, None)
+    assert "assistant_model" not in target.calls[-1]
+
+
+def test_acceptance_counts_ignore_forwards_outside_assisted_generate(monkeypatch):
+    target = TinyModel(steps=2)
+    llm = make_llm(target, make_draft(monkeypatch, target, lookahead=3))
+
+    # Scoring passes and plain generates on the shared target are not counted
+    target()
+    llm._generate_ids(prompt(), 3, 4, 1.0, None)
+    llm._generate_ids(prompt(), 1, 4, 0.0, None)
+
+    assert llm.draft.stats.draft_tokens == 6
+    assert llm.draft.stats.verify_steps == 2
+
+    # Nor are forwards another thread makes while an assisted call is running
+    with llm.draft.tracking() as counts:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    assert counts == {"draft": 0, "target": 0}
@@ -0,0 +1,52 @@
+# tests/test_embedder_model.py
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from infrastructure.external.embeddings.embedder_model import EmbedderModel
+
+
+def make_model(vectors):
+    # Skip weight loading; embeddings for each text come from `vectors`
+    model = EmbedderModel.__new__(EmbedderModel)
+    model._get_embeddings = lambda texts: torch.nn.functional.normalize(
+        torch.tensor([vectors[text] for text in texts], dtype=torch.float32), dim=1
+    )
+    return model
+
+
+VECTORS = {
+    "a": [1.0, 0.0, 0.0],
+    "b": [0.0, 1.0, 0.0],
+    "c": [0.0, 0.0, 1.0],
+    "ab": [1.0, 1.0, 0.0],
+}
+
+
+def test_reference_similarities_all_references():
+    model = make_model(VECTORS)
+    references = model._get_embeddings(["a", "b", "c"])
+
+    scores = model.reference_similarities(references, ["ab"])
+
+    assert len(scores) == 1
+    assert scores[0] == pytest.approx([0.7071, 0.7071, 0.0], abs=1e-4)
+
+
+def test_reference_similarities_top_k_is_sorted_and_capped():
+    model = make_model(VECTORS)
+    references = model._get_embeddings(["c", "a", "b"])
+
+    assert model.reference_similarities(references, ["a"], top_k=2) == pytest.approx([[1.0, 0.0]])
+    # top_k larger than the reference set returns every score
+    assert len(model.reference_similarities(references, ["a"], top_k=10)[0]) == 3
+
+
+def test_reference_similarities_keyword_top_k_matches_port():
+    model = make_model(VECTORS)
+    references = model._get_embeddings(["a", "b"])
+
+    # VerifierService passes top_k by keyword
+    assert model.reference_similarities(references, ["b"], top_k=None) == pytest.approx([[0.0, 1.0]])
+    assert model.reference_similarities(references, []) == []
@@ -0,0 +1,31 @@
+# tests/test_indexed_embeddings.py
+import zlib
+import numpy as np
+from infrastructure.external.embeddings.embeddings_config import EmbeddingsConfig
+from infrastructure.external.embeddings.indexed_embeddings import IndexedEmbeddings
+from infrastructure.external.embeddings.ivf_index import IVFIndex
+
+
+class RandomEmbeddings:
+    """A fixed random unit vector per text."""
+
+    def __init__(self, dim=16):
+        self.dim = dim
+
+    def get_embeddings(self, texts):
+        return [np.random.default_rng(zlib.crc32(text.encode("utf-8"))).standard_normal(self.dim) for text in texts]
+
+
+def test_duplicate_heavy_index_returns_scores_for_every_query():
+    rng = np.random.default_rng(0)
+    distinct = rng.standard_normal((3, 16)).astype(np.float32)
+    # Three distinct vectors leave most inverted lists empty
+    references = IVFIndex.build(np.repeat(distinct, 400, axis=0), nprobe=4)
+    indexed = IndexedEmbeddings(RandomEmbeddings(), EmbeddingsConfig())
+
+    texts = [f"query {i}" for i in range(50)]
+    rows = indexed.reference_similarities(references, texts, top_k=5)
+
+    assert len(rows) == len(texts)
+    assert all(len(row) == 5 for row in rows)
+    assert all(-1.0 <= score <= 1.0 for row in rows for score in row)
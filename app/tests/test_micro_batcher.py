@@ -0,0 +1,130 @@
+# tests/test_micro_batcher.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import pytest
+from infrastructure.scheduling.micro_batcher import MicroBatcher
+from infrastructure.scheduling.batching_llm import BatchingLLM
+from infrastructure.scheduling.batching_embeddings import BatchingEmbeddings
+from infrastructure.scheduling.scheduler_config import SchedulerConfig
+
+
+class CountingLLM:
+    """Records how many forwards run at the same time."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def _forward(self):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+
+    def get_token_count(self, text):
+        return len(text.split())
+
+    def generate_batch(self, prompts, num_sequences=1, max_tokens=100, temperature=1.0,
+                       stop_sequences=None, seed=None):
+        self._forward()
+        return [[f"{user}/{len(prompts)}"] for _, user in prompts]
+
+    def next_token_probabilities(self, prompts, choices):
+        self._forward()
+        return [{"yes": 1.0} for _ in prompts]
+
+
+class CountingEmbeddings(CountingLLM):
+    def get_embeddings(self, texts):
+        self._forward()
+        return [[float(len(text))] for text in texts]
+
+    def reference_similarities(self, references, texts, top_k=None):
+        self._forward()
+        return [[1.0] for _ in texts]
+
+    def prepare_references(self, reference_texts):
+        self._forward()
+        return list(reference_texts)
+
+
+def test_wrong_result_length_fails_every_caller_and_worker_survives():
+    batcher = MicroBatcher("t", lambda items: items[:-1], max_batch_size=4, max_wait=0.02)
+    futures = [batcher.submit(i) for i in range(3)]
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=2)
+
+    batcher.run_batch = lambda items: items
+    assert batcher.submit(7).result(timeout=2) == 7
+
+
+def test_run_batch_error_reaches_the_caller():
+    def fail(items):
+        raise ValueError("boom")
+
+    batcher = MicroBatcher("t", fail, max_wait=0.0, result_timeout=2)
+    with pytest.raises(ValueError):
+        batcher(1)
+
+
+def test_call_times_out_and_cancelled_items_are_skipped():
+    release = threading.Event()
+    ran = []
+
+    def slow(items):
+        release.wait(2)
+        ran.extend(items)
+        return items
+
+    batcher = MicroBatcher("t", slow, max_batch_size=1, max_wait=0.0, result_timeout=0.05)
+    first = batcher.submit("first")
+    with pytest.raises(FutureTimeoutError):
+        batcher("second")
+    release.set()
+    assert first.result(timeout=2) == "first"
+    assert batcher.submit("third").result(timeout=2) == "third"
+    assert "second" not in ran
+
+
+def test_llm_calls_share_one_worker():
+    llm = CountingLLM()
+    batching = BatchingLLM(llm, SchedulerConfig(max_wait_ms=5))
+    with ThreadPoolExecutor(8) as executor:
+        jobs = [executor.submit(batching.generate, "s", f"u{i}", max_tokens=4) for i in range(8)]
+        jobs += [
+            executor.submit(batching.next_token_probabilities, [("s", "q")], {"yes": ["yes"]})
+            for _ in range(8)
+        ]
+        for job in jobs:
+            job.result(timeout=5)
+    assert llm.max_active == 1
+    assert list(batching.get_scheduler_stats()) == ["llm"]
+
+
+def test_embedding_calls_share_one_worker():
+    embeddings = CountingEmbeddings()
+    batching = BatchingEmbeddings(embeddings, SchedulerConfig(max_wait_ms=5))
+    with ThreadPoolExecutor(8) as executor:
+        references = batching.prepare_references(["r1", "r2"])
+        jobs = [executor.submit(batching.get_embedding, "x" * i) for i in range(8)]
+        jobs += [executor.submit(batching.reference_similarities, references, ["a"]) for _ in range(8)]
+        jobs += [executor.submit(batching.prepare_references, ["r"]) for _ in range(4)]
+        results = [job.result(timeout=5) for job in jobs]
+    assert embeddings.max_active == 1
+    assert results[3] == [3.0]
+
+
+def test_generate_batch_is_queued_and_merged_with_generate():
+    llm = CountingLLM()
+    batching = BatchingLLM(llm, SchedulerConfig(max_wait_ms=20))
+    with ThreadPoolExecutor(4) as executor:
+        single = executor.submit(batching.generate, "s", "a", max_tokens=4)
+        many = executor.submit(batching.generate_batch, [("s", "b"), ("s", "c")], max_tokens=4)
+        assert single.result(timeout=5) == ["a/3"]
+        assert many.result(timeout=5) == [["b/3"], ["c/3"]]
+    assert batching.get_scheduler_stats()["llm"]["requests"] == 2
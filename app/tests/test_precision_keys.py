@@ -0,0 +1,42 @@
+# tests/test_precision_keys.py
+from infrastructure.external.embeddings.cached_embeddings import CachedEmbeddings
+from infrastructure.external.embeddings.embeddings_config import EmbeddingsConfig
+from infrastructure.external.embeddings.indexed_embeddings import IndexedEmbeddings
+from infrastructure.external.llm.cached_llm import CachedLLM
+from infrastructure.external.llm.llm_config import LLMConfig
+
+
+class FakeAdapter:
+    def __init__(self, applied):
+        self.applied = applied
+
+    def get_precision_stats(self):
+        return {"requested": "int8", "applied": self.applied}
+
+
+def test_embedding_keys_depend_on_applied_precision():
+    config = EmbeddingsConfig(precision="int8")
+    fp32 = CachedEmbeddings(FakeAdapter("fp32"), config)
+    int8 = CachedEmbeddings(FakeAdapter("int8"), config)
+    assert fp32._key("text") != int8._key("text")
+    assert int8.precision == "int8"
+
+
+def test_index_directory_depends_on_applied_precision(tmp_path):
+    config = EmbeddingsConfig(precision="int8", ann_index_dir=str(tmp_path))
+    # The adapter is found under the cache decorator
+    fp32 = IndexedEmbeddings(CachedEmbeddings(FakeAdapter("fp32"), config), config)
+    int8 = IndexedEmbeddings(CachedEmbeddings(FakeAdapter("int8"), config), config)
+    assert fp32._index_directory(["a", "b"]) != int8._index_directory(["a", "b"])
+
+
+def test_generation_keys_depend_on_applied_precision():
+    config = LLMConfig(precision="int8")
+    fp32 = CachedLLM(FakeAdapter("fp32"), config)
+    int8 = CachedLLM(FakeAdapter("int8"), config)
+    args = ("system", "user", 1, 10, 0.0, None, None)
+    assert fp32._key(*args) != int8._key(*args)
+
+
+def test_precision_defaults_to_config_without_stats():
+    assert CachedLLM(object(), LLMConfig(precision="bf16")).precision == "bf16"
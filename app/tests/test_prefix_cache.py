@@ -0,0 +1,33 @@
+# tests/test_prefix_cache.py
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from infrastructure.external.llm.prefix_cache import PrefixKVCache
+
+
+def make_cache():
+    prefills = []
+
+    def prefill(token_ids):
+        prefills.append(tuple(token_ids))
+        return ((torch.zeros(1, 1, len(token_ids), 2), torch.zeros(1, 1, len(token_ids), 2)),)
+
+    return PrefixKVCache(max_bytes=1 << 20, prefill=prefill), prefills
+
+
+def test_prefix_is_admitted_on_second_sighting():
+    cache, prefills = make_cache()
+    prefix = (1, 2, 3)
+
+    assert not cache.admits(prefix)
+    assert cache.admits(prefix)
+    cache.fetch(prefix)
+    assert cache.admits(prefix)
+    assert prefills == [prefix]
+    assert cache.get_stats()["first_sightings"] == 1
+
+
+def test_prefix_shared_within_a_call_is_admitted_at_once():
+    cache, _ = make_cache()
+    assert cache.admits((4, 5), rows=2)
@@ -0,0 +1,33 @@
+# tests/test_priority.py
+import pytest
+from application.interfaces.event_dispatcher import EventPriority
+from infrastructure.scheduling.admission import AdmissionRejected
+from infrastructure.scheduling.micro_batcher import MicroBatcher
+from infrastructure.scheduling.priority import LanePolicy, parse_priority
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("interactive", EventPriority.HIGH),
+    ("Batch", EventPriority.NORMAL),
+    ("background", EventPriority.LOW),
+    ("high", EventPriority.HIGH),
+    ("low", EventPriority.LOW),
+])
+def test_parse_priority_accepts_client_lanes(value, expected):
+    assert parse_priority(value) == expected
+
+
+@pytest.mark.parametrize("value", ["critical", "CRITICAL", "urgent", "", None])
+def test_parse_priority_rejects_internal_and_unknown_lanes(value):
+    assert parse_priority(value) is None
+
+
+def test_admitted_counts_against_the_lane_limit():
+    batcher = MicroBatcher(
+        "t", lambda items: items,
+        lanes={EventPriority.HIGH: LanePolicy(max_in_flight=1, overload="reject")}
+    )
+    with batcher.admitted(10, EventPriority.HIGH):
+        with pytest.raises(AdmissionRejected):
+            batcher.submit(1, EventPriority.HIGH)
+    assert batcher.submit(1, EventPriority.HIGH).result(timeout=2) == 1
@@ -0,0 +1,104 @@
+# tests/test_server.py
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+from domain.model.entities.generation import GeneratedResult, GenerationMetadata
+from infrastructure import container as container_module
+from infrastructure.api.server import create_app
+
+
+class EchoLLM:
+    """Returns the user prompt upper-cased, one result per sequence."""
+
+    def _results(self, user_prompt, num_sequences):
+        metadata = GenerationMetadata(model_name="echo", tokens_used=len(user_prompt.split()), generation_time=0.0)
+        return [GeneratedResult(content=user_prompt.upper(), metadata=metadata) for _ in range(num_sequences)]
+
+    def generate(self, system_prompt, user_prompt, num_sequences=1, *args, **kwargs):
+        return self._results(user_prompt, num_sequences)
+
+    def generate_batch(self, prompts, num_sequences=1, *args, **kwargs):
+        return [self._results(user, num_sequences) for _, user in prompts]
+
+    def get_token_count(self, text):
+        return len(text.split())
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(container_module, "build_llm", EchoLLM)
+    return TestClient(create_app(container_module.build_container(), warmup=False))
+
+
+REGEX_METHOD = {"name": "has_year", "method_type": "regex", "mode": "cumulative", "pattern": r"\d{4}"}
+
+
+def test_verify_accepts_regex_pattern(client):
+    response = client.post("/verify", json={
+        "text": "Signed in 2024.",
+        "methods": [REGEX_METHOD],
+        "required_for_confirmed": 1,
+        "required_for_review": 0
+    })
+    assert response.status_code == 200
+    summary = response.json()["verification_summary"]
+    assert summary["results"][0]["passed"] is True
+    assert summary["final_status"] == "confirmada"
+
+
+def test_pipeline_runs_configured_stages(client):
+    response = client.post("/pipeline", json={
+        "config": {
+            "stages": [
+                {"stage_type": "generate", "parameters": {"system_prompt": "Repeat.", "max_tokens": 8}},
+                {"stage_type": "generate", "parameters": {"system_prompt": "Repeat.", "user_prompt": "again"}}
+            ]
+        },
+        "initial_input": ["first text", "second text"]
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["stages_completed"] == 2
+    fan_out = body["pipeline_result"]["stages_results"][0]["output_data"]
+    assert [r["generated_texts"][0]["content"] for r in fan_out] == ["FIRST TEXT", "SECOND TEXT"]
+
+
+def test_pipeline_validates_stage_methods(client):
+    response = client.post("/pipeline", json={
+        "config": {"stages": [{"stage_type": "verify", "parameters": {"methods": [{"name": "m"}]}}]},
+        "initial_input": "text"
+    })
+    assert response.status_code == 422
+
+
+def test_benchmark_runs_verification_methods(client):
+    response = client.post("/benchmark", json={
+        "configuration": {
+            "name": "years",
+            "description": "Texts that mention a year",
+            "verification_methods": [REGEX_METHOD],
+            "required_success_rate": 0.5,
+            "max_verification_time": 10.0
+        },
+        "entries": [
+            {"input_text": "Founded in 1999.", "expected_status": "confirmada"},
+            {"input_text": "No date here.", "expected_status": "descartada"}
+        ]
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_entries"] == 2
+    assert body["successful_entries"] + body["failed_entries"] == 2
+
+
+def test_pipeline_verifies_a_list_in_one_batch(client):
+    response = client.post("/pipeline", json={
+        "config": {"stages": [{"stage_type": "verify", "parameters": {"methods": [REGEX_METHOD]}}]},
+        "initial_input": ["in 2020", "never"]
+    })
+    assert response.status_code == 200
+    stage = response.json()["pipeline_result"]["stages_results"][0]
+    assert stage["metadata"]["batch_size"] == 2
+    assert [r["verification_summary"]["final_status"] for r in stage["output_data"]] == ["confirmada", "a revisar"]
@@ -0,0 +1,38 @@
+# tests/test_similarity_aggregation.py
+import pydantic
+import pytest
+from application.dto.requests.verify_text_request import VerificationMethodRequest
+from domain.model.entities.verification import (
+    SimilarityAggregation, VerificationMethod, VerificationMethodType, VerificationMode, VerificationThresholds
+)
+from domain.services.verifier_service import VerifierService
+from tests.test_verify_batch import KeywordEmbeddings
+
+
+def top_k_mean(top_k):
+    return VerificationMethod(
+        name="about_cats", method_type=VerificationMethodType.EMBEDDING,
+        mode=VerificationMode.CUMULATIVE, reference_texts=["a cat", "the cat", "cats"],
+        thresholds=VerificationThresholds(lower_bound=0.5, upper_bound=1.0),
+        aggregation=SimilarityAggregation.TOP_K_MEAN, top_k=top_k
+    )
+
+
+def test_top_k_mean_without_top_k_is_rejected():
+    verifier = VerifierService(KeywordEmbeddings(), None)
+    with pytest.raises(ValueError, match="requires top_k"):
+        verifier.verify_text("a cat", [top_k_mean(None)], required_for_confirmed=1, required_for_review=0)
+
+
+def test_top_k_mean_averages_the_top_k_scores():
+    verifier = VerifierService(KeywordEmbeddings(), None)
+    summary = verifier.verify_text("a cat", [top_k_mean(2)], required_for_confirmed=1, required_for_review=0)
+    assert summary.results[0].score == pytest.approx(0.9)
+
+
+def test_request_requires_top_k_for_top_k_mean():
+    fields = {"name": "m", "method_type": "embedding", "mode": "cumulative", "aggregation": "top_k_mean"}
+    with pytest.raises(pydantic.ValidationError):
+        VerificationMethodRequest(**fields)
+    assert VerificationMethodRequest(**fields, top_k=3).top_k == 3
+    assert VerificationMethodRequest(**{**fields, "aggregation": "max"}).top_k is None
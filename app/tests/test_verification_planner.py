@@ -0,0 +1,45 @@
+# tests/test_verification_planner.py
+from domain.model.entities.verification import (
+    PreparedMethod, VerificationMethod, VerificationMethodType, VerificationMode
+)
+from domain.services.verification_planner import VerificationPlanner
+
+
+def check(method_type, **fields):
+    return VerificationMethod(name="check", method_type=method_type, mode=VerificationMode.CUMULATIVE, **fields)
+
+
+def test_same_named_methods_keep_separate_stats():
+    planner = VerificationPlanner()
+    regex = check(VerificationMethodType.REGEX, pattern=r"\d")
+    consensus = check(VerificationMethodType.CONSENSUS, required_matches=3)
+
+    planner.record(consensus, 2.0, False)
+    planner.record(regex, 0.001, True)
+
+    assert planner.expected_cost(regex) == 0.001
+    assert planner.expected_cost(consensus) == 2.0
+    assert len(planner.get_stats()) == 2
+
+
+def test_configuration_is_part_of_the_identity():
+    planner = VerificationPlanner()
+    digits = check(VerificationMethodType.REGEX, pattern=r"\d")
+    words = check(VerificationMethodType.REGEX, pattern=r"\w+")
+    planner.record(digits, 5.0, True)
+
+    assert planner.expected_cost(digits) == 5.0
+    assert planner.expected_cost(words) == planner.default_costs[VerificationMethodType.REGEX]
+    # An equal configuration built separately shares the measurements
+    assert planner.expected_cost(check(VerificationMethodType.REGEX, pattern=r"\d")) == 5.0
+
+
+def test_order_uses_per_identity_costs():
+    planner = VerificationPlanner()
+    slow = check(VerificationMethodType.REGEX, pattern="slow")
+    fast = check(VerificationMethodType.REGEX, pattern="fast")
+    planner.record(slow, 3.0, True)
+    planner.record(fast, 0.1, True)
+
+    ordered = planner.order([PreparedMethod(method=slow), PreparedMethod(method=fast)])
+    assert [p.method.pattern for p in ordered] == ["fast", "slow"]
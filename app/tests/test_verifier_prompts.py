@@ -0,0 +1,12 @@
+# tests/test_verifier_prompts.py
+from domain.services.verifier_service import CONSENSUS_SYSTEM_PROMPT, VerifierService
+
+
+def test_consensus_prompts_share_the_system_prompt():
+    verifier = VerifierService(None, None)
+    first = verifier._consensus_prompts("The sky is green.")
+    second = verifier._consensus_prompts("Water is wet.")
+
+    assert first[0] == second[0] == CONSENSUS_SYSTEM_PROMPT
+    assert "The sky is green." in first[1]
+    assert "The sky is green." not in first[0]
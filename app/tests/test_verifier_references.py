@@ -0,0 +1,53 @@
+# tests/test_verifier_references.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from domain.model.entities.verification import VerificationMethod, VerificationMethodType, VerificationMode
+from domain.services.verifier_service import VerifierService
+from infrastructure.cache.lru_cache import ByteBoundedLRUCache
+from infrastructure.container import _reference_bytes
+
+
+class CountingEmbeddings:
+    def __init__(self):
+        self.prepared = 0
+        self.lock = threading.Lock()
+
+    def prepare_references(self, reference_texts):
+        with self.lock:
+            self.prepared += 1
+        time.sleep(0.01)
+        return np.ones((len(reference_texts), 4), dtype=np.float32)
+
+
+def method(*references):
+    return VerificationMethod(
+        name="similar",
+        method_type=VerificationMethodType.EMBEDDING,
+        mode=VerificationMode.CUMULATIVE,
+        reference_texts=list(references)
+    )
+
+
+def test_concurrent_requests_prepare_a_reference_set_once():
+    embeddings = CountingEmbeddings()
+    cache = ByteBoundedLRUCache(max_bytes=1024, sizeof=_reference_bytes)
+    verifier = VerifierService(embeddings, None, reference_cache=cache)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: verifier.prepare_methods([method("a", "b")]), range(16)))
+    assert embeddings.prepared == 1
+
+
+def test_reference_cache_is_bounded_by_bytes():
+    embeddings = CountingEmbeddings()
+    # Room for two 2x4 float32 matrices
+    cache = ByteBoundedLRUCache(max_bytes=64, sizeof=_reference_bytes)
+    verifier = VerifierService(embeddings, None, reference_cache=cache)
+    for name in ("a", "b", "c"):
+        verifier.prepare_methods([method(name, name + "2")])
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+    verifier.prepare_methods([method("a", "a2")])
+    assert embeddings.prepared == 4
@@ -0,0 +1,69 @@
+# tests/test_verify_batch.py
+import pytest
+from domain.model.entities.verification import (
+    VerificationMethod, VerificationMethodType, VerificationMode, VerificationThresholds
+)
+from domain.services.verifier_service import VerifierService
+from application.use_cases.verification.verify_text_use_case import VerifyTextRequest, VerifyTextUseCase
+
+
+class KeywordEmbeddings:
+    """Similarity 0.9 when a text mentions "cat", otherwise 0.1."""
+
+    def prepare_references(self, reference_texts):
+        return list(reference_texts)
+
+    def reference_similarities(self, references, texts, top_k=None):
+        return [[0.9 if "cat" in text else 0.1 for _ in references][:top_k] for text in texts]
+
+
+METHODS = [
+    VerificationMethod(
+        name="has_digit", method_type=VerificationMethodType.REGEX,
+        mode=VerificationMode.ELIMINATORY, pattern=r"\d"
+    ),
+    VerificationMethod(
+        name="about_cats", method_type=VerificationMethodType.EMBEDDING,
+        mode=VerificationMode.CUMULATIVE, reference_texts=["a cat", "the cat"],
+        thresholds=VerificationThresholds(lower_bound=0.5, upper_bound=1.0)
+    ),
+    VerificationMethod(
+        name="has_word", method_type=VerificationMethodType.REGEX,
+        mode=VerificationMode.CUMULATIVE, pattern=r"[a-z]+"
+    ),
+]
+TEXTS = ["3 cats", "no digits here", "1 dog", "2 cats and 4 dogs"]
+
+
+@pytest.fixture
+def verifier():
+    return VerifierService(KeywordEmbeddings(), None)
+
+
+def test_verify_batch_matches_verify_text(verifier):
+    batch = verifier.verify_batch(TEXTS, METHODS, required_for_confirmed=2, required_for_review=1)
+    for text, summary in zip(TEXTS, batch):
+        single = verifier.verify_text(text, METHODS, required_for_confirmed=2, required_for_review=1)
+        assert summary.final_status == single.final_status
+        assert summary.skipped_methods == single.skipped_methods
+        assert [(r.method.name, r.passed, r.score) for r in summary.results] == \
+            [(r.method.name, r.passed, r.score) for r in single.results]
+        assert summary.method_times.keys() == single.method_times.keys()
+        assert summary.critical_path_time == pytest.approx(sum(summary.method_times.values()))
+        assert single.critical_path_time is not None
+
+
+def test_execute_batch_runs_one_verify_batch(verifier):
+    calls = []
+    verify_batch = verifier.verify_batch
+    verifier.verify_batch = lambda **kwargs: calls.append(kwargs) or verify_batch(**kwargs)
+    use_case = VerifyTextUseCase(verifier)
+
+    responses = use_case.execute_batch([
+        VerifyTextRequest(text=text, methods=METHODS, required_for_confirmed=2, required_for_review=1)
+        for text in TEXTS
+    ])
+    assert len(calls) == 1
+    assert [r.verification_summary.final_status for r in responses] == [
+        verifier.verify_text(text, METHODS, 2, 1).final_status for text in TEXTS
+    ]